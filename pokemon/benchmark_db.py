@@ -0,0 +1,120 @@
+"""Measure concurrent login and favorites write throughput against SQLite.
+
+Usage:
+    python benchmark_db.py [--threads N] [--ops N] [--users N]
+
+Runs the same workload twice on a fresh database file: once with the
+engine defaults and no pragmas, and once with the pooled engine and the
+SQLite tuning from ``Config``. Each thread alternates logins (one user
+lookup plus password check) with favorite writes and favorite reads.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from pokemon.app import create_app
+from pokemon.config import Config
+from pokemon.db import db
+from pokemon.models.favorites_model import SqlFavoritesModel
+from pokemon.models.pokemon_model import PokemonRecord
+from pokemon.models.user_model import Users
+
+
+def run(tuned: bool, threads: int, ops: int, users: int) -> Dict:
+    """Run the workload once on a fresh database.
+
+    Args:
+        tuned (bool): Use the configured pool and SQLite pragmas
+        threads (int): Number of concurrent workers
+        ops (int): Operations per worker
+        users (int): Number of accounts the workers log in as
+
+    Returns:
+        Dict: Operation count, error count, elapsed seconds and throughput
+    """
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+        PASSWORD_HASH_ITERATIONS = 1000
+        PASSWORD_HASH_WORKERS = 0
+        SQLITE_TUNING = tuned
+
+    if not tuned:
+        BenchConfig.SQLALCHEMY_ENGINE_OPTIONS = {}
+
+    app = create_app(BenchConfig)
+    model = SqlFavoritesModel()
+    with app.app_context():
+        Users.create_users([(f"trainer{n}", "pikachu123") for n in range(users)])
+
+    errors: List[str] = []
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        username = f"trainer{index % users}"
+        barrier.wait()
+        for op in range(ops):
+            with app.app_context():
+                try:
+                    if op % 3 == 0:
+                        Users.authenticate(username, "pikachu123")
+                    elif op % 3 == 1:
+                        pokemon_id = index * ops + op
+                        model.add_favorite(username, PokemonRecord(pokemon_id, f"pokemon-{pokemon_id}"))
+                    else:
+                        model.get_favorites(username)
+                except Exception as e:
+                    db.session.rollback()
+                    errors.append(str(e))
+                finally:
+                    db.session.remove()
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        db.engine.dispose()
+    total = threads * ops
+    return {
+        "ops": total,
+        "errors": len(errors),
+        "elapsed": elapsed,
+        "throughput": (total - len(errors)) / elapsed
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line and print both results.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, defaults to ``sys.argv``
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark concurrent database writes.")
+    parser.add_argument("--threads", type=int, default=16, help="concurrent workers (default: 16)")
+    parser.add_argument("--ops", type=int, default=150, help="operations per worker (default: 150)")
+    parser.add_argument("--users", type=int, default=16, help="accounts to log in as (default: 16)")
+    args = parser.parse_args(argv)
+
+    for label, tuned in (("default", False), ("tuned", True)):
+        result = run(tuned, args.threads, args.ops, args.users)
+        print(f"{label:>8}: {result['ops']} ops in {result['elapsed']:.2f}s, "
+              f"{result['throughput']:.0f} ops/s, {result['errors']} errors")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
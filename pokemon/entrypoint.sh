@@ -0,0 +1,14 @@
+#!/bin/bash
+set -e
+
+# Optionally prefetch the Pokedex into the persistent cache before serving.
+# Failures are logged but do not prevent the app from starting.
+if [ "${WARMUP_ON_START:-false}" = "true" ]; then
+    echo "Warming up Pokemon cache..."
+    python -m pokemon.warmup \
+        --workers "${WARMUP_WORKERS:-8}" \
+        ${WARMUP_RATE:+--rate "$WARMUP_RATE"} \
+        || echo "Warm-up finished with failures"
+fi
+
+exec python pokemon/app.py
@@ -1,6 +1,15 @@
 import requests
 import logging
-from typing import Dict, List, Optional, Union
+import random
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from pokemon.utils.api_utils import CircuitBreaker, CircuitOpenError, LatencyTracker, SingleFlight
+from pokemon.utils.search_utils import NameIndex
+from pokemon.utils.sql_utils import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -8,16 +17,84 @@ class PokemonAPI:
     """Wrapper for the PokeAPI (https://pokeapi.co/)"""
     
     BASE_URL = "https://pokeapi.co/api/v2"
+    CACHEABLE_PREFIXES = ("pokemon/", "pokemon-species/", "evolution-chain/")
+    LISTING_LIMIT = 100000
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
     
-    def __init__(self):
-        """Initialize the Pokemon API wrapper."""
+    def __init__(self, cache: Optional[ResponseCache] = None, revalidate_after: float = 86400,
+                 pool_maxsize: int = 10, timeout: Tuple[float, float] = (3.05, 10.0),
+                 retries: int = 2, backoff: float = 0.2, max_backoff: float = 2.0,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 hedge: bool = False, hedge_min_delay: float = 0.05):
+        """Initialize the Pokemon API wrapper.
+
+        Args:
+            cache (Optional[ResponseCache]): Persistent store for fetched responses
+            revalidate_after (float): Seconds a stored response is served before it
+                is revalidated with a conditional request
+            pool_maxsize (int): Maximum number of pooled connections to the API
+            timeout (Tuple[float, float]): Connect and read timeouts in seconds
+            retries (int): Retries after a connection error, timeout or retryable status
+            backoff (float): Base delay for the jittered exponential backoff between retries
+            max_backoff (float): Upper bound on a single backoff delay
+            circuit_breaker (Optional[CircuitBreaker]): Breaker guarding the API, a
+                default one is created if omitted
+            hedge (bool): Send a second request when the first one is slower than
+                the recent p95 latency
+            hedge_min_delay (float): Lower bound on the hedging delay in seconds
+        """
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+        self.cache = cache
+        self.revalidate_after = revalidate_after
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self._latencies = LatencyTracker()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._pool_maxsize = pool_maxsize
+        self._stats_lock = threading.Lock()
+        self._retried = 0
+        self._hedged = 0
+        self._stale_served = 0
+        self._single_flight = SingleFlight()
+        self._name_index: Optional[NameIndex] = None
+        self._name_index_lock = threading.Lock()
     
-    def _make_request(self, endpoint: str) -> Dict:
+    def _make_request(self, endpoint: str, revalidate: bool = False) -> Dict:
         """Make a request to the PokeAPI.
+
+        Concurrent requests for the same endpoint are coalesced so that only one
+        of them reaches the API; the others wait for and share its outcome.
+        
+        Args:
+            endpoint (str): The API endpoint to call
+            revalidate (bool): Check a stored response with the API even if it is
+                younger than ``revalidate_after``
+            
+        Returns:
+            Dict: The JSON response from the API
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        return self._single_flight.do((endpoint, revalidate), lambda: self._fetch(endpoint, revalidate))
+
+    def _fetch(self, endpoint: str, revalidate: bool = False) -> Dict:
+        """Fetch an endpoint from the persistent cache or the PokeAPI.
+
+        Stored responses younger than ``revalidate_after`` are served directly.
+        Older ones are revalidated with ``If-None-Match``/``If-Modified-Since``
+        and only downloaded again if the API reports a change. While the circuit
+        breaker is open, or if the API fails, a stored response is served stale.
         
         Args:
             endpoint (str): The API endpoint to call
+            revalidate (bool): Skip serving a stored response without checking it
             
         Returns:
             Dict: The JSON response from the API
@@ -25,46 +102,249 @@ class PokemonAPI:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
+        cacheable = self.cache is not None and endpoint.startswith(self.CACHEABLE_PREFIXES)
+        cached = self.cache.get(endpoint) if cacheable else None
+        if (cached is not None and not revalidate
+                and time.time() - cached.fetched_at < self.revalidate_after):
+            return cached.body
+
+        kwargs = {}
+        if cached is not None:
+            kwargs["headers"] = {}
+            if cached.etag:
+                kwargs["headers"]["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                kwargs["headers"]["If-Modified-Since"] = cached.last_modified
+
         try:
-            response = self.session.get(f"{self.BASE_URL}/{endpoint}")
+            if not self.circuit_breaker.allow():
+                raise CircuitOpenError(f"Circuit open, not calling {endpoint}")
+            response = self._get_with_retries(f"{self.BASE_URL}/{endpoint}", **kwargs)
+            if cached is not None and response.status_code == 304:
+                self.cache.touch(endpoint)
+                logger.debug(f"Revalidated {endpoint} from persistent cache")
+                return cached.body
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except requests.exceptions.RequestException as e:
+            if cached is not None:
+                with self._stats_lock:
+                    self._stale_served += 1
+                logger.warning(f"Serving stale {endpoint} from persistent cache: {str(e)}")
+                return cached.body
             logger.error(f"Error making request to {endpoint}: {str(e)}")
             raise
+
+        if cacheable:
+            for key in self._cache_keys(endpoint, data):
+                self.cache.put(
+                    key, data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified")
+                )
+        return data
+
+    @staticmethod
+    def _cache_keys(endpoint: str, data: Dict) -> List[str]:
+        """Get the persistent cache keys a response is stored under.
+
+        A Pokemon is stored under both its name and its ID, so fetching it by
+        either one serves later lookups by the other.
+
+        Args:
+            endpoint (str): The endpoint the response was fetched from
+            data (Dict): The decoded response
+
+        Returns:
+            List[str]: The endpoint, followed by any aliases
+        """
+        keys = [endpoint]
+        if endpoint.startswith("pokemon/") and isinstance(data, dict):
+            for alias in (data.get("name"), data.get("id")):
+                key = f"pokemon/{alias}"
+                if alias is not None and key not in keys:
+                    keys.append(key)
+        return keys
+
+    def _get_with_retries(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL, retrying connection errors, timeouts and retryable statuses.
+
+        The outcome is reported to the circuit breaker once retries are exhausted.
+
+        Args:
+            url (str): The URL to fetch
+
+        Returns:
+            requests.Response: The last response received
+
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed without a response
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                with self._stats_lock:
+                    self._retried += 1
+                delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+                time.sleep(random.uniform(0, delay))
+            try:
+                response = self._send(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                logger.warning(f"Attempt {attempt + 1} for {url} failed: {str(e)}")
+                if attempt == self.retries:
+                    self.circuit_breaker.record_failure()
+                    raise
+                continue
+            except requests.exceptions.RequestException:
+                self.circuit_breaker.record_failure()
+                raise
+            if response.status_code not in self.RETRY_STATUSES:
+                break
+            logger.warning(f"Attempt {attempt + 1} for {url} returned {response.status_code}")
+
+        if response.status_code in self.RETRY_STATUSES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        """Send a single GET, hedging it with a second one if the first is slow.
+
+        Args:
+            url (str): The URL to fetch
+
+        Returns:
+            requests.Response: The first successful response
+        """
+        delay = self._hedge_delay()
+        if delay is None:
+            return self._timed_get(url, **kwargs)
+
+        with self._stats_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self._pool_maxsize, thread_name_prefix="pokeapi-hedge"
+                )
+        primary = self._hedge_executor.submit(self._timed_get, url, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        with self._stats_lock:
+            self._hedged += 1
+        pending = {primary, self._hedge_executor.submit(self._timed_get, url, **kwargs)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+        return primary.result()
+
+    def _timed_get(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL with the configured timeouts and record its latency."""
+        start = time.monotonic()
+        response = self.session.get(url, timeout=self.timeout, **kwargs)
+        self._latencies.record(time.monotonic() - start)
+        return response
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Get how long to wait before hedging, or None if hedging is off or unprimed."""
+        if not self.hedge:
+            return None
+        p95 = self._latencies.percentile(95)
+        if p95 is None:
+            return None
+        return max(p95, self.hedge_min_delay)
+
+    def get_request_stats(self) -> Dict[str, Union[int, str]]:
+        """Get upstream request statistics.
+
+        Returns:
+            Dict[str, Union[int, str]]: Number of upstream fetches, coalesced calls,
+                fetches in flight, retries, hedged requests, stale responses served
+                and the circuit breaker state
+        """
+        stats = self._single_flight.get_stats()
+        with self._stats_lock:
+            stats.update({
+                "retries": self._retried,
+                "hedged": self._hedged,
+                "stale_served": self._stale_served
+            })
+        stats["circuit"] = self.circuit_breaker.state
+        return stats
     
-    def get_pokemon(self, name_or_id: Union[str, int]) -> Dict:
+    def get_pokemon(self, name_or_id: Union[str, int], revalidate: bool = False) -> Dict:
         """Get information about a specific Pokemon.
         
         Args:
             name_or_id (Union[str, int]): The name or ID of the Pokemon
+            revalidate (bool): Check any stored copy with the API before using it
             
         Returns:
             Dict: Pokemon information including name, types, abilities, and stats
         """
-        return self._make_request(f"pokemon/{name_or_id}")
+        return self._make_request(f"pokemon/{name_or_id}", revalidate=revalidate)
     
+    def get_pokemon_species(self, id: int) -> Dict:
+        """Get a Pokemon species, which links to its evolution chain.
+
+        Args:
+            id (int): The ID of the species
+
+        Returns:
+            Dict: Species information
+        """
+        return self._make_request(f"pokemon-species/{id}")
+
     def get_evolution_chain(self, id: int) -> Dict:
-        """Get the evolution chain for a Pokemon.
+        """Get an evolution chain.
         
         Args:
-            id (int): The ID of the Pokemon
+            id (int): The ID of the evolution chain, not of a Pokemon
             
         Returns:
             Dict: Evolution chain information
         """
         return self._make_request(f"evolution-chain/{id}")
     
-    def search_pokemon(self, query: str) -> List[Dict]:
+    def list_resources(self, resource: str) -> List[Dict]:
+        """List every entry of a resource such as ``pokemon`` or ``evolution-chain``.
+
+        Args:
+            resource (str): The resource name
+
+        Returns:
+            List[Dict]: Entries with ``name`` (where applicable) and ``url`` keys
+        """
+        return self._make_request(f"{resource}?limit={self.LISTING_LIMIT}").get("results", [])
+
+    def get_name_index(self) -> NameIndex:
+        """Get the Pokemon name index, building it on first use.
+
+        The full Pokemon listing is fetched once and indexed in memory.
+
+        Returns:
+            NameIndex: Index over every Pokemon name
+        """
+        if self._name_index is None:
+            with self._name_index_lock:
+                if self._name_index is None:
+                    self._name_index = NameIndex(self.list_resources("pokemon"))
+                    logger.info(f"Built Pokemon name index with {len(self._name_index)} names")
+        return self._name_index
+    
+    def search_pokemon(self, query: str, limit: int = 10) -> List[Dict]:
         """Search for Pokemon by name.
+
+        PokeAPI doesn't have a search endpoint, so queries are answered from a
+        local name index: prefix matches first, then fuzzy matches.
         
         Args:
             query (str): The search query
+            limit (int): Maximum number of results
             
         Returns:
-            List[Dict]: List of matching Pokemon
+            List[Dict]: List of matching Pokemon with name, id and url
         """
-        # Note: PokeAPI doesn't have a direct search endpoint
-        # We'll need to implement this using the pokemon list endpoint
-        # and filtering the results
-        pass
\ No newline at end of file
+        return self.get_name_index().search(query, limit)
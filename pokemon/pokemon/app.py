@@ -4,13 +4,17 @@ from flask_login import LoginManager, login_user, logout_user, login_required, c
 
 from pokemon.config import Config
 
-from pokemon.db import db
-from pokemon.models.user_model import Users
+from pokemon.db import add_missing_columns, db, engine_options, tune_sqlite
+from pokemon.models.favorites_model import FavoriteCounts, Favorites
+from pokemon.models.user_model import Users, identity_cache, password_hasher
 from pokemon.utils.logger import configure_logger
+from pokemon.utils.password_utils import HasherBusyError
+from pokemon.utils.token_utils import TokenSigner
 from pokemon.routes import pokemon_bp
 
 load_dotenv()
 
+
 def create_app(config_class=Config) -> Flask:
     """Create a Flask application with the specified configuration.
 
@@ -26,19 +30,68 @@ def create_app(config_class=Config) -> Flask:
     app.config.from_object(config_class)
 
     # Initialize database
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(
+        app.config['SQLALCHEMY_DATABASE_URI'],
+        pool_size=app.config.get('DB_POOL_SIZE', 10),
+        max_overflow=app.config.get('DB_MAX_OVERFLOW', 20),
+        pool_recycle=app.config.get('DB_POOL_RECYCLE', 1800),
+        pool_pre_ping=app.config.get('DB_POOL_PRE_PING', True)
+    ))
     db.init_app(app)
-    
+
     with app.app_context():
+        if app.config.get('SQLITE_TUNING', True):
+            tune_sqlite(
+                db.engine,
+                busy_timeout=app.config.get('SQLITE_BUSY_TIMEOUT', 5000),
+                mmap_size=app.config.get('SQLITE_MMAP_SIZE', 64 * 1024 * 1024)
+            )
         db.create_all()
+        # Columns added after the first release
+        add_missing_columns('users', {'password_version': 'INTEGER NOT NULL DEFAULT 1'})
 
     # Initialize login manager
     login_manager = LoginManager()
     login_manager.init_app(app)
     login_manager.login_view = 'login'
 
+    identity_cache.ttl = app.config.get('USER_IDENTITY_TTL', identity_cache.ttl)
+    password_hasher.configure(
+        algorithm=app.config.get('PASSWORD_HASH_ALGORITHM', 'pbkdf2_sha256'),
+        iterations=app.config.get('PASSWORD_HASH_ITERATIONS', 600000),
+        scrypt_n=app.config.get('PASSWORD_HASH_SCRYPT_N', 2 ** 14),
+        workers=app.config.get('PASSWORD_HASH_WORKERS', 2),
+        max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING'),
+        timeout=app.config.get('PASSWORD_HASH_TIMEOUT', 10.0)
+    )
+
     @login_manager.user_loader
     def load_user(user_id):
-        return Users.query.filter_by(username=user_id).first()
+        return Users.load_identity(user_id)
+
+    token_signer = None
+    if app.config.get('AUTH_TOKENS', False):
+        token_signer = TokenSigner(app.config['SECRET_KEY'], ttl=app.config.get('AUTH_TOKEN_TTL', 3600))
+
+        @login_manager.request_loader
+        def load_user_from_token(req):
+            """Authenticate a request from its ``Authorization: Bearer`` token.
+
+            The signature and expiry are checked locally, and the password
+            version claim against the cached identity, so a valid token costs
+            no database query while the identity is cached.
+            """
+            scheme, _, token = req.headers.get('Authorization', '').partition(' ')
+            if scheme.lower() != 'bearer' or not token:
+                return None
+            claims = token_signer.verify(token)
+            if claims is None:
+                return None
+            username, password_version = claims
+            identity = Users.load_identity(username)
+            if identity is None or identity.password_version != password_version:
+                return None
+            return identity
 
     @login_manager.unauthorized_handler
     def unauthorized():
@@ -127,7 +180,9 @@ def create_app(config_class=Config) -> Flask:
             - password (str): The password of the user.
 
         Returns:
-            JSON response indicating the success of the login attempt.
+            JSON response indicating the success of the login attempt. In
+            token mode (``AUTH_TOKENS``) it carries a bearer ``token`` and its
+            lifetime in ``expires_in`` instead of starting a session.
 
         Raises:
             401 error if the username or password is incorrect.
@@ -143,8 +198,15 @@ def create_app(config_class=Config) -> Flask:
                     "message": "Username and password are required"
                 }), 400)
 
-            if Users.check_password(username, password):
-                user = Users.query.filter_by(username=username).first()
+            user = Users.authenticate(username, password)
+            if user is not None:
+                if token_signer is not None:
+                    return make_response(jsonify({
+                        "status": "success",
+                        "message": f"User '{username}' logged in successfully",
+                        "token": token_signer.issue(user.username, user.password_version),
+                        "expires_in": token_signer.ttl
+                    }), 200)
                 login_user(user)
                 return make_response(jsonify({
                     "status": "success",
@@ -161,6 +223,12 @@ def create_app(config_class=Config) -> Flask:
                 "status": "error",
                 "message": str(e)
             }), 401)
+        except HasherBusyError as e:
+            app.logger.warning(f"Login rejected: {e}")
+            return make_response(jsonify({
+                "status": "error",
+                "message": "Too many logins in progress, please retry shortly"
+            }), 503)
         except Exception as e:
             app.logger.error(f"Login failed: {e}")
             return make_response(jsonify({
@@ -193,7 +261,8 @@ def create_app(config_class=Config) -> Flask:
             - new_password (str): The new password to set.
 
         Returns:
-            JSON response indicating the success of the password change.
+            JSON response indicating the success of the password change. In
+            token mode it carries a new ``token``, as earlier ones are revoked.
 
         Raises:
             400 error if the new password is not provided.
@@ -211,10 +280,15 @@ def create_app(config_class=Config) -> Flask:
 
             username = current_user.username
             Users.update_password(username, new_password)
-            return make_response(jsonify({
+            body = {
                 "status": "success",
                 "message": "Password changed successfully"
-            }), 200)
+            }
+            if token_signer is not None:
+                # Earlier tokens are now revoked; hand out one for the new password
+                identity = Users.load_identity(username)
+                body["token"] = token_signer.issue(username, identity.password_version)
+            return make_response(jsonify(body), 200)
 
         except ValueError as e:
             return make_response(jsonify({
@@ -233,6 +307,9 @@ def create_app(config_class=Config) -> Flask:
     def reset_users() -> Response:
         """Recreate the users table to delete all users.
 
+        The favorites table references users, so it is recreated as well,
+        together with the favorite counts derived from it.
+
         Returns:
             JSON response indicating the success of recreating the Users table.
 
@@ -242,8 +319,13 @@ def create_app(config_class=Config) -> Flask:
         try:
             app.logger.info("Received request to recreate Users table")
             with app.app_context():
+                Favorites.__table__.drop(db.engine, checkfirst=True)
                 Users.__table__.drop(db.engine)
                 Users.__table__.create(db.engine)
+                Favorites.__table__.create(db.engine)
+                FavoriteCounts.__table__.drop(db.engine, checkfirst=True)
+                FavoriteCounts.__table__.create(db.engine)
+            identity_cache.clear()
             app.logger.info("Users table recreated successfully")
             return make_response(jsonify({
                 "status": "success",
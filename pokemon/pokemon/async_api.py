@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar, Union
+
+from pokemon.api import PokemonAPI
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class AsyncPokemonAPI:
+    """Asyncio client for the PokeAPI with bounded concurrency.
+
+    Calls are delegated to a ``PokemonAPI`` so they share its connection pool,
+    request coalescing and persistent cache. The blocking HTTP work runs on a
+    thread pool whose size caps the number of requests in flight across every
+    caller of this client.
+    """
+
+    def __init__(self, api: Optional[PokemonAPI] = None, max_concurrency: int = 10):
+        """Initialize the async client.
+
+        Args:
+            api (Optional[PokemonAPI]): The client to delegate to. A new one with a
+                connection pool of ``max_concurrency`` is created if omitted.
+            max_concurrency (int): Maximum number of concurrent upstream requests
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.api = api or PokemonAPI(pool_maxsize=max_concurrency)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pokeapi")
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        """Run a blocking call on the client's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def get_pokemon(self, name_or_id: Union[str, int]) -> Dict:
+        """Get information about a specific Pokemon.
+
+        Args:
+            name_or_id (Union[str, int]): The name or ID of the Pokemon
+
+        Returns:
+            Dict: Pokemon information including name, types, abilities, and stats
+        """
+        return await self._run(self.api.get_pokemon, name_or_id)
+
+    async def get_evolution_chain(self, id: int) -> Dict:
+        """Get an evolution chain.
+
+        Args:
+            id (int): The ID of the evolution chain
+
+        Returns:
+            Dict: Evolution chain information
+        """
+        return await self._run(self.api.get_evolution_chain, id)
+
+    async def get_pokemon_many(self, names_or_ids: Iterable[Union[str, int]],
+                               max_concurrency: Optional[int] = None,
+                               return_exceptions: bool = False,
+                               loader: Optional[Callable[[Union[str, int]], Dict]] = None) -> List:
+        """Get several Pokemon in parallel.
+
+        Args:
+            names_or_ids (Iterable[Union[str, int]]): Names or IDs of the Pokemon
+            max_concurrency (Optional[int]): Per-batch concurrency limit, defaults
+                to the client's limit
+            return_exceptions (bool): Return failures in place of results instead
+                of raising the first one
+            loader (Optional[Callable]): Blocking function used to load each
+                Pokemon, such as a cache's read-through getter. Defaults to
+                ``PokemonAPI.get_pokemon``.
+
+        Returns:
+            List: Pokemon data (or exceptions) in the order requested
+        """
+        load = loader or self.api.get_pokemon
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def fetch(name_or_id):
+            async with semaphore:
+                return await self._run(load, name_or_id)
+
+        return await asyncio.gather(
+            *(fetch(name_or_id) for name_or_id in names_or_ids),
+            return_exceptions=return_exceptions
+        )
+
+    def close(self) -> None:
+        """Shut down the client's thread pool."""
+        self._executor.shutdown(wait=False)
@@ -7,4 +7,57 @@ class Config:
     """Flask application configuration."""
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-key-for-testing')
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///pokemon.db')
-    SQLALCHEMY_TRACK_MODIFICATIONS = False 
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Database connection pool (sized pools are skipped for in-memory SQLite)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '20'))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    # SQLite pragmas (WAL, synchronous=NORMAL, busy timeout, mmap) set on each connection
+    SQLITE_TUNING = os.getenv('SQLITE_TUNING', 'true').lower() == 'true'
+    SQLITE_BUSY_TIMEOUT = int(os.getenv('SQLITE_BUSY_TIMEOUT', '5000'))
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(64 * 1024 * 1024)))
+
+    # Seconds a loaded user identity is reused before hitting the database again
+    USER_IDENTITY_TTL = float(os.getenv('USER_IDENTITY_TTL', '60'))
+
+    # Stateless auth: /api/login returns a signed bearer token instead of starting a session
+    AUTH_TOKENS = os.getenv('AUTH_TOKENS', 'false').lower() == 'true'
+    AUTH_TOKEN_TTL = float(os.getenv('AUTH_TOKEN_TTL', '3600'))
+
+    # Password hashing: 'pbkdf2_sha256' or 'scrypt', run in a pool of worker processes
+    PASSWORD_HASH_ALGORITHM = os.getenv('PASSWORD_HASH_ALGORITHM', 'pbkdf2_sha256')
+    PASSWORD_HASH_ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', '600000'))
+    PASSWORD_HASH_SCRYPT_N = int(os.getenv('PASSWORD_HASH_SCRYPT_N', str(2 ** 14)))
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '16'))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', '10'))
+
+    # Pokemon cache
+    POKEMON_CACHE_MAX_ENTRIES = int(os.getenv('POKEMON_CACHE_MAX_ENTRIES', '1000'))
+    # Memory budget of the per-process cache in bytes (0 for no budget)
+    POKEMON_CACHE_MAX_BYTES = int(os.getenv('POKEMON_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+    POKEMON_CACHE_SOFT_TTL = float(os.getenv('POKEMON_CACHE_SOFT_TTL', '3600'))
+    POKEMON_CACHE_HARD_TTL = float(os.getenv('POKEMON_CACHE_HARD_TTL', '86400'))
+    # Store shared by the Pokemon caches: 'none', 'memory' (this process only),
+    # or 'sqlite' or 'redis' (every worker)
+    POKEMON_CACHE_BACKEND = os.getenv('POKEMON_CACHE_BACKEND', 'none')
+    # SQLite file path or redis:// URL of the shared store
+    POKEMON_CACHE_URL = os.getenv('POKEMON_CACHE_URL', '')
+
+    # Favorites storage: 'sql' (shared table) or 'memory' (per process)
+    FAVORITES_BACKEND = os.getenv('FAVORITES_BACKEND', 'sql')
+
+    # Persistent PokeAPI response cache (empty path disables it)
+    POKEAPI_CACHE_PATH = os.getenv('POKEAPI_CACHE_PATH', 'pokeapi_cache.db')
+    POKEAPI_CACHE_REVALIDATE_AFTER = float(os.getenv('POKEAPI_CACHE_REVALIDATE_AFTER', '86400'))
+
+    # PokeAPI client resilience
+    POKEAPI_POOL_SIZE = int(os.getenv('POKEAPI_POOL_SIZE', '10'))
+    POKEAPI_CONNECT_TIMEOUT = float(os.getenv('POKEAPI_CONNECT_TIMEOUT', '3.05'))
+    POKEAPI_READ_TIMEOUT = float(os.getenv('POKEAPI_READ_TIMEOUT', '10'))
+    POKEAPI_RETRIES = int(os.getenv('POKEAPI_RETRIES', '2'))
+    POKEAPI_BREAKER_THRESHOLD = int(os.getenv('POKEAPI_BREAKER_THRESHOLD', '5'))
+    POKEAPI_BREAKER_RESET = float(os.getenv('POKEAPI_BREAKER_RESET', '30'))
+    POKEAPI_HEDGE = os.getenv('POKEAPI_HEDGE', 'false').lower() == 'true'
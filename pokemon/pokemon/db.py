@@ -1,3 +1,88 @@
+import logging
+from typing import Dict, List
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine, make_url
+
+logger = logging.getLogger(__name__)
+
+db = SQLAlchemy()
+
+
+def engine_options(uri: str, pool_size: int = 10, max_overflow: int = 20,
+                   pool_recycle: int = 1800, pool_pre_ping: bool = True) -> Dict:
+    """Build ``SQLALCHEMY_ENGINE_OPTIONS`` for a database URL.
+
+    In-memory SQLite databases live in a single shared connection, so they
+    only get ``pool_pre_ping``; every other database gets a sized queue pool.
+
+    Args:
+        uri (str): The database URL
+        pool_size (int): Connections kept open in the pool
+        max_overflow (int): Extra connections opened under load and closed afterwards
+        pool_recycle (int): Seconds after which a connection is replaced, -1 to never
+        pool_pre_ping (bool): Test connections on checkout and replace dead ones
+
+    Returns:
+        Dict: Keyword arguments for ``create_engine``
+    """
+    options = {"pool_pre_ping": pool_pre_ping}
+    url = make_url(uri)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+    options.update(pool_size=pool_size, max_overflow=max_overflow, pool_recycle=pool_recycle)
+    return options
+
+
+def tune_sqlite(engine: Engine, busy_timeout: int = 5000, mmap_size: int = 64 * 1024 * 1024) -> None:
+    """Set performance pragmas on every new connection of a SQLite engine.
+
+    WAL lets readers run alongside a writer instead of queueing behind it,
+    and ``synchronous=NORMAL`` only syncs at checkpoints, which is safe in WAL
+    mode. Writers wait up to ``busy_timeout`` for the lock instead of failing
+    with "database is locked". Foreign keys are enforced so ``ON DELETE
+    CASCADE`` behaves as it does on PostgreSQL. Engines of other databases
+    are left alone.
+
+    Args:
+        engine (Engine): The engine to tune
+        busy_timeout (int): Milliseconds a connection waits for a lock
+        mmap_size (int): Bytes of the database file read through memory mapping
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout)}")
+        cursor.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def add_missing_columns(table: str, columns: Dict[str, str]) -> List[str]:
+    """Add columns that a table created by an older release lacks.
+
+    ``create_all`` only creates missing tables, so columns added to a model
+    later are added here with ``ALTER TABLE``. Each one needs a default, so
+    that existing rows get a value.
+
+    Args:
+        table (str): Name of the table
+        columns (Dict[str, str]): Column name -> type and constraints, such as
+            ``INTEGER NOT NULL DEFAULT 1``
 
-db = SQLAlchemy()
\ No newline at end of file
+    Returns:
+        List[str]: Names of the columns that were added
+    """
+    existing = {column["name"] for column in inspect(db.engine).get_columns(table)}
+    added = [name for name in columns if name not in existing]
+    with db.engine.begin() as conn:
+        for name in added:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {columns[name]}"))
+            logger.info(f"Added column {table}.{name}")
+    return added
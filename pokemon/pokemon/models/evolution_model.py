@@ -0,0 +1,216 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import logging
+import threading
+
+from pokemon.api import PokemonAPI
+
+logger = logging.getLogger(__name__)
+
+def _id_from_url(url: str) -> int:
+    """Extract the trailing numeric ID from a PokeAPI resource URL."""
+    return int(url.rstrip("/").rsplit("/", 1)[-1])
+
+def _conditions(details: Dict) -> Dict:
+    """Keep the evolution conditions that are actually set, flattening named resources."""
+    conditions = {}
+    for key, value in details.items():
+        if key == "trigger" or value is None or value is False or value == "":
+            continue
+        conditions[key] = value["name"] if isinstance(value, dict) else value
+    return conditions
+
+@dataclass
+class EvolutionChain:
+    """Data class for an evolution chain as a graph of species."""
+    id: int
+    root: int
+    nodes: Dict[int, str] = field(default_factory=dict)  # species id -> species name
+    edges: List[Dict] = field(default_factory=list)  # {"from", "to", "trigger", "conditions"}
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "EvolutionChain":
+        """Build a chain from a PokeAPI ``evolution-chain/<id>`` payload.
+
+        Args:
+            data (Dict): The raw evolution chain payload
+
+        Returns:
+            EvolutionChain: The chain's species and evolution edges
+        """
+        root = data["chain"]
+        chain = cls(id=data["id"], root=_id_from_url(root["species"]["url"]))
+        stack = [root]
+        while stack:
+            link = stack.pop()
+            species_id = _id_from_url(link["species"]["url"])
+            chain.nodes[species_id] = link["species"]["name"]
+            for child in link.get("evolves_to", []):
+                child_id = _id_from_url(child["species"]["url"])
+                for details in child.get("evolution_details") or [{}]:
+                    trigger = details.get("trigger")
+                    chain.edges.append({
+                        "from": species_id,
+                        "to": child_id,
+                        "trigger": trigger["name"] if trigger else None,
+                        "conditions": _conditions(details)
+                    })
+                stack.append(child)
+        chain.edges.sort(key=lambda edge: (edge["from"], edge["to"]))
+        return chain
+
+    def to_dict(self) -> Dict:
+        """Serialize the chain for a JSON response.
+
+        Returns:
+            Dict: The chain ID, root species, nodes and edges
+        """
+        return {
+            "id": self.id,
+            "root": self.root,
+            "nodes": [{"id": species_id, "name": name} for species_id, name in sorted(self.nodes.items())],
+            "edges": self.edges
+        }
+
+class EvolutionModel:
+    """In-memory evolution graph resolving any Pokemon to its chain in O(1).
+
+    ``build`` indexes every evolution chain once. Lookups for a Pokemon that
+    is not indexed yet (an index still building, or a new or alternate form)
+    resolve it through its species, index its whole chain, and start a full
+    build in the background if none has run.
+    """
+
+    def __init__(self, api: PokemonAPI, workers: int = 8):
+        """Initialize the evolution model.
+
+        Args:
+            api (PokemonAPI): Client used to load species and chains
+            workers (int): Concurrent fetches used by ``build``
+        """
+        self._api = api
+        self._workers = workers
+        self._chains: Dict[int, EvolutionChain] = {}  # chain id -> chain
+        self._chain_by_pokemon: Dict[int, int] = {}  # species/pokemon id -> chain id
+        self._lock = threading.Lock()
+        self._build_started = False
+        self._built = threading.Event()
+
+    def add_chain(self, data: Dict) -> EvolutionChain:
+        """Index an evolution chain payload.
+
+        Args:
+            data (Dict): The raw evolution chain payload
+
+        Returns:
+            EvolutionChain: The indexed chain
+        """
+        chain = EvolutionChain.from_api(data)
+        with self._lock:
+            self._chains[chain.id] = chain
+            for species_id in chain.nodes:
+                self._chain_by_pokemon[species_id] = chain.id
+        return chain
+
+    def build(self) -> int:
+        """Fetch and index every evolution chain.
+
+        If the chains cannot be listed, the build is marked as not started so
+        a later lookup can retry it.
+
+        Returns:
+            int: Number of chains indexed
+
+        Raises:
+            requests.exceptions.RequestException: If the chains cannot be listed
+        """
+        with self._lock:
+            self._build_started = True
+        try:
+            chain_ids = [_id_from_url(entry["url"]) for entry in self._api.list_resources("evolution-chain")]
+        except Exception as e:
+            with self._lock:
+                self._build_started = False
+            logger.error(f"Could not list evolution chains, index build will be retried: {str(e)}")
+            raise
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="evolution-index") as executor:
+            failures = sum(1 for chain in executor.map(self._load_chain, chain_ids) if chain is None)
+        self._built.set()
+        logger.info(f"Indexed {len(self._chains)} evolution chains ({failures} failed)")
+        return len(self._chains)
+
+    def _load_chain(self, chain_id: int) -> Optional[EvolutionChain]:
+        """Fetch and index one chain, returning None on failure."""
+        try:
+            return self.add_chain(self._api.get_evolution_chain(chain_id))
+        except Exception as e:
+            logger.warning(f"Could not index evolution chain {chain_id}: {str(e)}")
+            return None
+
+    def build_in_background(self) -> None:
+        """Start ``build`` on a daemon thread unless a build has already started."""
+        with self._lock:
+            if self._build_started:
+                return
+            self._build_started = True
+        threading.Thread(target=self._build_quietly, name="evolution-index", daemon=True).start()
+
+    def _build_quietly(self) -> None:
+        """Run ``build`` on the background thread; failures are already logged."""
+        try:
+            self.build()
+        except Exception:
+            pass
+
+    def get_chain(self, chain_id: int) -> Optional[EvolutionChain]:
+        """Get an indexed chain by its chain ID.
+
+        Args:
+            chain_id (int): The evolution chain ID
+
+        Returns:
+            Optional[EvolutionChain]: The chain, or None if not indexed
+        """
+        return self._chains.get(chain_id)
+
+    def get_chain_for_pokemon(self, pokemon_id: int) -> EvolutionChain:
+        """Get the evolution chain a Pokemon belongs to.
+
+        Args:
+            pokemon_id (int): The Pokemon (or species) ID
+
+        Returns:
+            EvolutionChain: The Pokemon's chain
+
+        Raises:
+            requests.exceptions.RequestException: If an unindexed Pokemon cannot be resolved
+        """
+        chain_id = self._chain_by_pokemon.get(pokemon_id)
+        if chain_id is not None:
+            return self._chains[chain_id]
+
+        self.build_in_background()
+        pokemon = self._api.get_pokemon(pokemon_id)
+        species_id = _id_from_url(pokemon["species"]["url"])
+        chain_id = self._chain_by_pokemon.get(species_id)
+        if chain_id is None:
+            species = self._api.get_pokemon_species(species_id)
+            chain_id = self.add_chain(
+                self._api.get_evolution_chain(_id_from_url(species["evolution_chain"]["url"]))
+            ).id
+        with self._lock:
+            self._chain_by_pokemon[pokemon_id] = chain_id
+        return self._chains[chain_id]
+
+    def get_stats(self) -> Dict:
+        """Get index statistics.
+
+        Returns:
+            Dict: Number of chains and Pokemon indexed and whether a full build finished
+        """
+        return {
+            "chains": len(self._chains),
+            "pokemon": len(self._chain_by_pokemon),
+            "built": self._built.is_set()
+        }
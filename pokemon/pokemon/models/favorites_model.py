@@ -1,35 +1,84 @@
-from typing import Dict, List, Optional
+from itertools import count, dropwhile, islice
+from typing import Dict, List, Optional, Tuple, Union
 import logging
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from pokemon.db import db
+from pokemon.models.pokemon_model import PokemonRecord
+from pokemon.models.user_model import Users
+from pokemon.utils.leaderboard_utils import Leaderboard
 
 logger = logging.getLogger(__name__)
 
 class FavoritesModel:
-    """In-memory model for storing user's favorite Pokemon."""
+    """In-memory model for storing user's favorite Pokemon.
+
+    Favorites are stored as compact ``PokemonRecord`` instances; raw payloads
+    passed to ``add_favorite`` are projected on the way in. Each user has an
+    insertion-ordered set of Pokemon IDs, and every record is stored once and
+    shared by all users who favorited it, so add, remove and membership checks
+    are O(1). Every change bumps the user's version, for cheap change detection.
+    How many users hold each Pokemon is kept in a ``Leaderboard``, which also
+    serves as the refcount of the shared records.
+
+    The model is safe to share between request threads. Users are spread over
+    a fixed set of striped locks, so requests for different users rarely wait
+    on each other; the shared record store has its own stripes keyed by
+    Pokemon ID. A user's stripe is always taken before a record stripe.
+    """
     
-    def __init__(self):
-        """Initialize the favorites model."""
-        self._favorites: Dict[str, List[Dict]] = {}  # username -> list of favorite pokemon
+    def __init__(self, lock_stripes: int = 64):
+        """Initialize the favorites model.
+
+        Args:
+            lock_stripes (int): Number of locks users and records are spread over
+        """
+        self._favorites: Dict[str, Dict[int, int]] = {}  # username -> pokemon id -> sequence, in insertion order
+        self._versions: Dict[str, int] = {}  # username -> version, bumped on every change
+        self._sequence = count(1)
+        self._pokemon: Dict[int, PokemonRecord] = {}  # pokemon id -> shared record
+        self._leaderboard = Leaderboard()  # pokemon id -> number of users holding it
+        self._user_locks = [threading.RLock() for _ in range(lock_stripes)]
+        self._record_locks = [threading.Lock() for _ in range(lock_stripes)]
+
+    def _user_lock(self, username: str) -> threading.RLock:
+        """Get the lock guarding a user's favorites."""
+        return self._user_locks[hash(username) % len(self._user_locks)]
+
+    def _record_lock(self, pokemon_id: int) -> threading.Lock:
+        """Get the lock guarding a shared Pokemon record and its count."""
+        return self._record_locks[pokemon_id % len(self._record_locks)]
     
-    def add_favorite(self, username: str, pokemon: Dict) -> bool:
+    def add_favorite(self, username: str, pokemon: Union[Dict, PokemonRecord]) -> bool:
         """Add a Pokemon to a user's favorites.
         
         Args:
             username (str): The username
-            pokemon (Dict): The Pokemon data to add
+            pokemon (Union[Dict, PokemonRecord]): The Pokemon record or raw payload to add
             
         Returns:
             bool: True if added successfully, False if already exists
         """
-        if username not in self._favorites:
-            self._favorites[username] = []
-            
-        # Check if Pokemon already in favorites
-        if any(p['id'] == pokemon['id'] for p in self._favorites[username]):
-            logger.info(f"Pokemon {pokemon['name']} already in favorites for {username}")
+        if not isinstance(pokemon, PokemonRecord):
+            pokemon = PokemonRecord.from_api(pokemon)
+        with self._user_lock(username):
+            favorites = self._favorites.setdefault(username, {})
+            added = pokemon.id not in favorites
+            if added:
+                favorites[pokemon.id] = next(self._sequence)
+                self._versions[username] = self._versions.get(username, 0) + 1
+                with self._record_lock(pokemon.id):
+                    self._pokemon.setdefault(pokemon.id, pokemon)
+                    self._leaderboard.increment(pokemon.id)
+
+        if not added:
+            logger.info(f"Pokemon {pokemon.name} already in favorites for {username}")
             return False
-            
-        self._favorites[username].append(pokemon)
-        logger.info(f"Added {pokemon['name']} to favorites for {username}")
+        logger.info(f"Added {pokemon.name} to favorites for {username}")
         return True
     
     def remove_favorite(self, username: str, pokemon_id: int) -> bool:
@@ -42,28 +91,108 @@ class FavoritesModel:
         Returns:
             bool: True if removed successfully, False if not found
         """
-        if username not in self._favorites:
-            return False
-            
-        initial_length = len(self._favorites[username])
-        self._favorites[username] = [p for p in self._favorites[username] if p['id'] != pokemon_id]
-        
-        if len(self._favorites[username]) < initial_length:
-            logger.info(f"Removed Pokemon {pokemon_id} from favorites for {username}")
-            return True
-        return False
+        with self._user_lock(username):
+            favorites = self._favorites.get(username)
+            if favorites is None or pokemon_id not in favorites:
+                return False
+
+            del favorites[pokemon_id]
+            self._versions[username] += 1
+            with self._record_lock(pokemon_id):
+                if not self._leaderboard.decrement(pokemon_id):
+                    del self._pokemon[pokemon_id]
+        logger.info(f"Removed Pokemon {pokemon_id} from favorites for {username}")
+        return True
     
-    def get_favorites(self, username: str) -> List[Dict]:
-        """Get all favorite Pokemon for a user.
+    def get_favorites(self, username: str) -> List[PokemonRecord]:
+        """Get all favorite Pokemon for a user, in the order they were added.
         
         Args:
             username (str): The username
             
         Returns:
-            List[Dict]: List of favorite Pokemon
+            List[PokemonRecord]: List of favorite Pokemon
+        """
+        with self._user_lock(username):
+            return [self._pokemon[pokemon_id] for pokemon_id in self._favorites.get(username, ())]
+
+    def get_favorites_page(self, username: str, limit: int,
+                           after: Optional[int] = None) -> Tuple[List[PokemonRecord], Optional[int]]:
+        """Get a page of a user's favorites in insertion order.
+
+        Args:
+            username (str): The username
+            limit (int): Maximum number of favorites to return
+            after (Optional[int]): Cursor returned with the previous page
+
+        Returns:
+            Tuple[List[PokemonRecord], Optional[int]]: The page and the cursor of
+                the next page, or None if this is the last page
         """
-        return self._favorites.get(username, [])
+        with self._user_lock(username):
+            items = self._favorites.get(username, {}).items()
+            if after is not None:
+                items = dropwhile(lambda item: item[1] <= after, items)
+            page = list(islice(items, limit + 1))
+            next_cursor = page[limit - 1][1] if len(page) > limit else None
+            return [self._pokemon[pokemon_id] for pokemon_id, _ in page[:limit]], next_cursor
+
+    def get_version(self, username: str) -> str:
+        """Get a value that changes whenever a user's favorites change.
+
+        Args:
+            username (str): The username
+
+        Returns:
+            str: The user's favorites version
+        """
+        return str(self._versions.get(username, 0))
     
+    def apply_batch(self, username: str, add: List[PokemonRecord],
+                    remove: List[int]) -> List[Dict]:
+        """Apply several removals and additions for one user.
+
+        Removals are applied before additions. The user's lock is held for the
+        whole batch, so readers never observe it half applied.
+
+        Args:
+            username (str): The username
+            add (List[PokemonRecord]): Pokemon to add
+            remove (List[int]): IDs of Pokemon to remove
+
+        Returns:
+            List[Dict]: One status per item, removals first, each with
+                ``pokemon_id``, ``action`` and ``status``
+        """
+        results = []
+        with self._user_lock(username):
+            for pokemon_id in remove:
+                removed = self.remove_favorite(username, pokemon_id)
+                results.append({"pokemon_id": pokemon_id, "action": "remove",
+                                "status": "removed" if removed else "not_found"})
+            for pokemon in add:
+                added = self.add_favorite(username, pokemon)
+                results.append({"pokemon_id": pokemon.id, "action": "add",
+                                "status": "added" if added else "already_favorite"})
+        return results
+    
+    def get_top_favorites(self, k: int) -> List[Tuple[PokemonRecord, int]]:
+        """Get the Pokemon favorited by the most users.
+
+        Args:
+            k (int): Number of Pokemon to return
+
+        Returns:
+            List[Tuple[PokemonRecord, int]]: (Pokemon, number of users) pairs,
+                most favorited first, ties by Pokemon ID
+        """
+        top = []
+        for pokemon_id, favorited_by in self._leaderboard.top(k):
+            pokemon = self._pokemon.get(pokemon_id)
+            if pokemon is not None:  # skip records released since the ranking was read
+                top.append((pokemon, favorited_by))
+        return top
+
     def is_favorite(self, username: str, pokemon_id: int) -> bool:
         """Check if a Pokemon is in a user's favorites.
         
@@ -74,6 +203,311 @@ class FavoritesModel:
         Returns:
             bool: True if the Pokemon is in favorites, False otherwise
         """
-        if username not in self._favorites:
+        return pokemon_id in self._favorites.get(username, ())
+
+
+class Favorites(db.Model):
+    __tablename__ = 'favorites'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    pokemon_id = db.Column(db.Integer, nullable=False)
+    pokemon = db.Column(db.JSON, nullable=False)  # serialized PokemonRecord
+
+    __table_args__ = (
+        db.Index('ix_favorites_user_pokemon', 'user_id', 'pokemon_id', unique=True),
+        {'sqlite_autoincrement': True}  # never reuse IDs, get_version relies on it
+    )
+
+
+class FavoriteCounts(db.Model):
+    __tablename__ = 'favorite_counts'
+
+    pokemon_id = db.Column(db.Integer, primary_key=True)
+    count = db.Column(db.Integer, nullable=False)  # number of users holding the Pokemon
+    pokemon = db.Column(db.JSON, nullable=False)  # serialized PokemonRecord
+
+    __table_args__ = (
+        db.Index('ix_favorite_counts_count', 'count'),
+    )
+
+
+@event.listens_for(Users, 'before_delete')
+def _release_favorites(mapper, connection, user: Users) -> None:
+    """Remove a deleted user's favorites from the counts, in the same transaction.
+
+    The favorites are deleted explicitly rather than left to ``ON DELETE
+    CASCADE``, so counts and rows stay in step whether or not the database
+    enforces foreign keys.
+    """
+    held = db.select(Favorites.pokemon_id).where(Favorites.user_id == user.id)
+    connection.execute(
+        db.update(FavoriteCounts)
+        .where(FavoriteCounts.pokemon_id.in_(held))
+        .values(count=FavoriteCounts.count - 1)
+    )
+    connection.execute(db.delete(Favorites).where(Favorites.user_id == user.id))
+
+
+class SqlFavoritesModel:
+    """Favorites stored in the ``favorites`` table, shared by every worker.
+
+    Exposes the same API as ``FavoritesModel``. Each call is a single statement
+    served by the unique (user_id, pokemon_id) index. Calls must run inside an
+    application context.
+
+    Per-Pokemon totals are kept in ``favorite_counts``, updated in the same
+    transaction as the favorites themselves, so the leaderboard is one indexed
+    query instead of a scan of every user's favorites.
+    """
+
+    @staticmethod
+    def _user_id(username: str):
+        """Scalar subquery resolving a username to its user ID."""
+        return db.select(Users.id).where(Users.username == username).scalar_subquery()
+
+    @staticmethod
+    def _count_added(pokemon: List[PokemonRecord]) -> None:
+        """Increment the counts of newly added favorites, creating missing rows."""
+        dialect = db.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        statement = insert(FavoriteCounts).on_conflict_do_update(
+            index_elements=[FavoriteCounts.pokemon_id],
+            set_={'count': FavoriteCounts.count + 1}
+        )
+        db.session.execute(statement, [
+            {"pokemon_id": record.id, "count": 1, "pokemon": record.to_dict()} for record in pokemon
+        ])
+
+    @staticmethod
+    def _count_removed(pokemon_ids: List[int]) -> None:
+        """Decrement the counts of removed favorites."""
+        db.session.execute(
+            db.update(FavoriteCounts)
+            .where(FavoriteCounts.pokemon_id.in_(pokemon_ids))
+            .values(count=FavoriteCounts.count - 1)
+        )
+
+    def add_favorite(self, username: str, pokemon: Union[Dict, PokemonRecord]) -> bool:
+        """Add a Pokemon to a user's favorites.
+
+        Args:
+            username (str): The username
+            pokemon (Union[Dict, PokemonRecord]): The Pokemon record or raw payload to add
+
+        Returns:
+            bool: True if added successfully, False if already exists or the user is unknown
+        """
+        if not isinstance(pokemon, PokemonRecord):
+            pokemon = PokemonRecord.from_api(pokemon)
+        statement = db.insert(Favorites).from_select(
+            ['user_id', 'pokemon_id', 'pokemon'],
+            db.select(
+                Users.id,
+                db.literal(pokemon.id, db.Integer),
+                db.literal(pokemon.to_dict(), db.JSON)
+            ).where(Users.username == username)
+        )
+        try:
+            result = db.session.execute(statement)
+            if result.rowcount:
+                self._count_added([pokemon])
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            logger.info(f"Pokemon {pokemon.name} already in favorites for {username}")
             return False
-        return any(p['id'] == pokemon_id for p in self._favorites[username])
+        if result.rowcount == 0:
+            logger.info(f"User {username} not found")
+            return False
+        logger.info(f"Added {pokemon.name} to favorites for {username}")
+        return True
+
+    def remove_favorite(self, username: str, pokemon_id: int) -> bool:
+        """Remove a Pokemon from a user's favorites.
+
+        Args:
+            username (str): The username
+            pokemon_id (int): The ID of the Pokemon to remove
+
+        Returns:
+            bool: True if removed successfully, False if not found
+        """
+        result = db.session.execute(
+            db.delete(Favorites).where(
+                Favorites.user_id == self._user_id(username),
+                Favorites.pokemon_id == pokemon_id
+            )
+        )
+        if result.rowcount:
+            self._count_removed([pokemon_id])
+        db.session.commit()
+        if result.rowcount:
+            logger.info(f"Removed Pokemon {pokemon_id} from favorites for {username}")
+            return True
+        return False
+
+    def get_favorites(self, username: str) -> List[PokemonRecord]:
+        """Get all favorite Pokemon for a user, in the order they were added.
+
+        Args:
+            username (str): The username
+
+        Returns:
+            List[PokemonRecord]: List of favorite Pokemon
+        """
+        rows = db.session.execute(
+            db.select(Favorites.pokemon)
+            .where(Favorites.user_id == self._user_id(username))
+            .order_by(Favorites.id)
+        ).scalars()
+        return [PokemonRecord.from_dict(data) for data in rows]
+
+    def get_favorites_page(self, username: str, limit: int,
+                           after: Optional[int] = None) -> Tuple[List[PokemonRecord], Optional[int]]:
+        """Get a page of a user's favorites in insertion order.
+
+        Args:
+            username (str): The username
+            limit (int): Maximum number of favorites to return
+            after (Optional[int]): Cursor returned with the previous page
+
+        Returns:
+            Tuple[List[PokemonRecord], Optional[int]]: The page and the cursor of
+                the next page, or None if this is the last page
+        """
+        statement = db.select(Favorites.id, Favorites.pokemon).where(
+            Favorites.user_id == self._user_id(username)
+        )
+        if after is not None:
+            statement = statement.where(Favorites.id > after)
+        rows = db.session.execute(statement.order_by(Favorites.id).limit(limit + 1)).all()
+        next_cursor = rows[limit - 1].id if len(rows) > limit else None
+        return [PokemonRecord.from_dict(row.pokemon) for row in rows[:limit]], next_cursor
+
+    def get_version(self, username: str) -> str:
+        """Get a value that changes whenever a user's favorites change.
+
+        Favorite IDs are never reused, so the pair (count, highest ID) can only
+        come back to an earlier value if the favorites are the same as then.
+
+        Args:
+            username (str): The username
+
+        Returns:
+            str: The user's favorites version
+        """
+        total, last_id = db.session.execute(
+            db.select(db.func.count(Favorites.id), db.func.max(Favorites.id))
+            .where(Favorites.user_id == self._user_id(username))
+        ).one()
+        return f"{total}-{last_id or 0}"
+
+    def apply_batch(self, username: str, add: List[PokemonRecord],
+                    remove: List[int]) -> List[Dict]:
+        """Apply several removals and additions for one user in one transaction.
+
+        Removals are applied before additions. The user's current favorites
+        among the requested IDs are read with one query, then the changes are
+        written with one DELETE and one multi-row INSERT.
+
+        Args:
+            username (str): The username
+            add (List[PokemonRecord]): Pokemon to add
+            remove (List[int]): IDs of Pokemon to remove
+
+        Returns:
+            List[Dict]: One status per item, removals first, each with
+                ``pokemon_id``, ``action`` and ``status``
+
+        Raises:
+            ValueError: If the user does not exist
+        """
+        user_id = db.session.execute(
+            db.select(Users.id).where(Users.username == username)
+        ).scalar_one_or_none()
+        if user_id is None:
+            raise ValueError(f"User {username} not found")
+
+        requested = set(remove) | {pokemon.id for pokemon in add}
+        present = set(db.session.execute(
+            db.select(Favorites.pokemon_id).where(
+                Favorites.user_id == user_id,
+                Favorites.pokemon_id.in_(requested)
+            )
+        ).scalars())
+
+        results = []
+        to_delete = []
+        for pokemon_id in remove:
+            if pokemon_id in present:
+                present.discard(pokemon_id)
+                to_delete.append(pokemon_id)
+                status = "removed"
+            else:
+                status = "not_found"
+            results.append({"pokemon_id": pokemon_id, "action": "remove", "status": status})
+        to_insert = []
+        added = []
+        for pokemon in add:
+            if pokemon.id in present:
+                status = "already_favorite"
+            else:
+                present.add(pokemon.id)
+                added.append(pokemon)
+                to_insert.append({"user_id": user_id, "pokemon_id": pokemon.id, "pokemon": pokemon.to_dict()})
+                status = "added"
+            results.append({"pokemon_id": pokemon.id, "action": "add", "status": status})
+
+        try:
+            if to_delete:
+                db.session.execute(db.delete(Favorites).where(
+                    Favorites.user_id == user_id,
+                    Favorites.pokemon_id.in_(to_delete)
+                ))
+                self._count_removed(to_delete)
+            if to_insert:
+                db.session.execute(db.insert(Favorites), to_insert)
+                self._count_added(added)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Applied favorites batch for {username}: "
+                    f"{len(to_insert)} added, {len(to_delete)} removed")
+        return results
+
+    def get_top_favorites(self, k: int) -> List[Tuple[PokemonRecord, int]]:
+        """Get the Pokemon favorited by the most users.
+
+        Args:
+            k (int): Number of Pokemon to return
+
+        Returns:
+            List[Tuple[PokemonRecord, int]]: (Pokemon, number of users) pairs,
+                most favorited first, ties by Pokemon ID
+        """
+        rows = db.session.execute(
+            db.select(FavoriteCounts.pokemon, FavoriteCounts.count)
+            .where(FavoriteCounts.count > 0)
+            .order_by(FavoriteCounts.count.desc(), FavoriteCounts.pokemon_id)
+            .limit(k)
+        ).all()
+        return [(PokemonRecord.from_dict(row.pokemon), row.count) for row in rows]
+
+    def is_favorite(self, username: str, pokemon_id: int) -> bool:
+        """Check if a Pokemon is in a user's favorites.
+
+        Args:
+            username (str): The username
+            pokemon_id (int): The ID of the Pokemon to check
+
+        Returns:
+            bool: True if the Pokemon is in favorites, False otherwise
+        """
+        return db.session.execute(
+            db.select(Favorites.id).where(
+                Favorites.user_id == self._user_id(username),
+                Favorites.pokemon_id == pokemon_id
+            )
+        ).first() is not None
@@ -1,8 +1,17 @@
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+import json
 import logging
+import struct
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 
+from pokemon.utils.cache_utils import CacheBackend
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -21,90 +30,602 @@ class PokemonType:
     name: str
     url: str
 
+# Stat names used by PokeAPI, mapped to PokemonStats fields
+_STAT_FIELDS = {
+    "hp": "hp",
+    "attack": "attack",
+    "defense": "defense",
+    "special-attack": "special_attack",
+    "special-defense": "special_defense",
+    "speed": "speed"
+}
+
+# Shared PokemonType instances; there are only a handful of distinct types
+_TYPES: Dict[Tuple[str, str], PokemonType] = {}
+
+def _intern_type(name: str, url: str) -> PokemonType:
+    """Return the shared PokemonType instance for a name and URL."""
+    key = (name, url)
+    pokemon_type = _TYPES.get(key)
+    if pokemon_type is None:
+        pokemon_type = _TYPES.setdefault(key, PokemonType(sys.intern(name), url))
+    return pokemon_type
+
+class PokemonRecord:
+    """Compact projection of a PokeAPI Pokemon payload.
+
+    Only the fields the application serves are kept: id, name, types,
+    abilities, stats and sprite URL. The bulky parts of the payload such as
+    ``moves`` and ``game_indices`` are dropped. Item access (``record['name']``)
+    is supported for code written against the raw payload.
+    """
+    __slots__ = ("id", "name", "types", "abilities", "stats", "sprite")
+
+    def __init__(self, id: Optional[int], name: str, types: Tuple[PokemonType, ...] = (),
+                 abilities: Tuple[str, ...] = (), stats: Optional[PokemonStats] = None,
+                 sprite: Optional[str] = None):
+        """Initialize the record.
+
+        Args:
+            id (Optional[int]): The Pokemon ID
+            name (str): The Pokemon name
+            types (Tuple[PokemonType, ...]): The Pokemon's types in slot order
+            abilities (Tuple[str, ...]): The Pokemon's ability names
+            stats (Optional[PokemonStats]): The Pokemon's base stats
+            sprite (Optional[str]): URL of the default front sprite
+        """
+        self.id = id
+        self.name = name
+        self.types = types
+        self.abilities = abilities
+        self.stats = stats
+        self.sprite = sprite
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "PokemonRecord":
+        """Build a record from a PokeAPI ``pokemon/<id>`` payload.
+
+        Args:
+            data (Dict): The raw Pokemon payload
+
+        Returns:
+            PokemonRecord: The compact record
+        """
+        types = []
+        for entry in data.get("types", []):
+            if isinstance(entry, str):
+                types.append(_intern_type(entry, ""))
+            else:
+                types.append(_intern_type(entry["type"]["name"], entry["type"].get("url", "")))
+
+        abilities = tuple(
+            sys.intern(entry if isinstance(entry, str) else entry["ability"]["name"])
+            for entry in data.get("abilities", [])
+        )
+
+        stats = None
+        values = {
+            _STAT_FIELDS[entry["stat"]["name"]]: entry["base_stat"]
+            for entry in data.get("stats", [])
+            if entry["stat"]["name"] in _STAT_FIELDS
+        }
+        if len(values) == len(_STAT_FIELDS):
+            stats = PokemonStats(**values)
+
+        sprites = data.get("sprites") or {}
+        return cls(
+            id=data.get("id"),
+            name=sys.intern(data["name"]),
+            types=tuple(types),
+            abilities=abilities,
+            stats=stats,
+            sprite=sprites.get("front_default")
+        )
+
+    def to_dict(self) -> Dict:
+        """Serialize the record for a JSON response.
+
+        Returns:
+            Dict: The record's fields with types as name/url pairs and stats as a dict
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "types": [{"name": t.name, "url": t.url} for t in self.types],
+            "abilities": list(self.abilities),
+            "stats": None if self.stats is None else {
+                "hp": self.stats.hp,
+                "attack": self.stats.attack,
+                "defense": self.stats.defense,
+                "special_attack": self.stats.special_attack,
+                "special_defense": self.stats.special_defense,
+                "speed": self.stats.speed
+            },
+            "sprite": self.sprite
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PokemonRecord":
+        """Rebuild a record from the output of ``to_dict``.
+
+        Args:
+            data (Dict): A serialized record
+
+        Returns:
+            PokemonRecord: The record
+        """
+        return cls(
+            id=data["id"],
+            name=sys.intern(data["name"]),
+            types=tuple(_intern_type(t["name"], t["url"]) for t in data.get("types", [])),
+            abilities=tuple(sys.intern(a) for a in data.get("abilities", [])),
+            stats=PokemonStats(**data["stats"]) if data.get("stats") else None,
+            sprite=data.get("sprite")
+        )
+
+    def memory_size(self) -> int:
+        """Estimate the memory held by the record, in bytes.
+
+        Counts the record, its strings, numbers, tuples and stats. ``PokemonType``
+        instances are shared by all records and are not counted.
+
+        Returns:
+            int: The estimated size
+        """
+        size = (sys.getsizeof(self) + sys.getsizeof(self.id) + sys.getsizeof(self.name)
+                + sys.getsizeof(self.types) + sys.getsizeof(self.abilities)
+                + sum(sys.getsizeof(a) for a in self.abilities))
+        if self.stats is not None:
+            size += sys.getsizeof(self.stats) + sys.getsizeof(self.stats.__dict__)
+            size += sum(sys.getsizeof(value) for value in self.stats.__dict__.values())
+        if self.sprite is not None:
+            size += sys.getsizeof(self.sprite)
+        return size
+
+    def to_bytes(self) -> bytes:
+        """Serialize the record compactly for an external cache.
+
+        Fields are written positionally as a JSON array, without key names.
+
+        Returns:
+            bytes: The serialized record
+        """
+        stats = None if self.stats is None else [
+            self.stats.hp, self.stats.attack, self.stats.defense,
+            self.stats.special_attack, self.stats.special_defense, self.stats.speed
+        ]
+        return json.dumps(
+            [self.id, self.name, [[t.name, t.url] for t in self.types],
+             list(self.abilities), stats, self.sprite],
+            separators=(",", ":")
+        ).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PokemonRecord":
+        """Rebuild a record from the output of ``to_bytes``.
+
+        Args:
+            data (bytes): A serialized record
+
+        Returns:
+            PokemonRecord: The record
+        """
+        id, name, types, abilities, stats, sprite = json.loads(data)
+        return cls(
+            id=id,
+            name=sys.intern(name),
+            types=tuple(_intern_type(type_name, url) for type_name, url in types),
+            abilities=tuple(sys.intern(a) for a in abilities),
+            stats=PokemonStats(*stats) if stats else None,
+            sprite=sprite
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"PokemonRecord(id={self.id!r}, name={self.name!r})"
+
+# Header of entries in a shared backend: the time the entry was loaded
+_STORED_AT = struct.Struct("!d")
+
 class PokemonModel:
-    """Model for handling Pokemon data and caching."""
+    """Model for handling Pokemon data and caching.
+
+    The model is an LRU read-through cache in front of a loader such as
+    ``PokemonAPI.get_pokemon``. A Pokemon's name and numeric ID resolve to the
+    same canonical entry, so "pikachu" and "25" share one cached copy. Entries
+    are stored as compact ``PokemonRecord`` projections, not raw payloads.
+    The cache is bounded by an entry count and optionally by a byte budget;
+    each entry's size is measured once when it is inserted.
+
+    Entries older than the soft TTL are still served, and a background worker
+    reloads them; only entries older than the hard TTL make the caller wait on
+    the loader. Popular entries are reloaded ahead of the soft TTL. Without a
+    loader nothing can be refreshed, so the soft TTL is the expiry.
+
+    With a shared ``CacheBackend``, the in-process LRU becomes a near cache in
+    front of it: local misses are looked up in the backend before calling the
+    loader, and loaded entries are written to it under every alias, so all
+    workers share one copy and one miss per entry. Backend failures are
+    logged and treated as misses.
+    """
     
-    def __init__(self):
-        """Initialize the Pokemon model."""
-        self._cache: Dict[str, Dict] = {}  # name/id -> pokemon data
-        self._last_updated: Dict[str, datetime] = {}  # name/id -> last update time
-        self._cache_duration = 3600  # Cache duration in seconds (1 hour)
+    def __init__(self, loader: Optional[Callable[[Union[str, int]], Dict]] = None,
+                 max_entries: int = 1000, soft_ttl: float = 3600, hard_ttl: float = 86400,
+                 refresh_ahead: float = 0.8, popular_hits: int = 5, refresh_workers: int = 2,
+                 refresh_loader: Optional[Callable[[Union[str, int]], Dict]] = None,
+                 backend: Optional[CacheBackend] = None, max_bytes: Optional[int] = None):
+        """Initialize the Pokemon model.
+
+        Args:
+            loader (Optional[Callable]): Called with the name or ID on a cache miss
+            max_entries (int): Maximum number of Pokemon kept before LRU eviction
+            soft_ttl (float): Seconds after which an entry is refreshed in the background
+            hard_ttl (float): Seconds after which an entry is no longer served
+            refresh_ahead (float): Fraction of the soft TTL after which popular
+                entries are refreshed early
+            popular_hits (int): Hits since the last refresh that make an entry popular
+            refresh_workers (int): Number of background refresh threads
+            refresh_loader (Optional[Callable]): Called for background refreshes;
+                it should bypass any cache behind ``loader``. Defaults to ``loader``.
+            backend (Optional[CacheBackend]): Store shared with other processes,
+                consulted on local misses
+            max_bytes (Optional[int]): Memory budget of the local entries, measured
+                with ``PokemonRecord.memory_size`` at insertion; None for no budget
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if hard_ttl < soft_ttl:
+            raise ValueError("hard_ttl must not be shorter than soft_ttl")
+        self._loader = loader
+        self._refresh_loader = refresh_loader or loader
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entry_sizes: Dict[str, int] = {}  # canonical key -> measured size in bytes
+        self._bytes_used = 0
+        self._bytes_evicted = 0
+        self._backend = backend
+        self._cache: "OrderedDict[str, PokemonRecord]" = OrderedDict()  # canonical key -> record, LRU first
+        self._last_updated: Dict[str, datetime] = {}  # canonical key -> last update time
+        self._aliases: Dict[str, str] = {}  # name/id -> canonical key
+        self._entry_aliases: Dict[str, Set[str]] = {}  # canonical key -> names/ids pointing at it
+        self._entry_hits: Dict[str, int] = {}  # canonical key -> hits since last refresh
+        self._soft_ttl = soft_ttl
+        self._hard_ttl = hard_ttl
+        self._refresh_ahead = refresh_ahead
+        self._popular_hits = popular_hits
+        self._refresh_workers = refresh_workers
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[str] = set()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._shared_hits = 0
+        self._backend_errors = 0
     
+    @staticmethod
+    def _normalize(name_or_id: Union[str, int]) -> str:
+        """Normalize a name or ID into a lookup key."""
+        return str(name_or_id).strip().lower()
+
+    def _resolve(self, name_or_id: Union[str, int]) -> str:
+        """Resolve a name or ID to its canonical cache key."""
+        key = self._normalize(name_or_id)
+        return self._aliases.get(key, key)
+
     def _is_cache_valid(self, key: str) -> bool:
-        """Check if the cached data is still valid.
-        
+        """Check if the cached data can still be served.
+
         Args:
-            key (str): The cache key (Pokemon name or ID)
-            
+            key (str): The canonical cache key
+
         Returns:
-            bool: True if cache is valid, False otherwise
+            bool: True if the entry is younger than the hard TTL (or the soft TTL
+                when there is no loader to refresh it), False otherwise
         """
         if key not in self._last_updated:
             return False
-            
+
+        age = (datetime.now() - self._last_updated[key]).total_seconds()
+        return age < (self._hard_ttl if self._loader is not None else self._soft_ttl)
+
+    def _needs_refresh(self, key: str) -> bool:
+        """Check if a servable entry should be reloaded in the background. Caller holds the lock."""
+        if self._loader is None:
+            return False
         age = (datetime.now() - self._last_updated[key]).total_seconds()
-        return age < self._cache_duration
+        if age >= self._soft_ttl:
+            self._stale_hits += 1
+            return True
+        return (age >= self._soft_ttl * self._refresh_ahead
+                and self._entry_hits[key] >= self._popular_hits)
     
-    def get_pokemon(self, name_or_id: str) -> Optional[Dict]:
+    def get_pokemon(self, name_or_id: Union[str, int]) -> Optional[PokemonRecord]:
         """Get Pokemon data from cache if available and valid.
+
+        Stale entries are returned immediately and scheduled for a background refresh.
         
         Args:
-            name_or_id (str): The Pokemon name or ID
+            name_or_id (Union[str, int]): The Pokemon name or ID
             
         Returns:
-            Optional[Dict]: Pokemon data if in cache and valid, None otherwise
+            Optional[PokemonRecord]: Pokemon record if in cache and valid, None otherwise
+        """
+        with self._lock:
+            key = self._resolve(name_or_id)
+            cached = key in self._cache and self._is_cache_valid(key)
+            if cached:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                self._entry_hits[key] += 1
+                record = self._cache[key]
+                refresh = self._needs_refresh(key)
+
+        if not cached:
+            record = self._get_shared(name_or_id)
+            with self._lock:
+                if record is None:
+                    self._misses += 1
+                    return None
+                self._hits += 1
+                self._shared_hits += 1
+                key = self._resolve(name_or_id)
+                refresh = key in self._entry_hits and self._needs_refresh(key)
+        logger.debug(f"Retrieved {name_or_id} from cache")
+        if refresh:
+            self._schedule_refresh(key)
+        return record
+
+    def _ttl(self) -> float:
+        """Seconds an entry can be served for."""
+        return self._hard_ttl if self._loader is not None else self._soft_ttl
+
+    def _backend_failed(self, operation: str, error: Exception) -> None:
+        """Count and log a failed backend call."""
+        with self._lock:
+            self._backend_errors += 1
+        logger.warning(f"Shared cache {operation} failed: {str(error)}")
+
+    def _get_shared(self, name_or_id: Union[str, int]) -> Optional[PokemonRecord]:
+        """Look an entry up in the shared backend and keep it locally if still valid."""
+        if self._backend is None:
+            return None
+        try:
+            value = self._backend.get(self._normalize(name_or_id))
+        except Exception as e:
+            self._backend_failed("read", e)
+            return None
+        if value is None:
+            return None
+        (stored_at,) = _STORED_AT.unpack_from(value)
+        if time.time() - stored_at >= self._ttl():
+            return None
+        record = PokemonRecord.from_bytes(value[_STORED_AT.size:])
+        self._store(name_or_id, record, datetime.fromtimestamp(stored_at))
+        return record
+
+    def _put_shared(self, aliases: Set[str], record: PokemonRecord, updated_at: datetime) -> None:
+        """Write an entry to the shared backend under each of its aliases."""
+        if self._backend is None:
+            return
+        value = _STORED_AT.pack(updated_at.timestamp()) + record.to_bytes()
+        try:
+            self._backend.set_many(dict.fromkeys(aliases, value), self._ttl())
+        except Exception as e:
+            self._backend_failed("write", e)
+
+    def _schedule_refresh(self, key: str) -> None:
+        """Reload an entry on a background thread unless a reload is already pending."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers, thread_name_prefix="pokemon-refresh"
+                )
+            executor = self._refresh_executor
+            loaded_at = self._last_updated.get(key)
+        executor.submit(self._refresh, key, loaded_at)
+
+    def _refresh(self, key: str, loaded_at: Optional[datetime]) -> None:
+        """Reload an entry from the loader, keeping the stale copy on failure.
+
+        The result is dropped if the entry was removed or rewritten while the
+        loader ran, so a refresh never resurrects a discarded entry.
+        """
+        try:
+            data = self._refresh_loader(key)
+            if not isinstance(data, PokemonRecord):
+                data = PokemonRecord.from_api(data)
+            with self._lock:
+                if loaded_at is None or self._last_updated.get(key) is not loaded_at:
+                    logger.debug(f"Dropped background refresh of {key}; entry changed meanwhile")
+                    return
+                updated_at = datetime.now()
+                aliases = self._store(key, data, updated_at)
+                self._refreshes += 1
+            self._put_shared(aliases, data, updated_at)
+            logger.debug(f"Refreshed {key} in the background")
+        except Exception as e:
+            with self._lock:
+                self._refresh_failures += 1
+            logger.warning(f"Background refresh of {key} failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def fetch_pokemon(self, name_or_id: Union[str, int]) -> PokemonRecord:
+        """Get Pokemon data, loading and caching it on a miss.
+
+        Args:
+            name_or_id (Union[str, int]): The Pokemon name or ID
+
+        Returns:
+            PokemonRecord: The Pokemon record
+
+        Raises:
+            RuntimeError: If the data is not cached and no loader is configured
         """
-        if name_or_id in self._cache and self._is_cache_valid(name_or_id):
-            logger.info(f"Retrieved {name_or_id} from cache")
-            return self._cache[name_or_id]
-        return None
+        data = self.get_pokemon(name_or_id)
+        if data is not None:
+            return data
+        if self._loader is None:
+            raise RuntimeError("No loader configured for PokemonModel")
+        return self.cache_pokemon(name_or_id, self._loader(name_or_id))
     
-    def cache_pokemon(self, name_or_id: str, data: Dict) -> None:
+    def cache_pokemon(self, name_or_id: Union[str, int],
+                      data: Union[Dict, PokemonRecord]) -> PokemonRecord:
         """Cache Pokemon data.
+
+        The entry is stored under the Pokemon's name and is also reachable by its
+        ID and by the key it was requested with. It is also written to the
+        shared backend, if any.
         
         Args:
-            name_or_id (str): The Pokemon name or ID
-            data (Dict): The Pokemon data to cache
+            name_or_id (Union[str, int]): The Pokemon name or ID
+            data (Union[Dict, PokemonRecord]): The raw payload or record to cache
+
+        Returns:
+            PokemonRecord: The cached record
         """
-        self._cache[name_or_id] = data
-        self._last_updated[name_or_id] = datetime.now()
-        logger.info(f"Cached data for {name_or_id}")
+        if not isinstance(data, PokemonRecord):
+            data = PokemonRecord.from_api(data)
+        updated_at = datetime.now()
+        aliases = self._store(name_or_id, data, updated_at)
+        self._put_shared(aliases, data, updated_at)
+        return data
+
+    def _store(self, name_or_id: Union[str, int], data: PokemonRecord,
+               updated_at: datetime) -> Set[str]:
+        """Store a record in the local LRU, evicting as needed.
+
+        Returns:
+            Set[str]: The keys the entry is reachable by
+        """
+        requested = self._normalize(name_or_id)
+        key = self._normalize(data.name)
+        aliases = {key, requested}
+        if data.id is not None:
+            aliases.add(self._normalize(data.id))
+
+        with self._lock:
+            for alias in aliases:
+                previous = self._aliases.get(alias)
+                if previous is not None and previous != key:
+                    self._discard(previous)
+            size = data.memory_size()
+            self._bytes_used += size - self._entry_sizes.get(key, 0)
+            self._entry_sizes[key] = size
+            self._cache[key] = data
+            self._cache.move_to_end(key)
+            self._last_updated[key] = updated_at
+            self._entry_hits[key] = 0
+            self._entry_aliases.setdefault(key, set()).update(aliases)
+            for alias in aliases:
+                self._aliases[alias] = key
+
+            while len(self._cache) > self._max_entries or (
+                    self._max_bytes is not None and self._bytes_used > self._max_bytes):
+                oldest = next(iter(self._cache))
+                self._bytes_evicted += self._entry_sizes[oldest]
+                self._discard(oldest)
+                self._evictions += 1
+                logger.debug(f"Evicted {oldest} from cache")
+        logger.debug(f"Cached data for {key}")
+        return aliases
+
+    def _discard(self, key: str) -> None:
+        """Drop an entry and every alias pointing at it. Caller holds the lock."""
+        self._cache.pop(key, None)
+        self._bytes_used -= self._entry_sizes.pop(key, 0)
+        self._last_updated.pop(key, None)
+        self._entry_hits.pop(key, None)
+        for alias in self._entry_aliases.pop(key, set()):
+            if self._aliases.get(alias) == key:
+                del self._aliases[alias]
     
     def clear_cache(self) -> None:
-        """Clear the entire cache."""
-        self._cache.clear()
-        self._last_updated.clear()
+        """Clear the entire cache, including the shared backend."""
+        with self._lock:
+            self._cache.clear()
+            self._entry_sizes.clear()
+            self._bytes_used = 0
+            self._last_updated.clear()
+            self._entry_hits.clear()
+            self._aliases.clear()
+            self._entry_aliases.clear()
+        if self._backend is not None:
+            try:
+                self._backend.clear()
+            except Exception as e:
+                self._backend_failed("clear", e)
         logger.info("Cleared Pokemon cache")
     
-    def remove_from_cache(self, name_or_id: str) -> None:
+    def remove_from_cache(self, name_or_id: Union[str, int]) -> None:
         """Remove a Pokemon from the cache.
         
         Args:
-            name_or_id (str): The Pokemon name or ID to remove
+            name_or_id (Union[str, int]): The Pokemon name or ID to remove
         """
-        if name_or_id in self._cache:
-            del self._cache[name_or_id]
-            del self._last_updated[name_or_id]
-            logger.info(f"Removed {name_or_id} from cache")
+        with self._lock:
+            key = self._resolve(name_or_id)
+            aliases = {key, self._normalize(name_or_id)} | self._entry_aliases.get(key, set())
+            if key in self._cache:
+                self._discard(key)
+                logger.info(f"Removed {name_or_id} from cache")
+        if self._backend is None:
+            return
+        try:
+            value = self._backend.get(key)
+            if value is not None:
+                record = PokemonRecord.from_bytes(value[_STORED_AT.size:])
+                aliases.add(self._normalize(record.name))
+                if record.id is not None:
+                    aliases.add(self._normalize(record.id))
+            self._backend.delete(aliases)
+        except Exception as e:
+            self._backend_failed("delete", e)
     
     def get_cache_stats(self) -> Dict:
         """Get cache statistics.
         
         Returns:
-            Dict: Cache statistics including size and age of oldest entry
+            Dict: Cache statistics including size, capacity, bytes used and
+                evicted, hit/miss counts, hits served by the shared backend,
+                background refresh counts and age of oldest entry
         """
-        if not self._cache:
-            return {
-                "size": 0,
+        with self._lock:
+            stats = {
+                "size": len(self._cache),
+                "max_entries": self._max_entries,
+                "bytes_used": self._bytes_used,
+                "max_bytes": self._max_bytes,
+                "bytes_evicted": self._bytes_evicted,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "stale_hits": self._stale_hits,
+                "refreshes": self._refreshes,
+                "refresh_failures": self._refresh_failures,
+                "refreshes_pending": len(self._refreshing),
+                "backend": None if self._backend is None else type(self._backend).__name__,
+                "shared_hits": self._shared_hits,
+                "backend_errors": self._backend_errors,
                 "oldest_entry_age": 0
             }
-            
-        oldest_age = min(
-            (datetime.now() - timestamp).total_seconds()
-            for timestamp in self._last_updated.values()
-        )
-        
-        return {
-            "size": len(self._cache),
-            "oldest_entry_age": oldest_age
-        }
+            if self._cache:
+                stats["oldest_entry_age"] = min(
+                    (datetime.now() - timestamp).total_seconds()
+                    for timestamp in self._last_updated.values()
+                )
+        return stats
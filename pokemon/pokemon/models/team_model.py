@@ -0,0 +1,126 @@
+from dataclasses import fields
+from operator import attrgetter
+from typing import Dict, List, Sequence
+import logging
+
+import numpy as np
+
+from pokemon.models.pokemon_model import PokemonRecord, PokemonStats
+
+logger = logging.getLogger(__name__)
+
+# Column order of stat matrices, following the PokemonStats fields
+STAT_NAMES = tuple(field.name for field in fields(PokemonStats))
+_get_stats = attrgetter(*STAT_NAMES)
+
+
+def _pack(teams: Sequence[Sequence[PokemonRecord]]):
+    """Pack teams into arrays indexed by distinct Pokemon.
+
+    Each distinct Pokemon contributes one row to the stat and type matrices,
+    however many teams it appears in, and teams refer to rows by index.
+
+    Returns:
+        Tuple: Stat matrix (U x 6), row mask of Pokemon with stats (U), type
+            one-hot matrix (U x types), type names, and team index matrix
+            (teams x largest team), padded with -1
+    """
+    rows: Dict[int, int] = {}
+    members: List[PokemonRecord] = []
+    index = np.full((len(teams), max((len(team) for team in teams), default=0)), -1, dtype=np.intp)
+    for t, team in enumerate(teams):
+        for slot, pokemon in enumerate(team):
+            row = rows.get(pokemon.id)
+            if row is None:
+                row = rows[pokemon.id] = len(members)
+                members.append(pokemon)
+            index[t, slot] = row
+
+    stats = np.zeros((len(members), len(STAT_NAMES)), dtype=np.float64)
+    has_stats = np.zeros(len(members), dtype=bool)
+    type_names: Dict[str, int] = {}
+    type_rows, type_cols = [], []
+    for row, pokemon in enumerate(members):
+        if pokemon.stats is not None:
+            stats[row] = _get_stats(pokemon.stats)
+            has_stats[row] = True
+        for pokemon_type in pokemon.types:
+            type_rows.append(row)
+            type_cols.append(type_names.setdefault(pokemon_type.name, len(type_names)))
+    types = np.zeros((len(members), len(type_names)), dtype=np.int64)
+    types[type_rows, type_cols] = 1
+    return stats, has_stats, types, list(type_names), index
+
+
+def compare_teams(teams: Sequence[Sequence[PokemonRecord]]) -> List[Dict]:
+    """Compute aggregate analytics for many teams in one vectorized pass.
+
+    Stats of every distinct member are packed once into a matrix, and all
+    teams are gathered from it together, so evaluating hundreds of candidate
+    teams that share most members costs a few array operations. Members
+    without base stats count towards size and types but not stat aggregates.
+
+    Args:
+        teams (Sequence[Sequence[PokemonRecord]]): The teams to analyze
+
+    Returns:
+        List[Dict]: Analytics per team, in input order, each with ``size``,
+            ``stats`` (total, mean, min and max per stat, or None when no
+            member has stats), ``base_stat_total`` (sum of the mean stats)
+            and ``types`` (member count per type)
+    """
+    if not teams:
+        return []
+    stats, has_stats, types, type_names, index = _pack(teams)
+
+    present = index >= 0  # teams x slots
+    rows = np.where(present, index, 0)
+    counted = present & has_stats[rows]  # slots whose member has stats
+    gathered = stats[rows]  # teams x slots x stats
+    mask = counted[..., None]
+
+    counts = counted.sum(axis=1)
+    totals = np.where(mask, gathered, 0).sum(axis=1)
+    maxima = np.where(mask, gathered, -np.inf).max(axis=1, initial=-np.inf)
+    minima = np.where(mask, gathered, np.inf).min(axis=1, initial=np.inf)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = totals / counts[:, None]
+    type_counts = (types[rows] * present[..., None]).sum(axis=1)  # teams x types
+
+    results = []
+    for t in range(len(teams)):
+        result = {
+            "size": int(present[t].sum()),
+            "stats": None,
+            "base_stat_total": None,
+            "types": {
+                type_names[col]: int(type_counts[t, col])
+                for col in np.flatnonzero(type_counts[t])
+            }
+        }
+        if counts[t]:
+            result["stats"] = {
+                name: {
+                    "total": float(totals[t, col]),
+                    "mean": float(means[t, col]),
+                    "min": float(minima[t, col]),
+                    "max": float(maxima[t, col])
+                }
+                for col, name in enumerate(STAT_NAMES)
+            }
+            result["base_stat_total"] = float(means[t].sum())
+        results.append(result)
+    logger.debug(f"Compared {len(teams)} teams over {len(stats)} distinct Pokemon")
+    return results
+
+
+def analyze_team(team: Sequence[PokemonRecord]) -> Dict:
+    """Compute aggregate analytics for one team.
+
+    Args:
+        team (Sequence[PokemonRecord]): The team members
+
+    Returns:
+        Dict: The analytics, as described in ``compare_teams``
+    """
+    return compare_teams([team])[0]
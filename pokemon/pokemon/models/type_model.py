@@ -0,0 +1,202 @@
+from typing import Dict, List, Sequence
+import logging
+
+import numpy as np
+
+from pokemon.models.pokemon_model import PokemonRecord
+
+logger = logging.getLogger(__name__)
+
+# The 18 types, in matrix order
+TYPE_NAMES = (
+    "normal", "fire", "water", "electric", "grass", "ice", "fighting", "poison", "ground",
+    "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy"
+)
+
+# Attacking type -> defending types it hits for 2x, 0.5x and 0x. Every other
+# pairing is 1x. This is the chart PokeAPI serves under type/<name>, bundled so
+# scoring never has to fetch it.
+_SUPER_EFFECTIVE = {
+    "fire": ("grass", "ice", "bug", "steel"),
+    "water": ("fire", "ground", "rock"),
+    "electric": ("water", "flying"),
+    "grass": ("water", "ground", "rock"),
+    "ice": ("grass", "ground", "flying", "dragon"),
+    "fighting": ("normal", "ice", "rock", "dark", "steel"),
+    "poison": ("grass", "fairy"),
+    "ground": ("fire", "electric", "poison", "rock", "steel"),
+    "flying": ("grass", "fighting", "bug"),
+    "psychic": ("fighting", "poison"),
+    "bug": ("grass", "psychic", "dark"),
+    "rock": ("fire", "ice", "flying", "bug"),
+    "ghost": ("psychic", "ghost"),
+    "dragon": ("dragon",),
+    "dark": ("psychic", "ghost"),
+    "steel": ("ice", "rock", "fairy"),
+    "fairy": ("fighting", "dragon", "dark")
+}
+_NOT_VERY_EFFECTIVE = {
+    "normal": ("rock", "steel"),
+    "fire": ("fire", "water", "rock", "dragon"),
+    "water": ("water", "grass", "dragon"),
+    "electric": ("electric", "grass", "dragon"),
+    "grass": ("fire", "grass", "poison", "flying", "bug", "dragon", "steel"),
+    "ice": ("fire", "water", "ice", "steel"),
+    "fighting": ("poison", "flying", "psychic", "bug", "fairy"),
+    "poison": ("poison", "ground", "rock", "ghost"),
+    "ground": ("grass", "bug"),
+    "flying": ("electric", "rock", "steel"),
+    "psychic": ("psychic", "steel"),
+    "bug": ("fire", "fighting", "poison", "flying", "ghost", "steel", "fairy"),
+    "rock": ("fighting", "ground", "steel"),
+    "ghost": ("dark",),
+    "dragon": ("steel",),
+    "dark": ("fighting", "dark", "fairy"),
+    "steel": ("fire", "water", "electric", "steel"),
+    "fairy": ("fire", "poison", "steel")
+}
+_NO_EFFECT = {
+    "normal": ("ghost",),
+    "electric": ("ground",),
+    "fighting": ("ghost",),
+    "poison": ("steel",),
+    "ground": ("flying",),
+    "psychic": ("dark",),
+    "ghost": ("normal",),
+    "dragon": ("fairy",)
+}
+
+# Multipliers are clipped to this before taking logs, so immunities score as
+# a large but finite advantage
+_MIN_MULTIPLIER = 0.125
+
+
+class TypeChart:
+    """Type effectiveness chart as an 18x18 NumPy multiplier matrix.
+
+    Rows are attacking types and columns defending types. An extra column of
+    ones stands for an empty type slot, so the multipliers against a dual-type
+    Pokemon are the elementwise product of two columns, and single-type
+    Pokemon need no special case.
+    """
+
+    def __init__(self):
+        """Build the multiplier matrix from the bundled chart."""
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(TYPE_NAMES)}
+        self.none = len(TYPE_NAMES)  # index of the empty type slot
+        chart = np.ones((len(TYPE_NAMES), len(TYPE_NAMES) + 1))
+        for multiplier, table in ((2.0, _SUPER_EFFECTIVE), (0.5, _NOT_VERY_EFFECTIVE), (0.0, _NO_EFFECT)):
+            for attacker, defenders in table.items():
+                for defender in defenders:
+                    chart[self._index[attacker], self._index[defender]] = multiplier
+        chart.setflags(write=False)
+        self._chart = chart
+
+    @property
+    def multipliers(self) -> np.ndarray:
+        """The 18x18 matrix of attacking type (rows) against defending type (columns)."""
+        return self._chart[:, :self.none]
+
+    def type_indices(self, pokemon: Sequence[PokemonRecord]) -> np.ndarray:
+        """Map Pokemon to the matrix indices of their two type slots.
+
+        Types missing from the chart and empty slots map to the neutral index.
+
+        Args:
+            pokemon (Sequence[PokemonRecord]): The Pokemon
+
+        Returns:
+            np.ndarray: Index matrix of shape (len(pokemon), 2)
+        """
+        indices = np.full((len(pokemon), 2), self.none, dtype=np.intp)
+        for row, record in enumerate(pokemon):
+            for slot, pokemon_type in enumerate(record.types[:2]):
+                indices[row, slot] = self._index.get(pokemon_type.name, self.none)
+        return indices
+
+    def defense_profiles(self, type_indices: np.ndarray) -> np.ndarray:
+        """Get the multiplier every attacking type has against each Pokemon.
+
+        Args:
+            type_indices (np.ndarray): Type slot indices from ``type_indices``
+
+        Returns:
+            np.ndarray: Matrix of shape (Pokemon, 18)
+        """
+        return (self._chart[:, type_indices[:, 0]] * self._chart[:, type_indices[:, 1]]).T
+
+    def effectiveness(self, attacking_type: str, defender: PokemonRecord) -> float:
+        """Get the multiplier of an attacking type against a Pokemon.
+
+        Args:
+            attacking_type (str): Name of the attacking type
+            defender (PokemonRecord): The defending Pokemon
+
+        Returns:
+            float: The damage multiplier
+        """
+        profile = self.defense_profiles(self.type_indices([defender]))[0]
+        return float(profile[self._index[attacking_type]])
+
+    def _best_attack(self, attackers: np.ndarray, defenders: np.ndarray) -> np.ndarray:
+        """Best multiplier each attacker's own types reach against each defender.
+
+        Args:
+            attackers (np.ndarray): Type slot indices of the attackers (A x 2)
+            defenders (np.ndarray): Type slot indices of the defenders (D x 2)
+
+        Returns:
+            np.ndarray: Matrix of shape (D, A)
+        """
+        # Append a neutral attacking column so empty slots read as 1x
+        profiles = np.hstack([self.defense_profiles(defenders), np.ones((len(defenders), 1))])
+        reached = profiles[:, attackers]  # D x A x 2
+        typed = attackers != self.none
+        best = np.where(typed, reached, -np.inf).max(axis=2)
+        return np.where(typed.any(axis=1), best, 1.0)  # typeless attackers hit neutrally
+
+    def score_matchups(self, team: Sequence[PokemonRecord],
+                       opponents: Sequence[PokemonRecord]) -> Dict:
+        """Score a team against one or many opponents in a single vectorized pass.
+
+        Each member/opponent pair scores ``log2`` of the best multiplier the
+        member's types reach against the opponent, minus the same for the
+        opponent against the member, so +2 means the member hits super
+        effectively and resists the opponent. The best member for each
+        opponent is its counter, and the team score is the mean over opponents
+        of the counter's score.
+
+        Args:
+            team (Sequence[PokemonRecord]): The team members
+            opponents (Sequence[PokemonRecord]): The opposing Pokemon
+
+        Returns:
+            Dict: ``score`` and one entry per opponent in ``opponents`` with its
+                ``score``, ``best_counter`` and the ``threatened`` members it
+                hits super effectively
+
+        Raises:
+            ValueError: If the team or the opponents are empty
+        """
+        if not team or not opponents:
+            raise ValueError("Team and opponents must not be empty")
+        members = self.type_indices(team)
+        rivals = self.type_indices(opponents)
+
+        offense = self._best_attack(members, rivals)  # opponents x members
+        threat = self._best_attack(rivals, members).T  # opponents x members
+        scores = (np.log2(np.maximum(offense, _MIN_MULTIPLIER))
+                  - np.log2(np.maximum(threat, _MIN_MULTIPLIER)))
+        counters = scores.argmax(axis=1)
+        best = scores[np.arange(len(opponents)), counters]
+
+        results: List[Dict] = []
+        for j, opponent in enumerate(opponents):
+            results.append({
+                "opponent": opponent.name,
+                "score": float(best[j]),
+                "best_counter": team[counters[j]].name,
+                "threatened": [team[i].name for i in np.flatnonzero(threat[j] >= 2)]
+            })
+        logger.debug(f"Scored {len(team)} members against {len(opponents)} opponents")
+        return {"score": float(best.mean()), "opponents": results}
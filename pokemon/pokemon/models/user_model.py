@@ -1,11 +1,12 @@
-import hashlib
 import logging
-import os
+from typing import List, Optional, Tuple
 
 from flask_login import UserMixin
 from sqlalchemy.exc import IntegrityError
 
 from pokemon.db import db
+from pokemon.utils.cache_utils import TTLCache
+from pokemon.utils.password_utils import PasswordHasher
 
 import logging
 from pokemon.utils.logger import configure_logger
@@ -14,27 +15,54 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+class UserIdentity(UserMixin):
+    """Lightweight, detached stand-in for a logged-in user.
+
+    Holds only what request handlers need, so it can be cached across
+    requests without keeping ORM instances or sessions alive.
+    """
+
+    def __init__(self, id: int, username: str, password_version: int = 1):
+        self.id = id
+        self.username = username
+        self.password_version = password_version
+
+    def get_id(self) -> str:
+        return self.username
+
+
+# Identities of recently loaded users, keyed by username. Invalidation is per
+# process, so other workers may serve a changed user for up to the TTL.
+identity_cache = TTLCache(ttl=60)
+
+# Hashes and verifies passwords off the request threads; configured by create_app
+password_hasher = PasswordHasher()
+
+
 class Users(db.Model, UserMixin):
     __tablename__ = 'users'
 
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     salt = db.Column(db.String(32), nullable=False)  # 16-byte salt in hex
-    password = db.Column(db.String(64), nullable=False)  # SHA-256 hash in hex
+    password = db.Column(db.String(255), nullable=False)  # prefixed KDF hash, or legacy SHA-256 hex
+    # Bumped on every password change, revoking bearer tokens issued before it
+    password_version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
 
     @staticmethod
     def _generate_hashed_password(password: str) -> tuple[str, str]:
         """
-        Generates a salted, hashed password.
+        Generates a salted, hashed password with the configured KDF.
 
         Args:
             password (str): The password to hash.
 
         Returns:
-            tuple: A tuple containing the salt and hashed password.
+            tuple: A tuple containing the salt and hashed password. The hash
+                embeds its algorithm, cost and salt.
         """
-        salt = os.urandom(16).hex()
-        hashed_password = hashlib.sha256((password + salt).encode()).hexdigest()
+        hashed_password = password_hasher.hash(password)
+        salt = hashed_password.split("$")[2]
         return salt, hashed_password
 
     @classmethod
@@ -65,16 +93,72 @@ class Users(db.Model, UserMixin):
             raise
 
     @classmethod
-    def check_password(cls, username: str, password: str) -> bool:
+    def create_users(cls, credentials: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
         """
-        Check if a given password matches the stored password for a user.
+        Create many users in a single transaction.
+
+        Duplicates are found set-wise: repeats within the batch and usernames
+        that already exist, looked up with a few IN queries. Passwords are
+        hashed across all hashing workers, and the new rows are written with
+        one executemany INSERT.
+
+        Args:
+            credentials (List[Tuple[str, str]]): (username, password) pairs.
+
+        Returns:
+            Tuple[List[str], List[str]]: The created usernames, and the usernames
+                skipped because they already existed or were repeated.
+
+        Raises:
+            ValueError: If a username was taken concurrently; nothing is created.
+        """
+        passwords = {}
+        skipped = []
+        for username, password in credentials:
+            if username in passwords:
+                skipped.append(username)
+            else:
+                passwords[username] = password
+
+        existing = set()
+        usernames = list(passwords)
+        for start in range(0, len(usernames), 500):
+            existing.update(db.session.execute(
+                db.select(cls.username).where(cls.username.in_(usernames[start:start + 500]))
+            ).scalars())
+        skipped += [username for username in usernames if username in existing]
+        created = [username for username in usernames if username not in existing]
+
+        if created:
+            hashes = password_hasher.hash_many([passwords[username] for username in created])
+            rows = [
+                {"username": username, "salt": hashed.split("$")[2], "password": hashed}
+                for username, hashed in zip(created, hashes)
+            ]
+            try:
+                db.session.execute(db.insert(cls), rows)
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                logger.error("Bulk user creation raced with another writer")
+                raise ValueError("Some usernames were taken while creating users; retry the batch")
+        logger.info("Bulk created %d users, skipped %d", len(created), len(skipped))
+        return created, skipped
+
+    @classmethod
+    def authenticate(cls, username: str, password: str) -> Optional["Users"]:
+        """
+        Load a user and check their password with a single query.
+
+        A matching password stored with a legacy scheme or outdated cost is
+        rehashed with the current settings.
 
         Args:
             username (str): The username of the user.
             password (str): The password to check.
 
         Returns:
-            bool: True if the password is correct, False otherwise.
+            Optional[Users]: The user if the password is correct, None otherwise.
 
         Raises:
             ValueError: If the user does not exist.
@@ -83,8 +167,53 @@ class Users(db.Model, UserMixin):
         if not user:
             logger.info("User %s not found", username)
             raise ValueError(f"User {username} not found")
-        hashed_password = hashlib.sha256((password + user.salt).encode()).hexdigest()
-        return hashed_password == user.password
+        if not password_hasher.verify(password, user.password, user.salt):
+            return None
+        if password_hasher.needs_rehash(user.password):
+            user.salt, user.password = cls._generate_hashed_password(password)
+            db.session.commit()
+            logger.info("Rehashed password for user: %s", username)
+        return user
+
+    @classmethod
+    def check_password(cls, username: str, password: str) -> bool:
+        """
+        Check if a given password matches the stored password for a user.
+
+        Args:
+            username (str): The username of the user.
+            password (str): The password to check.
+
+        Returns:
+            bool: True if the password is correct, False otherwise.
+
+        Raises:
+            ValueError: If the user does not exist.
+        """
+        return cls.authenticate(username, password) is not None
+
+    @classmethod
+    def load_identity(cls, username: str) -> Optional[UserIdentity]:
+        """
+        Load the identity of a user, from the identity cache when possible.
+
+        Args:
+            username (str): The username of the user.
+
+        Returns:
+            Optional[UserIdentity]: The identity, or None if the user does not exist.
+        """
+        identity = identity_cache.get(username)
+        if identity is not None:
+            return identity
+        row = db.session.execute(
+            db.select(cls.id, cls.username, cls.password_version).where(cls.username == username)
+        ).first()
+        if row is None:
+            return None
+        identity = UserIdentity(row.id, row.username, row.password_version)
+        identity_cache.put(username, identity)
+        return identity
 
     @classmethod
     def delete_user(cls, username: str) -> None:
@@ -103,6 +232,7 @@ class Users(db.Model, UserMixin):
             raise ValueError(f"User {username} not found")
         db.session.delete(user)
         db.session.commit()
+        identity_cache.invalidate(username)
         logger.info("User %s deleted successfully", username)
 
     def get_id(self) -> str:
@@ -139,6 +269,9 @@ class Users(db.Model, UserMixin):
         """
         Update the password for a user.
 
+        The password version is bumped, so bearer tokens issued for the old
+        password stop being accepted.
+
         Args:
             username (str): The username of the user.
             new_password (str): The new password to set.
@@ -154,5 +287,7 @@ class Users(db.Model, UserMixin):
         salt, hashed_password = cls._generate_hashed_password(new_password)
         user.salt = salt
         user.password = hashed_password
+        user.password_version = cls.password_version + 1
         db.session.commit()
+        identity_cache.invalidate(username)
         logger.info("Password updated successfully for user: %s", username)
\ No newline at end of file
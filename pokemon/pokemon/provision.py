@@ -0,0 +1,94 @@
+"""Create many user accounts in one transaction.
+
+Usage:
+    python -m pokemon.provision --csv FILE
+    python -m pokemon.provision --count N [--prefix PREFIX] --password PASSWORD
+
+The CSV file holds one ``username,password`` pair per line. Generated
+accounts are named ``<prefix><n>`` for n from 1 to N and share one password,
+which is meant for seeding load tests. Usernames that already exist are
+skipped, so the command can be re-run safely.
+"""
+import argparse
+import csv
+import logging
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from pokemon.app import create_app
+from pokemon.models.user_model import Users
+from pokemon.utils.logger import configure_logger
+
+logger = logging.getLogger(__name__)
+
+
+def read_credentials(path: str) -> List[Tuple[str, str]]:
+    """Read ``username,password`` rows from a CSV file, skipping blank lines.
+
+    Args:
+        path (str): Path of the CSV file
+
+    Returns:
+        List[Tuple[str, str]]: The (username, password) pairs
+
+    Raises:
+        ValueError: If a row does not have exactly two non-empty fields
+    """
+    credentials = []
+    with open(path, newline="") as f:
+        for line, row in enumerate(csv.reader(f), start=1):
+            if not row:
+                continue
+            if len(row) != 2 or not row[0] or not row[1]:
+                raise ValueError(f"{path}:{line}: expected username,password")
+            credentials.append((row[0], row[1]))
+    return credentials
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Provision users from the command line.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, defaults to ``sys.argv``
+
+    Returns:
+        int: Process exit code, non-zero if the input was invalid or the batch failed
+    """
+    parser = argparse.ArgumentParser(description="Create many user accounts at once.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", help="file of username,password rows")
+    source.add_argument("--count", type=int, help="number of accounts to generate")
+    parser.add_argument("--prefix", default="user", help="username prefix of generated accounts (default: user)")
+    parser.add_argument("--password", help="password of generated accounts")
+    args = parser.parse_args(argv)
+
+    configure_logger(logger)
+    if args.csv:
+        try:
+            credentials = read_credentials(args.csv)
+        except (OSError, ValueError) as e:
+            logger.error(f"Cannot read credentials: {e}")
+            return 1
+    else:
+        if not args.password:
+            parser.error("--password is required with --count")
+        credentials = [(f"{args.prefix}{n}", args.password) for n in range(1, args.count + 1)]
+
+    app = create_app()
+    with app.app_context():
+        start = time.monotonic()
+        try:
+            created, skipped = Users.create_users(credentials)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+    logger.info(
+        f"Provisioned {len(created)} users in {time.monotonic() - start:.1f}s, "
+        f"skipped {len(skipped)} existing or repeated"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
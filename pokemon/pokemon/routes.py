@@ -1,19 +1,65 @@
 from flask import Blueprint, jsonify, request, make_response
 from flask_login import login_required, current_user
+import asyncio
+import hashlib
 import logging
 
 from pokemon.api import PokemonAPI
-from pokemon.models.favorites_model import FavoritesModel
+from pokemon.async_api import AsyncPokemonAPI
+from pokemon.config import Config
+from pokemon.models.evolution_model import EvolutionModel
+from pokemon.models.favorites_model import FavoritesModel, SqlFavoritesModel
+from pokemon.models.pokemon_model import PokemonModel
+from pokemon.models.team_model import analyze_team, compare_teams
+from pokemon.models.type_model import TypeChart
+from pokemon.utils.api_utils import CircuitBreaker
+from pokemon.utils.cache_utils import create_cache_backend
+from pokemon.utils.sql_utils import ResponseCache
 
 logger = logging.getLogger(__name__)
 
 # Initialize API and models
-pokemon_api = PokemonAPI()
-favorites_model = FavoritesModel()
+pokemon_api = PokemonAPI(
+    cache=ResponseCache(Config.POKEAPI_CACHE_PATH) if Config.POKEAPI_CACHE_PATH else None,
+    revalidate_after=Config.POKEAPI_CACHE_REVALIDATE_AFTER,
+    pool_maxsize=Config.POKEAPI_POOL_SIZE,
+    timeout=(Config.POKEAPI_CONNECT_TIMEOUT, Config.POKEAPI_READ_TIMEOUT),
+    retries=Config.POKEAPI_RETRIES,
+    circuit_breaker=CircuitBreaker(Config.POKEAPI_BREAKER_THRESHOLD, Config.POKEAPI_BREAKER_RESET),
+    hedge=Config.POKEAPI_HEDGE
+)
+pokemon_model = PokemonModel(
+    pokemon_api.get_pokemon,
+    refresh_loader=lambda name_or_id: pokemon_api.get_pokemon(name_or_id, revalidate=True),
+    max_entries=Config.POKEMON_CACHE_MAX_ENTRIES,
+    max_bytes=Config.POKEMON_CACHE_MAX_BYTES or None,
+    soft_ttl=Config.POKEMON_CACHE_SOFT_TTL,
+    hard_ttl=Config.POKEMON_CACHE_HARD_TTL,
+    backend=create_cache_backend(Config.POKEMON_CACHE_BACKEND, Config.POKEMON_CACHE_URL)
+)
+async_pokemon_api = AsyncPokemonAPI(pokemon_api, max_concurrency=Config.POKEAPI_POOL_SIZE)
+evolution_model = EvolutionModel(pokemon_api)
+favorites_model = SqlFavoritesModel() if Config.FAVORITES_BACKEND == 'sql' else FavoritesModel()
+type_chart = TypeChart()
+
+# Largest number of items accepted by the batch favorites endpoint
+MAX_BATCH_SIZE = 100
+# Largest number of candidate teams accepted by the team comparison endpoint
+MAX_COMPARE_TEAMS = 1000
 
 # Create blueprint
 pokemon_bp = Blueprint('pokemon', __name__)
 
+def _resolve_pokemon(names_or_ids):
+    """Resolve Pokemon concurrently through the cache.
+
+    Returns a list aligned with the input holding a record or the exception
+    raised while loading it.
+    """
+    return asyncio.run(async_pokemon_api.get_pokemon_many(
+        names_or_ids, loader=pokemon_model.fetch_pokemon, return_exceptions=True
+    ))
+
 @pokemon_bp.route('/healthcheck', methods=['GET'])
 def healthcheck():
     """Health check endpoint."""
@@ -25,10 +71,15 @@ def healthcheck():
 @pokemon_bp.route('/pokemon/<name_or_id>', methods=['GET'])
 @login_required
 def get_pokemon(name_or_id):
-    """Get information about a specific Pokemon."""
+    """Get information about a specific Pokemon.
+
+    Returns the compact cached record; pass ``full=true`` for the raw PokeAPI payload.
+    """
     try:
-        pokemon = pokemon_api.get_pokemon(name_or_id)
-        return jsonify(pokemon)
+        if request.args.get('full', '').lower() in ('1', 'true', 'yes'):
+            return jsonify(pokemon_api.get_pokemon(name_or_id))
+        pokemon = pokemon_model.fetch_pokemon(name_or_id)
+        return jsonify(pokemon.to_dict())
     except Exception as e:
         logger.error(f"Error getting Pokemon {name_or_id}: {str(e)}")
         return make_response(jsonify({
@@ -36,15 +87,80 @@ def get_pokemon(name_or_id):
             "message": f"Error getting Pokemon: {str(e)}"
         }), 500)
 
+@pokemon_bp.route('/search', methods=['GET'])
+@login_required
+def search_pokemon():
+    """Search Pokemon by name."""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return make_response(jsonify({
+            "status": "error",
+            "message": "q is required"
+        }), 400)
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+
+    try:
+        results = pokemon_api.search_pokemon(query, limit)
+        return jsonify({
+            "status": "success",
+            "results": results
+        })
+    except Exception as e:
+        logger.error(f"Error searching Pokemon for {query}: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"Error searching Pokemon: {str(e)}"
+        }), 500)
+
 @pokemon_bp.route('/favorites', methods=['GET'])
 @login_required
 def get_favorites():
-    """Get all favorite Pokemon for the current user."""
-    favorites = favorites_model.get_favorites(current_user.username)
-    return jsonify({
+    """Get a page of favorite Pokemon for the current user.
+
+    Query parameters ``limit`` (default 50, at most 200) and ``after`` (the
+    ``next_cursor`` of the previous page) select the page. The response has a
+    strong ETag; a matching ``If-None-Match`` gets a 304 without a body.
+    """
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+    after = request.args.get('after', type=int)
+    username = current_user.username
+
+    version = favorites_model.get_version(username)
+    etag = hashlib.sha256(f"{username}:{version}:{limit}:{after}".encode()).hexdigest()[:32]
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+        return response
+
+    favorites, next_cursor = favorites_model.get_favorites_page(username, limit, after)
+    response = jsonify({
         "status": "success",
-        "favorites": favorites
+        "favorites": [pokemon.to_dict() for pokemon in favorites],
+        "next_cursor": next_cursor
     })
+    response.set_etag(etag)
+    return response
+
+@pokemon_bp.route('/favorites/top', methods=['GET'])
+def top_favorites():
+    """Get the Pokemon favorited by the most users.
+
+    Query parameter ``k`` (default 10, at most 100) sets how many to return.
+    Counts are maintained as favorites change, so this does not scan users.
+    """
+    k = min(max(request.args.get('k', 10, type=int), 1), 100)
+    try:
+        top = favorites_model.get_top_favorites(k)
+        return jsonify({
+            "status": "success",
+            "top": [{"pokemon": pokemon.to_dict(), "count": count} for pokemon, count in top]
+        })
+    except Exception as e:
+        logger.error(f"Error getting top favorites: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"Error getting top favorites: {str(e)}"
+        }), 500)
 
 @pokemon_bp.route('/favorites', methods=['POST'])
 @login_required
@@ -58,16 +174,16 @@ def add_favorite():
         }), 400)
         
     try:
-        pokemon = pokemon_api.get_pokemon(data['pokemon_id'])
+        pokemon = pokemon_model.fetch_pokemon(data['pokemon_id'])
         if favorites_model.add_favorite(current_user.username, pokemon):
             return jsonify({
                 "status": "success",
-                "message": f"Added {pokemon['name']} to favorites"
+                "message": f"Added {pokemon.name} to favorites"
             })
         else:
             return make_response(jsonify({
                 "status": "error",
-                "message": f"{pokemon['name']} is already in favorites"
+                "message": f"{pokemon.name} is already in favorites"
             }), 400)
     except Exception as e:
         logger.error(f"Error adding favorite: {str(e)}")
@@ -76,6 +192,170 @@ def add_favorite():
             "message": f"Error adding favorite: {str(e)}"
         }), 500)
 
+@pokemon_bp.route('/favorites/batch', methods=['POST'])
+@login_required
+def batch_favorites():
+    """Add and remove several favorites at once.
+
+    Expected JSON Input:
+        - add (List[int|str]): IDs or names of Pokemon to add
+        - remove (List[int]): IDs of Pokemon to remove
+
+    Pokemon to add are resolved concurrently through the cache, then all
+    changes are applied together, removals first. The response lists a status
+    per item in the same order: removals, then additions, as submitted.
+    """
+    data = request.get_json(silent=True) or {}
+    to_add = data.get('add', [])
+    to_remove = data.get('remove', [])
+    if (not isinstance(to_add, list) or not isinstance(to_remove, list)
+            or not all(isinstance(pokemon_id, int) for pokemon_id in to_remove)):
+        return make_response(jsonify({
+            "status": "error",
+            "message": "add must be a list of Pokemon IDs or names and remove a list of Pokemon IDs"
+        }), 400)
+    if len(to_add) + len(to_remove) > MAX_BATCH_SIZE:
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"At most {MAX_BATCH_SIZE} items per batch"
+        }), 400)
+
+    try:
+        resolved = _resolve_pokemon(to_add)
+        records = [pokemon for pokemon in resolved if not isinstance(pokemon, Exception)]
+        applied = iter(favorites_model.apply_batch(current_user.username, records, to_remove))
+
+        # Removals come first, then additions, each in submitted order with
+        # failed lookups left in place
+        results = [next(applied) for _ in to_remove]
+        for name_or_id, pokemon in zip(to_add, resolved):
+            if isinstance(pokemon, Exception):
+                results.append({"pokemon_id": name_or_id, "action": "add",
+                                "status": "error", "message": str(pokemon)})
+            else:
+                results.append(next(applied))
+        return jsonify({
+            "status": "success",
+            "results": results
+        })
+    except Exception as e:
+        logger.error(f"Error applying favorites batch: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"Error applying favorites batch: {str(e)}"
+        }), 500)
+
+@pokemon_bp.route('/favorites/team', methods=['GET'])
+@login_required
+def get_favorites_team():
+    """Get aggregate stat and type analytics for the current user's favorites."""
+    try:
+        team = favorites_model.get_favorites(current_user.username)
+        return jsonify({
+            "status": "success",
+            "team": analyze_team(team)
+        })
+    except Exception as e:
+        logger.error(f"Error analyzing favorites team: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"Error analyzing favorites team: {str(e)}"
+        }), 500)
+
+@pokemon_bp.route('/teams/compare', methods=['POST'])
+@login_required
+def compare_candidate_teams():
+    """Compare many candidate teams in one batched computation.
+
+    Expected JSON Input:
+        - teams (List[List[int|str]]): Teams as lists of Pokemon IDs or names
+
+    Every distinct Pokemon is resolved once, concurrently, and all teams are
+    analyzed together. Results are returned in input order.
+    """
+    data = request.get_json(silent=True) or {}
+    teams = data.get('teams')
+    if (not isinstance(teams, list) or not teams
+            or not all(isinstance(team, list) for team in teams)):
+        return make_response(jsonify({
+            "status": "error",
+            "message": "teams must be a non-empty list of lists of Pokemon IDs or names"
+        }), 400)
+    members = list(dict.fromkeys(str(member).lower() for team in teams for member in team))
+    if len(teams) > MAX_COMPARE_TEAMS or len(members) > MAX_BATCH_SIZE:
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"At most {MAX_COMPARE_TEAMS} teams and {MAX_BATCH_SIZE} distinct Pokemon per request"
+        }), 400)
+
+    try:
+        resolved = dict(zip(members, _resolve_pokemon(members)))
+        failed = [member for member, pokemon in resolved.items() if isinstance(pokemon, Exception)]
+        if failed:
+            return make_response(jsonify({
+                "status": "error",
+                "message": f"Could not resolve Pokemon: {', '.join(failed)}"
+            }), 404)
+        candidates = [[resolved[str(member).lower()] for member in team] for team in teams]
+        return jsonify({
+            "status": "success",
+            "teams": compare_teams(candidates)
+        })
+    except Exception as e:
+        logger.error(f"Error comparing teams: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"Error comparing teams: {str(e)}"
+        }), 500)
+
+@pokemon_bp.route('/favorites/matchups', methods=['POST'])
+@login_required
+def score_favorites_matchups():
+    """Score the current user's favorites against one or many opponents.
+
+    Expected JSON Input:
+        - opponents (List[int|str]): IDs or names of the opposing Pokemon
+
+    Scoring uses the bundled type chart, so no type data is fetched.
+    """
+    data = request.get_json(silent=True) or {}
+    opponents = data.get('opponents')
+    if not isinstance(opponents, list) or not opponents:
+        return make_response(jsonify({
+            "status": "error",
+            "message": "opponents must be a non-empty list of Pokemon IDs or names"
+        }), 400)
+    if len(opponents) > MAX_BATCH_SIZE:
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"At most {MAX_BATCH_SIZE} opponents per request"
+        }), 400)
+
+    try:
+        team = favorites_model.get_favorites(current_user.username)
+        if not team:
+            return make_response(jsonify({
+                "status": "error",
+                "message": "Add favorites before scoring matchups"
+            }), 400)
+        resolved = _resolve_pokemon(opponents)
+        failed = [str(opponent) for opponent, pokemon in zip(opponents, resolved) if isinstance(pokemon, Exception)]
+        if failed:
+            return make_response(jsonify({
+                "status": "error",
+                "message": f"Could not resolve Pokemon: {', '.join(failed)}"
+            }), 404)
+        return jsonify({
+            "status": "success",
+            **type_chart.score_matchups(team, resolved)
+        })
+    except Exception as e:
+        logger.error(f"Error scoring matchups: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": f"Error scoring matchups: {str(e)}"
+        }), 500)
+
 @pokemon_bp.route('/favorites/<int:pokemon_id>', methods=['DELETE'])
 @login_required
 def remove_favorite(pokemon_id):
@@ -94,10 +374,10 @@ def remove_favorite(pokemon_id):
 @pokemon_bp.route('/evolutions/<int:pokemon_id>', methods=['GET'])
 @login_required
 def get_evolutions(pokemon_id):
-    """Get evolution chain for a Pokemon."""
+    """Get the evolution chain a Pokemon belongs to."""
     try:
-        evolution_chain = pokemon_api.get_evolution_chain(pokemon_id)
-        return jsonify(evolution_chain)
+        evolution_chain = evolution_model.get_chain_for_pokemon(pokemon_id)
+        return jsonify(evolution_chain.to_dict())
     except Exception as e:
         logger.error(f"Error getting evolution chain: {str(e)}")
         return make_response(jsonify({
@@ -0,0 +1,214 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional
+
+import requests
+
+
+class _Call:
+    """An in-flight call whose outcome is shared with waiting callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight block until it finishes and receive the same result or exception.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` for ``key`` unless an identical call is already in flight.
+
+        Args:
+            key (Hashable): Identifies calls that may share a result
+            fn (Callable[[], Any]): The function to run
+
+        Returns:
+            Any: The result of ``fn``, possibly computed by another thread
+
+        Raises:
+            Exception: Whatever ``fn`` raised for the leading caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counts of executed and coalesced calls.
+
+        Returns:
+            Dict[str, int]: Number of executions, coalesced calls and calls in flight
+        """
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls)
+            }
+
+
+class RateLimiter:
+    """Space out calls so that at most ``rate`` of them start per second.
+
+    The limiter is shared between threads; each ``acquire`` reserves the next
+    free slot and sleeps until it arrives.
+    """
+
+    def __init__(self, rate: float):
+        """Initialize the rate limiter.
+
+        Args:
+            rate (float): Maximum number of calls per second
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until the caller may make its next call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling an upstream that the circuit breaker has marked unhealthy."""
+
+
+class CircuitBreaker:
+    """Stop calling an unhealthy upstream until it has had time to recover.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls. Once ``reset_timeout`` seconds have passed it lets a single
+    trial call through (half-open); success closes it, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker
+            reset_timeout (float): Seconds to stay open before allowing a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """The breaker state: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._trial_in_flight or time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Check whether a call may be made, reserving the trial call if half-open.
+
+        Returns:
+            bool: True if the call may proceed, False if it should fail fast
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial_in_flight and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker at the threshold or after a failed trial."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class LatencyTracker:
+    """Rolling window of request latencies for percentile estimates."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """Initialize the tracker.
+
+        Args:
+            window (int): Number of most recent samples kept
+            min_samples (int): Samples required before percentiles are reported
+        """
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Record a latency sample."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get a latency percentile over the window.
+
+        Args:
+            pct (float): The percentile, between 0 and 100
+
+        Returns:
+            Optional[float]: The latency in seconds, or None with too few samples
+        """
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
@@ -0,0 +1,398 @@
+import logging
+import socket
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackendError(Exception):
+    """Raised when a cache backend cannot complete an operation."""
+
+
+class TTLCache:
+    """Small in-process LRU mapping whose entries expire a fixed time after insertion.
+
+    Counts hits and misses, and is safe to share between threads.
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 10000):
+        """Initialize the cache.
+
+        Args:
+            ttl (float): Seconds an entry is served for
+            max_entries (int): Maximum number of entries kept before LRU eviction
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value, or None if it is absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a value; missing keys are ignored."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every value."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get the size, hit, miss and invalidation counts of the cache."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations
+            }
+
+
+class CacheBackend(ABC):
+    """Byte store with per-entry expiry, shared by ``PokemonModel`` instances.
+
+    Implementations only move opaque values; serialization is up to the
+    caller. A backend living outside the process lets every worker share one
+    copy of each entry.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value, or None if it is absent or expired."""
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, bytes], ttl: float) -> None:
+        """Store several values expiring after ``ttl`` seconds, in one round trip."""
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> None:
+        """Delete values; missing keys are ignored."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete every value owned by this backend."""
+
+    def close(self) -> None:
+        """Release connections held by the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Backend holding values in a dictionary of the current process.
+
+    Shares entries between the ``PokemonModel`` instances of one process, but
+    not between workers; it exercises the shared-cache path without an
+    external store.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._values: Dict[str, tuple] = {}  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._values[key]
+                return None
+            return entry[0]
+
+    def set_many(self, items: Dict[str, bytes], ttl: float) -> None:
+        expires_at = time.time() + ttl
+        with self._lock:
+            for key, value in items.items():
+                self._values[key] = (value, expires_at)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Backend storing values in a SQLite file shared by every process on the host.
+
+    The database is opened lazily in WAL mode, so readers in other workers
+    are not blocked by a writer. Expired rows are purged on write.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the backend.
+
+        Args:
+            path (str): Path of the SQLite file holding the values
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed. Caller holds the lock."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pokemon_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_pokemon_cache_expires ON pokemon_cache (expires_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM pokemon_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def set_many(self, items: Dict[str, bytes], ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM pokemon_cache WHERE expires_at <= ?", (now,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO pokemon_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, value, now + ttl) for key, value in items.items()]
+            )
+            conn.commit()
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM pokemon_cache WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM pokemon_cache")
+            conn.commit()
+        logger.info("Cleared Pokemon cache at %s", self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _RespConnection:
+    """A socket speaking the Redis serialization protocol (RESP2)."""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+
+    @staticmethod
+    def _encode(command: tuple) -> bytes:
+        parts = [b"*%d\r\n" % len(command)]
+        for arg in command:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read_reply(self):
+        """Read one reply. Error replies are returned, not raised, so a pipeline can be drained."""
+        line = self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            return CacheBackendError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            return self.reader.read(length + 2)[:-2]
+        if kind == b"*":
+            length = int(body)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+    def execute(self, *commands: tuple) -> List:
+        """Send commands in one pipeline and read all their replies.
+
+        Raises:
+            CacheBackendError: If any command failed, after all replies are read
+        """
+        self.sock.sendall(b"".join(self._encode(command) for command in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, CacheBackendError):
+                raise reply
+        return replies
+
+    def close(self) -> None:
+        self.reader.close()
+        self.sock.close()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend storing values on a Redis-compatible server shared by every worker.
+
+    Speaks RESP directly over a small pool of sockets, so no client library
+    is needed. Keys are namespaced with a prefix, which also scopes ``clear``.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "pokemon:",
+                 timeout: float = 1.0, max_connections: int = 10):
+        """Initialize the backend.
+
+        Args:
+            url (str): Server URL, ``redis://[:password@]host[:port][/db]``
+            prefix (str): Prefix of every key written by this backend
+            timeout (float): Socket timeout in seconds
+            max_connections (int): Most idle connections kept for reuse
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.password = parsed.password
+        self.prefix = prefix
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle: List[_RespConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> _RespConnection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        conn = _RespConnection(self.host, self.port, self.timeout)
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            conn.execute(*setup)
+        return conn
+
+    def _execute(self, *commands: tuple) -> List:
+        """Run commands on a pooled connection, discarding the connection on I/O errors."""
+        try:
+            conn = self._acquire()
+        except OSError as e:
+            raise CacheBackendError(f"Cannot connect to cache server: {e}") from e
+        try:
+            replies = conn.execute(*commands)
+        except OSError as e:
+            conn.close()
+            raise CacheBackendError(str(e)) from e
+        except CacheBackendError:
+            self._release(conn)
+            raise
+        self._release(conn)
+        return replies
+
+    def _release(self, conn: _RespConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            if len(self._idle) < self.max_connections:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._execute(("GET", self.prefix + key))[0]
+
+    def set_many(self, items: Dict[str, bytes], ttl: float) -> None:
+        ttl_ms = max(int(ttl * 1000), 1)
+        self._execute(*[("SET", self.prefix + key, value, "PX", ttl_ms) for key, value in items.items()])
+
+    def delete(self, keys: Iterable[str]) -> None:
+        keys = [self.prefix + key for key in keys]
+        if keys:
+            self._execute(("DEL", *keys))
+
+    def clear(self) -> None:
+        cursor = b"0"
+        while True:
+            cursor, keys = self._execute(("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 500))[0]
+            if keys:
+                self._execute(("DEL", *keys))
+            if cursor == b"0":
+                break
+        logger.info("Cleared Pokemon cache on %s:%s", self.host, self.port)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def create_cache_backend(kind: str, url: str = "") -> Optional[CacheBackend]:
+    """Create the shared cache backend selected in the configuration.
+
+    Args:
+        kind (str): ``none`` for no shared backend, ``memory``, ``sqlite`` or ``redis``
+        url (str): SQLite file path or Redis URL; empty for the default
+
+    Returns:
+        Optional[CacheBackend]: The backend, or None when each model caches on its own
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return MemoryCacheBackend()
+    if kind == "sqlite":
+        return SqliteCacheBackend(url or "pokemon_cache.db")
+    if kind == "redis":
+        return RedisCacheBackend(url or "redis://localhost:6379/0")
+    raise ValueError(f"Unknown cache backend: {kind}")
@@ -0,0 +1,102 @@
+import bisect
+import heapq
+import threading
+from typing import Dict, Hashable, List, Tuple
+
+
+class Leaderboard:
+    """Counter that keeps its keys ranked as counts change.
+
+    Keys are grouped into buckets by count, and the distinct counts are kept
+    in a sorted list. Changing a count moves one key between two buckets, so
+    updates cost O(log D) for D distinct counts, and the top K entries are read
+    from the highest buckets without scanning every key. Safe to share between
+    threads.
+    """
+
+    def __init__(self):
+        """Initialize an empty leaderboard."""
+        self._counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, Dict[Hashable, None]] = {}  # count -> keys with that count
+        self._levels: List[int] = []  # distinct counts, ascending
+        self._lock = threading.Lock()
+
+    def _move(self, key: Hashable, old: int, new: int) -> None:
+        """Move a key from the bucket of its old count to that of its new count."""
+        if old:
+            bucket = self._buckets[old]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[old]
+                del self._levels[bisect.bisect_left(self._levels, old)]
+        if new:
+            bucket = self._buckets.get(new)
+            if bucket is None:
+                bucket = self._buckets[new] = {}
+                bisect.insort(self._levels, new)
+            bucket[key] = None
+            self._counts[key] = new
+        else:
+            self._counts.pop(key, None)
+
+    def increment(self, key: Hashable, amount: int = 1) -> int:
+        """Increase the count of a key.
+
+        Args:
+            key (Hashable): The key to count
+            amount (int): How much to add
+
+        Returns:
+            int: The new count
+        """
+        with self._lock:
+            old = self._counts.get(key, 0)
+            self._move(key, old, old + amount)
+            return old + amount
+
+    def decrement(self, key: Hashable, amount: int = 1) -> int:
+        """Decrease the count of a key, forgetting it when it reaches zero.
+
+        Args:
+            key (Hashable): The key to count
+            amount (int): How much to subtract
+
+        Returns:
+            int: The new count
+
+        Raises:
+            ValueError: If the count would drop below zero
+        """
+        with self._lock:
+            old = self._counts.get(key, 0)
+            if amount > old:
+                raise ValueError(f"Count of {key!r} cannot drop below zero")
+            self._move(key, old, old - amount)
+            return old - amount
+
+    def count(self, key: Hashable) -> int:
+        """Get the count of a key, 0 if it was never counted."""
+        return self._counts.get(key, 0)
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        """Get the K keys with the highest counts.
+
+        Ties are ordered by key.
+
+        Args:
+            k (int): Number of entries to return
+
+        Returns:
+            List[Tuple[Hashable, int]]: (key, count) pairs, highest count first
+        """
+        result = []
+        with self._lock:
+            for level in reversed(self._levels):
+                if len(result) >= k:
+                    break
+                for key in heapq.nsmallest(k - len(result), self._buckets[level]):
+                    result.append((key, level))
+        return result
+
+    def __len__(self) -> int:
+        return len(self._counts)
@@ -0,0 +1,216 @@
+import hashlib
+import hmac
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ALGORITHMS = ("pbkdf2_sha256", "scrypt")
+
+
+class HasherBusyError(RuntimeError):
+    """Raised when too many hashing jobs are already waiting for a worker."""
+
+
+def _derive(algorithm: str, password: str, salt: bytes, params: Dict[str, int]) -> str:
+    """Derive a key from a password. Runs in a worker process."""
+    if algorithm == "pbkdf2_sha256":
+        key = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, params["i"])
+    elif algorithm == "scrypt":
+        key = hashlib.scrypt(password.encode(), salt=salt, n=params["n"], r=params["r"],
+                             p=params["p"], maxmem=params["n"] * params["r"] * 256)
+    else:
+        raise ValueError(f"Unknown password hash algorithm: {algorithm}")
+    return key.hex()
+
+
+def _format_params(params: Dict[str, int]) -> str:
+    return ",".join(f"{name}={value}" for name, value in params.items())
+
+
+def _parse_params(text: str) -> Dict[str, int]:
+    return {name: int(value) for name, value in (item.split("=") for item in text.split(","))}
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords with a work-factor KDF in worker processes.
+
+    Hashes are stored as ``<algorithm>$<params>$<salt hex>$<key hex>``, for
+    example ``pbkdf2_sha256$i=600000$...$...``, so the cost can be raised
+    without invalidating existing hashes. Bare 64-character hex strings are
+    legacy salted SHA-256 hashes, which ``needs_rehash`` reports for upgrade.
+
+    Key derivation runs in a bounded process pool, so a burst of logins uses
+    at most ``workers`` cores and never holds the GIL of request threads. At
+    most ``max_pending`` jobs wait for a worker; beyond that ``HasherBusyError``
+    is raised instead of letting login latency grow without bound. With
+    ``workers=0`` hashing runs inline, which is meant for tests and scripts.
+    """
+
+    def __init__(self, algorithm: str = "pbkdf2_sha256", iterations: int = 600000,
+                 scrypt_n: int = 2 ** 14, workers: int = 2, max_pending: Optional[int] = None,
+                 timeout: float = 10.0):
+        """Initialize the hasher.
+
+        Args:
+            algorithm (str): ``pbkdf2_sha256`` or ``scrypt``
+            iterations (int): PBKDF2 iteration count
+            scrypt_n (int): scrypt CPU/memory cost, a power of two
+            workers (int): Number of worker processes, 0 to hash inline
+            max_pending (Optional[int]): Most jobs queued or running at once;
+                defaults to four per worker
+            timeout (float): Seconds to wait for a queue slot and for a result
+        """
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.configure(algorithm, iterations, scrypt_n, workers, max_pending, timeout)
+
+    def configure(self, algorithm: str = "pbkdf2_sha256", iterations: int = 600000,
+                  scrypt_n: int = 2 ** 14, workers: int = 2, max_pending: Optional[int] = None,
+                  timeout: float = 10.0) -> None:
+        """Change the hashing parameters, restarting the worker pool.
+
+        Takes the same arguments as the constructor.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown password hash algorithm: {algorithm}")
+        self.close()
+        self.algorithm = algorithm
+        if algorithm == "pbkdf2_sha256":
+            self.params = {"i": iterations}
+        else:
+            self.params = {"n": scrypt_n, "r": 8, "p": 1}
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending or max(workers, 1) * 4)
+
+    def _run(self, algorithm: str, password: str, salt: bytes, params: Dict[str, int]) -> str:
+        """Derive a key in the worker pool, or inline without workers.
+
+        Raises:
+            HasherBusyError: If no queue slot frees up, or the result does not
+                arrive, within the timeout
+        """
+        if not self.workers:
+            return _derive(algorithm, password, salt, params)
+        if not self._slots.acquire(timeout=self.timeout):
+            raise HasherBusyError("Too many password hashing jobs in progress")
+        try:
+            future = self._get_executor().submit(_derive, algorithm, password, salt, params)
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                future.cancel()
+                raise HasherBusyError("Password hashing timed out")
+        finally:
+            self._slots.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the worker pool, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the current algorithm and cost.
+
+        Args:
+            password (str): The password to hash
+
+        Returns:
+            str: The prefixed hash
+        """
+        salt = os.urandom(16)
+        key = self._run(self.algorithm, password, salt, self.params)
+        return f"{self.algorithm}${_format_params(self.params)}${salt.hex()}${key}"
+
+    def hash_many(self, passwords: List[str]) -> List[str]:
+        """Hash many passwords, for bulk provisioning.
+
+        Jobs are submitted one chunk of ``workers`` passwords at a time, each
+        holding a queue slot like an interactive hash. A bulk run therefore
+        never fills the queue, and a login submitted meanwhile waits behind
+        at most one chunk.
+
+        Args:
+            passwords (List[str]): The passwords to hash
+
+        Returns:
+            List[str]: The prefixed hashes, in input order
+
+        Raises:
+            HasherBusyError: If a chunk cannot get queue slots or its results
+                within the timeout
+        """
+        salts = [os.urandom(16) for _ in passwords]
+        if not self.workers:
+            keys = [_derive(self.algorithm, password, salt, self.params)
+                    for password, salt in zip(passwords, salts)]
+        else:
+            keys = []
+            for start in range(0, len(passwords), self.workers):
+                keys += self._run_chunk(passwords[start:start + self.workers],
+                                        salts[start:start + self.workers])
+        prefix = f"{self.algorithm}${_format_params(self.params)}"
+        return [f"{prefix}${salt.hex()}${key}" for salt, key in zip(salts, keys)]
+
+    def _run_chunk(self, passwords: List[str], salts: List[bytes]) -> List[str]:
+        """Derive keys for a chunk of passwords in parallel, one queue slot each."""
+        futures = []
+        try:
+            for password, salt in zip(passwords, salts):
+                if not self._slots.acquire(timeout=self.timeout):
+                    raise HasherBusyError("Too many password hashing jobs in progress")
+                futures.append(self._get_executor().submit(_derive, self.algorithm, password, salt, self.params))
+            try:
+                return [future.result(timeout=self.timeout) for future in futures]
+            except FutureTimeoutError:
+                for future in futures:
+                    future.cancel()
+                raise HasherBusyError("Password hashing timed out")
+        finally:
+            for _ in futures:
+                self._slots.release()
+
+    def verify(self, password: str, stored: str, legacy_salt: Optional[str] = None) -> bool:
+        """Check a password against a stored hash.
+
+        Args:
+            password (str): The password to check
+            stored (str): The stored hash, prefixed or legacy
+            legacy_salt (Optional[str]): Salt of a legacy SHA-256 hash
+
+        Returns:
+            bool: True if the password matches
+        """
+        if "$" not in stored:
+            legacy = hashlib.sha256((password + (legacy_salt or "")).encode()).hexdigest()
+            return hmac.compare_digest(legacy, stored)
+        algorithm, params, salt, key = stored.split("$")
+        derived = self._run(algorithm, password, bytes.fromhex(salt), _parse_params(params))
+        return hmac.compare_digest(derived, key)
+
+    def needs_rehash(self, stored: str) -> bool:
+        """Check if a stored hash uses a legacy scheme or outdated parameters.
+
+        Args:
+            stored (str): The stored hash
+
+        Returns:
+            bool: True if the hash should be replaced after a successful login
+        """
+        return not stored.startswith(f"{self.algorithm}${_format_params(self.params)}$")
+
+    def close(self) -> None:
+        """Shut the worker pool down; it is restarted on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
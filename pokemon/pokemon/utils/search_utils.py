@@ -0,0 +1,117 @@
+import bisect
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Split text into the set of its character trigrams, padded at the edges."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _id_from_url(url: str) -> Optional[int]:
+    """Extract the trailing numeric ID from a PokeAPI resource URL."""
+    tail = url.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+class NameIndex:
+    """In-memory name index answering prefix and fuzzy queries locally.
+
+    Prefix lookups bisect a sorted list of names. Fuzzy lookups score names
+    by trigram overlap with the query, using an inverted trigram index so only
+    names that share at least one trigram are considered.
+    """
+
+    def __init__(self, entries: Iterable[Dict], min_similarity: float = 0.3):
+        """Build the index.
+
+        Args:
+            entries (Iterable[Dict]): Resources with ``name`` and ``url`` keys, as
+                returned by a PokeAPI listing endpoint
+            min_similarity (float): Minimum trigram similarity for fuzzy matches
+        """
+        self.min_similarity = min_similarity
+        self._entries: Dict[str, Dict] = {}
+        for entry in entries:
+            name = entry["name"].lower()
+            self._entries[name] = {
+                "name": name,
+                "id": _id_from_url(entry.get("url", "")),
+                "url": entry.get("url")
+            }
+        self._names: List[str] = sorted(self._entries)
+        self._name_trigrams: Dict[str, Set[str]] = {}
+        self._trigram_index: Dict[str, List[str]] = defaultdict(list)
+        for name in self._names:
+            grams = _trigrams(name)
+            self._name_trigrams[name] = grams
+            for gram in grams:
+                self._trigram_index[gram].append(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """Find names starting with a prefix, in alphabetical order.
+
+        Args:
+            prefix (str): The prefix to match
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Dict]: Matching entries
+        """
+        prefix = prefix.strip().lower()
+        results = []
+        start = bisect.bisect_left(self._names, prefix)
+        for name in self._names[start:start + limit]:
+            if not name.startswith(prefix):
+                break
+            results.append(self._entries[name])
+        return results
+
+    def fuzzy_search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Find names similar to a query, best match first.
+
+        Args:
+            query (str): The query to match
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Dict]: Matching entries ordered by descending similarity
+        """
+        query = query.strip().lower()
+        query_grams = _trigrams(query)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in query_grams:
+            for name in self._trigram_index.get(gram, ()):
+                shared[name] += 1
+
+        scored = []
+        for name, count in shared.items():
+            similarity = count / (len(query_grams) + len(self._name_trigrams[name]) - count)
+            if similarity >= self.min_similarity:
+                scored.append((-similarity, name))
+        scored.sort()
+        return [self._entries[name] for _, name in scored[:limit]]
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Search names, returning prefix matches first and fuzzy matches after.
+
+        Args:
+            query (str): The query to match
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Dict]: Matching entries without duplicates
+        """
+        results = self.prefix_search(query, limit)
+        if len(results) < limit:
+            seen = {entry["name"] for entry in results}
+            for entry in self.fuzzy_search(query, limit):
+                if entry["name"] not in seen:
+                    results.append(entry)
+                    if len(results) == limit:
+                        break
+        return results
@@ -0,0 +1,118 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A stored API response with the validators needed to revalidate it."""
+    body: Dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class ResponseCache:
+    """SQLite-backed store for API responses that survives process restarts.
+
+    The database file is opened lazily on first use and shared by all threads
+    of the process; every worker process pointing at the same path shares the
+    same stored responses.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the response cache.
+
+        Args:
+            path (str): Path of the SQLite file holding the responses
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed. Caller holds the lock."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " endpoint TEXT PRIMARY KEY,"
+                " body TEXT NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " fetched_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, endpoint: str) -> Optional[CachedResponse]:
+        """Get a stored response.
+
+        Args:
+            endpoint (str): The API endpoint
+
+        Returns:
+            Optional[CachedResponse]: The stored response, or None if absent
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE endpoint = ?",
+                (endpoint,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(json.loads(row[0]), row[1], row[2], row[3])
+
+    def put(self, endpoint: str, body: Dict, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """Store or replace a response.
+
+        Args:
+            endpoint (str): The API endpoint
+            body (Dict): The decoded JSON body
+            etag (Optional[str]): The response's ETag header
+            last_modified (Optional[str]): The response's Last-Modified header
+        """
+        payload = json.dumps(body, separators=(",", ":"))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (endpoint, body, etag, last_modified, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (endpoint, payload, etag, last_modified, time.time())
+            )
+            conn.commit()
+
+    def touch(self, endpoint: str) -> None:
+        """Mark a stored response as freshly validated.
+
+        Args:
+            endpoint (str): The API endpoint
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("UPDATE responses SET fetched_at = ? WHERE endpoint = ?", (time.time(), endpoint))
+            conn.commit()
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+        logger.info("Cleared response cache at %s", self.path)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,173 @@
+"""Prefetch the full Pokedex into the Pokemon caches.
+
+Usage:
+    python -m pokemon.warmup [--workers N] [--rate PER_SECOND] [--limit N] [--no-evolutions]
+
+The command runs in its own process, so it fills the persistent response
+cache only; the server's in-memory ``PokemonModel`` then loads from that
+cache without contacting PokeAPI. Call ``warm_up`` with a model from inside
+the server process to fill the in-memory cache as well.
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from pokemon.api import PokemonAPI
+from pokemon.config import Config
+from pokemon.models.evolution_model import EvolutionModel
+from pokemon.models.pokemon_model import PokemonModel
+from pokemon.utils.api_utils import RateLimiter
+from pokemon.utils.logger import configure_logger
+from pokemon.utils.sql_utils import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of a warm-up run."""
+    total: int = 0
+    fetched: int = 0
+    failures: List[Tuple[str, str]] = field(default_factory=list)  # (endpoint, error)
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Fetches completed per second."""
+        return self.fetched / self.elapsed if self.elapsed else 0.0
+
+
+def _id_from_url(url: str) -> str:
+    """Extract the trailing ID from a PokeAPI resource URL."""
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def warm_up(api: PokemonAPI, model: Optional[PokemonModel] = None, workers: int = 8,
+            rate: Optional[float] = None, limit: Optional[int] = None,
+            include_evolutions: bool = True,
+            evolution_model: Optional[EvolutionModel] = None,
+            progress: Optional[Callable[[WarmupReport], None]] = None,
+            progress_every: int = 100) -> WarmupReport:
+    """Fetch every Pokemon and evolution chain in parallel.
+
+    Responses land in the API's persistent cache. Pokemon are also stored in
+    ``model`` and chains indexed in ``evolution_model`` when they are given.
+
+    Args:
+        api (PokemonAPI): The client to fetch through
+        model (Optional[PokemonModel]): Cache to fill with the fetched Pokemon
+        workers (int): Number of concurrent fetches
+        rate (Optional[float]): Maximum fetches started per second, unlimited if None
+        limit (Optional[int]): Only fetch the first ``limit`` entries of each resource
+        include_evolutions (bool): Also fetch every evolution chain
+        evolution_model (Optional[EvolutionModel]): Index to add the fetched chains to
+        progress (Optional[Callable[[WarmupReport], None]]): Called every
+            ``progress_every`` completed fetches and once at the end
+        progress_every (int): Number of fetches between progress callbacks
+
+    Returns:
+        WarmupReport: Counts, failures and elapsed time
+    """
+    start = time.monotonic()
+    tasks = []
+    for entry in api.list_resources("pokemon")[:limit]:
+        tasks.append((f"pokemon/{entry['name']}", entry["name"], True))
+    if include_evolutions:
+        for entry in api.list_resources("evolution-chain")[:limit]:
+            chain_id = _id_from_url(entry["url"])
+            tasks.append((f"evolution-chain/{chain_id}", chain_id, False))
+
+    report = WarmupReport(total=len(tasks))
+    limiter = RateLimiter(rate) if rate else None
+
+    def fetch(name_or_id: str, is_pokemon: bool) -> None:
+        if limiter is not None:
+            limiter.acquire()
+        if not is_pokemon:
+            chain = api.get_evolution_chain(name_or_id)
+            if evolution_model is not None:
+                evolution_model.add_chain(chain)
+        elif model is not None:
+            model.cache_pokemon(name_or_id, api.get_pokemon(name_or_id))
+        else:
+            api.get_pokemon(name_or_id)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as executor:
+        futures = {
+            executor.submit(fetch, name_or_id, is_pokemon): endpoint
+            for endpoint, name_or_id, is_pokemon in tasks
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+                report.fetched += 1
+            except Exception as e:
+                report.failures.append((futures[future], str(e)))
+            report.elapsed = time.monotonic() - start
+            done = report.fetched + len(report.failures)
+            if progress is not None and done % progress_every == 0:
+                progress(report)
+
+    report.elapsed = time.monotonic() - start
+    if progress is not None:
+        progress(report)
+    return report
+
+
+def _log_progress(report: WarmupReport) -> None:
+    """Log a progress line for a warm-up run."""
+    done = report.fetched + len(report.failures)
+    logger.info(
+        f"Warm-up {done}/{report.total}: {report.fetched} fetched, "
+        f"{len(report.failures)} failed, {report.throughput:.1f}/s"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the warm-up from the command line.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, defaults to ``sys.argv``
+
+    Returns:
+        int: Process exit code, non-zero if any fetch failed
+    """
+    parser = argparse.ArgumentParser(description="Prefetch every Pokemon and evolution chain.")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent fetches (default: 8)")
+    parser.add_argument("--rate", type=float, default=None, help="maximum fetches per second")
+    parser.add_argument("--limit", type=int, default=None, help="only fetch the first N of each resource")
+    parser.add_argument("--no-evolutions", action="store_true", help="skip evolution chains")
+    args = parser.parse_args(argv)
+
+    configure_logger(logger)
+    if not Config.POKEAPI_CACHE_PATH:
+        logger.warning("POKEAPI_CACHE_PATH is empty; fetched responses will not be persisted")
+    api = PokemonAPI(
+        cache=ResponseCache(Config.POKEAPI_CACHE_PATH) if Config.POKEAPI_CACHE_PATH else None,
+        revalidate_after=Config.POKEAPI_CACHE_REVALIDATE_AFTER,
+        pool_maxsize=args.workers
+    )
+
+    report = warm_up(
+        api,
+        workers=args.workers,
+        rate=args.rate,
+        limit=args.limit,
+        include_evolutions=not args.no_evolutions,
+        progress=_log_progress
+    )
+    for endpoint, error in report.failures:
+        logger.error(f"Failed to fetch {endpoint}: {error}")
+    logger.info(
+        f"Warm-up finished: {report.fetched}/{report.total} fetched in "
+        f"{report.elapsed:.1f}s ({report.throughput:.1f}/s), {len(report.failures)} failed"
+    )
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
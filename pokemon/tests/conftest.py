@@ -3,6 +3,7 @@ import pytest
 from pokemon.app import create_app
 from config import Config
 from pokemon.db import db
+from pokemon.models.user_model import identity_cache
 
 @pytest.fixture
 def app():
@@ -12,6 +13,7 @@ def app():
         yield app
         db.session.remove()
         db.drop_all()
+        identity_cache.clear()
 
 @pytest.fixture
 def client(app):
@@ -1,16 +1,22 @@
 # tests/test_api.py
 
+import threading
+import time
+
 import pytest
-from requests.exceptions import HTTPError
+from requests.exceptions import ConnectionError, HTTPError, TooManyRedirects
 
 from pokemon.api import PokemonAPI
+from pokemon.utils.api_utils import CircuitBreaker, CircuitOpenError, LatencyTracker
+from pokemon.utils.sql_utils import ResponseCache
 
 
 class DummyResponse:
     """Minimal stand-in for requests.Response"""
-    def __init__(self, data, status_code=200):
+    def __init__(self, data, status_code=200, headers=None):
         self._data = data
         self.status_code = status_code
+        self.headers = headers or {}
 
     def raise_for_status(self):
         if not (200 <= self.status_code < 300):
@@ -28,7 +34,7 @@ def api():
 def test__make_request_success(monkeypatch, api):
     dummy = {"foo": "bar"}
     # patch session.get to return our dummy 200-response
-    monkeypatch.setattr(api.session, "get", lambda url: DummyResponse(dummy, 200))
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: DummyResponse(dummy, 200))
 
     result = api._make_request("pokemon/42")
     assert result == dummy
@@ -36,7 +42,7 @@ def test__make_request_success(monkeypatch, api):
 
 def test__make_request_raises_on_http_error(monkeypatch, api):
     # patch session.get to return a 404
-    monkeypatch.setattr(api.session, "get", lambda url: DummyResponse(None, 404))
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: DummyResponse(None, 404))
 
     with pytest.raises(HTTPError):
         api._make_request("pokemon/not-found")
@@ -44,7 +50,7 @@ def test__make_request_raises_on_http_error(monkeypatch, api):
 
 def test_get_pokemon_delegates_to__make_request(monkeypatch, api):
     # intercept _make_request so no network is needed
-    monkeypatch.setattr(api, "_make_request", lambda endpoint: {"name": "pikachu"})
+    monkeypatch.setattr(api, "_make_request", lambda endpoint, **kwargs: {"name": "pikachu"})
     data = api.get_pokemon("pikachu")
     assert data == {"name": "pikachu"}
 
@@ -54,3 +60,307 @@ def test_get_evolution_chain_delegates_to__make_request(monkeypatch, api):
     data = api.get_evolution_chain(7)
     assert data == {"chain": [1,2,3]}
 
+
+
+def _run_concurrently(count, fn):
+    """Start ``count`` threads running ``fn`` and collect results or errors."""
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(fn())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+def test__make_request_coalesces_concurrent_calls(monkeypatch, api):
+    release = threading.Event()
+    calls = []
+
+    def slow_get(url, **kwargs):
+        calls.append(url)
+        release.wait(timeout=5)
+        return DummyResponse({"name": "pikachu"}, 200)
+
+    monkeypatch.setattr(api.session, "get", slow_get)
+    threads, results, errors = _run_concurrently(8, lambda: api._make_request("pokemon/25"))
+    while api.get_request_stats()["coalesced"] < 7:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert errors == []
+    assert results == [{"name": "pikachu"}] * 8
+    stats = api.get_request_stats()
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 7
+    assert stats["in_flight"] == 0
+
+
+def test__make_request_shares_errors_with_waiters(monkeypatch, api):
+    api.retries = 0
+    release = threading.Event()
+
+    def failing_get(url, **kwargs):
+        release.wait(timeout=5)
+        return DummyResponse(None, 503)
+
+    monkeypatch.setattr(api.session, "get", failing_get)
+    threads, results, errors = _run_concurrently(4, lambda: api._make_request("pokemon/25"))
+    while api.get_request_stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert results == []
+    assert len(errors) == 4
+    assert all(isinstance(e, HTTPError) for e in errors)
+
+    # The failed call is not remembered; the next request goes upstream again
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: DummyResponse({"ok": True}, 200))
+    assert api._make_request("pokemon/25") == {"ok": True}
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.db"))
+    yield cache
+    cache.close()
+
+
+def test__make_request_stores_and_serves_from_persistent_cache(monkeypatch, response_cache):
+    api = PokemonAPI(cache=response_cache)
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse({"name": "pikachu"}, 200, {"ETag": '"abc"'})
+
+    monkeypatch.setattr(api.session, "get", get)
+    assert api._make_request("pokemon/25") == {"name": "pikachu"}
+
+    # A restarted process reads the stored response without going upstream
+    restarted = PokemonAPI(cache=ResponseCache(response_cache.path))
+    monkeypatch.setattr(restarted.session, "get", get)
+    assert restarted._make_request("pokemon/25") == {"name": "pikachu"}
+    assert len(calls) == 1
+
+
+def test__make_request_revalidates_with_etag(monkeypatch, response_cache):
+    api = PokemonAPI(cache=response_cache, revalidate_after=0)
+    response_cache.put("pokemon/25", {"name": "pikachu"}, etag='"abc"')
+    seen_headers = []
+
+    def get(url, headers=None, **kwargs):
+        seen_headers.append(headers)
+        return DummyResponse(None, 304)
+
+    monkeypatch.setattr(api.session, "get", get)
+    assert api._make_request("pokemon/25") == {"name": "pikachu"}
+    assert seen_headers == [{"If-None-Match": '"abc"'}]
+
+
+def test_get_pokemon_revalidate_bypasses_fresh_copy(monkeypatch, response_cache):
+    api = PokemonAPI(cache=response_cache, revalidate_after=3600)
+    response_cache.put("pokemon/25", {"name": "pikachu"}, etag='"abc"')
+    seen_headers = []
+
+    def get(url, headers=None, **kwargs):
+        seen_headers.append(headers)
+        return DummyResponse(None, 304)
+
+    monkeypatch.setattr(api.session, "get", get)
+    assert api.get_pokemon(25) == {"name": "pikachu"}
+    assert seen_headers == []
+    assert api.get_pokemon(25, revalidate=True) == {"name": "pikachu"}
+    assert seen_headers == [{"If-None-Match": '"abc"'}]
+
+def test__make_request_does_not_store_uncacheable_endpoints(monkeypatch, response_cache):
+    api = PokemonAPI(cache=response_cache)
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: DummyResponse({"results": []}, 200))
+    api._make_request("pokemon?limit=10")
+    assert response_cache.get("pokemon?limit=10") is None
+
+
+def test_search_pokemon_builds_index_once(monkeypatch, api):
+    calls = []
+
+    def listing(endpoint):
+        calls.append(endpoint)
+        return {"results": [
+            {"name": "pikachu", "url": "https://pokeapi.co/api/v2/pokemon/25/"},
+            {"name": "pichu", "url": "https://pokeapi.co/api/v2/pokemon/172/"},
+        ]}
+
+    monkeypatch.setattr(api, "_make_request", listing)
+    assert [p["name"] for p in api.search_pokemon("pik")] == ["pikachu"]
+    assert [p["id"] for p in api.search_pokemon("pi")] == [172, 25]
+    assert len(calls) == 1
+
+
+def test_circuit_breaker_state_transitions(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("pokemon.utils.api_utils.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    now[0] += 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial call at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(9):
+        tracker.record(i / 100)
+    assert tracker.percentile(95) is None
+    for i in range(9, 100):
+        tracker.record(i / 100)
+    assert tracker.percentile(95) == 0.94
+    assert tracker.percentile(50) == 0.49
+    assert tracker.percentile(100) == 0.99
+
+
+def test__make_request_passes_timeout(monkeypatch):
+    api = PokemonAPI(timeout=(1, 2))
+    seen = []
+
+    def get(url, **kwargs):
+        seen.append(kwargs["timeout"])
+        return DummyResponse({}, 200)
+
+    monkeypatch.setattr(api.session, "get", get)
+    api._make_request("pokemon/1")
+    assert seen == [(1, 2)]
+
+
+def test__make_request_retries_with_jittered_backoff(monkeypatch):
+    api = PokemonAPI(retries=3, backoff=0.1, max_backoff=0.15)
+    sleeps = []
+    monkeypatch.setattr("pokemon.api.time.sleep", sleeps.append)
+    monkeypatch.setattr("pokemon.api.random.uniform", lambda low, high: high)
+    responses = [ConnectionError("reset"), DummyResponse(None, 503), DummyResponse(None, 502),
+                 DummyResponse({"ok": True}, 200)]
+
+    def get(url, **kwargs):
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(api.session, "get", get)
+    assert api._make_request("pokemon/1") == {"ok": True}
+    assert sleeps == [0.1, 0.15, 0.15]  # exponential, capped at max_backoff
+    assert api.get_request_stats()["retries"] == 3
+    assert api.circuit_breaker.state == "closed"
+
+
+def test__make_request_does_not_retry_client_errors(monkeypatch):
+    api = PokemonAPI(retries=3)
+    calls = []
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: calls.append(url) or DummyResponse(None, 404))
+    with pytest.raises(HTTPError):
+        api._make_request("pokemon/missingno")
+    assert len(calls) == 1
+    assert api.get_request_stats()["retries"] == 0
+
+
+def test__make_request_fails_fast_when_circuit_open(monkeypatch):
+    api = PokemonAPI(retries=0, circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(api.session, "get", get)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            api._make_request("pokemon/1")
+    with pytest.raises(CircuitOpenError):
+        api._make_request("pokemon/1")
+    assert len(calls) == 2
+    assert api.get_request_stats()["circuit"] == "open"
+
+
+def test_unexpected_request_error_releases_half_open_trial(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    api = PokemonAPI(retries=0, circuit_breaker=breaker)
+    breaker.record_failure()
+
+    def get(url, **kwargs):
+        raise TooManyRedirects("loop")
+
+    monkeypatch.setattr(api.session, "get", get)
+    with pytest.raises(TooManyRedirects):
+        api._make_request("pokemon/1")
+
+    # The failed trial reopened the breaker, so the next trial is allowed through
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: DummyResponse({"ok": True}, 200))
+    assert api._make_request("pokemon/1") == {"ok": True}
+    assert breaker.state == "closed"
+
+
+def test__make_request_serves_stale_while_circuit_open(monkeypatch, response_cache):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    api = PokemonAPI(cache=response_cache, revalidate_after=0, circuit_breaker=breaker)
+    response_cache.put("pokemon/25", {"name": "pikachu"}, etag='"abc"')
+    breaker.record_failure()
+    calls = []
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: calls.append(url))
+
+    assert api._make_request("pokemon/25") == {"name": "pikachu"}
+    assert calls == []
+    assert api.get_request_stats()["stale_served"] == 1
+
+
+def test__make_request_hedges_slow_requests(monkeypatch):
+    api = PokemonAPI(retries=0, hedge=True, hedge_min_delay=0.01)
+    for _ in range(api._latencies.min_samples):
+        api._latencies.record(0.01)
+    first = threading.Event()
+    release = threading.Event()
+
+    def get(url, **kwargs):
+        if not first.is_set():
+            first.set()
+            release.wait(timeout=5)  # the primary request stalls
+            return DummyResponse({"from": "primary"}, 200)
+        return DummyResponse({"from": "hedge"}, 200)
+
+    monkeypatch.setattr(api.session, "get", get)
+    try:
+        assert api._make_request("pokemon/1") == {"from": "hedge"}
+        assert api.get_request_stats()["hedged"] == 1
+    finally:
+        release.set()
+
+
+def test__make_request_does_not_hedge_until_primed(monkeypatch):
+    api = PokemonAPI(hedge=True)
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: DummyResponse({}, 200))
+    api._make_request("pokemon/1")
+    assert api.get_request_stats()["hedged"] == 0
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pokemon.api import PokemonAPI
+from pokemon.async_api import AsyncPokemonAPI
+
+
+class SlowAPI(PokemonAPI):
+    """PokemonAPI whose requests sleep instead of hitting the network."""
+    def __init__(self, delay=0.05):
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _make_request(self, endpoint, revalidate=False):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if endpoint.endswith("missingno"):
+            raise ValueError("not found")
+        return {"endpoint": endpoint}
+
+
+@pytest.fixture
+def slow_api():
+    return SlowAPI()
+
+
+def test_get_pokemon_and_evolution_chain(slow_api):
+    client = AsyncPokemonAPI(slow_api)
+    assert asyncio.run(client.get_pokemon("pikachu")) == {"endpoint": "pokemon/pikachu"}
+    assert asyncio.run(client.get_evolution_chain(10)) == {"endpoint": "evolution-chain/10"}
+    client.close()
+
+
+def test_get_pokemon_many_runs_in_parallel_and_keeps_order(slow_api):
+    client = AsyncPokemonAPI(slow_api, max_concurrency=10)
+    ids = list(range(1, 11))
+    start = time.perf_counter()
+    results = asyncio.run(client.get_pokemon_many(ids))
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    assert [r["endpoint"] for r in results] == [f"pokemon/{i}" for i in ids]
+    # Ten serial requests would take 0.5s
+    assert elapsed < 0.3
+
+
+def test_get_pokemon_many_respects_concurrency_limit(slow_api):
+    client = AsyncPokemonAPI(slow_api, max_concurrency=10)
+    asyncio.run(client.get_pokemon_many(range(12), max_concurrency=3))
+    client.close()
+    assert slow_api.peak == 3
+
+
+def test_get_pokemon_many_return_exceptions(slow_api):
+    client = AsyncPokemonAPI(slow_api)
+    results = asyncio.run(client.get_pokemon_many(["pikachu", "missingno"], return_exceptions=True))
+    client.close()
+    assert results[0] == {"endpoint": "pokemon/pikachu"}
+    assert isinstance(results[1], ValueError)
+
+    client = AsyncPokemonAPI(slow_api)
+    with pytest.raises(ValueError):
+        asyncio.run(client.get_pokemon_many(["missingno"]))
+    client.close()
+
+
+def test_get_pokemon_many_uses_custom_loader(slow_api):
+    client = AsyncPokemonAPI(slow_api)
+    results = asyncio.run(client.get_pokemon_many([1, 2], loader=lambda i: {"cached": i}))
+    client.close()
+    assert results == [{"cached": 1}, {"cached": 2}]
@@ -0,0 +1,171 @@
+import fnmatch
+import socketserver
+import threading
+import time
+
+import pytest
+
+from pokemon.utils.cache_utils import (
+    CacheBackend,
+    CacheBackendError,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SqliteCacheBackend,
+    TTLCache,
+    create_cache_backend,
+)
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Serves the handful of Redis commands the backend uses."""
+
+    def _read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            name, args = command[0].upper(), command[1:]
+            self.server.commands.append(name)
+            now = time.time()
+            if name == b"GET":
+                value, expires_at = store.get(args[0], (None, 0))
+                self.wfile.write(self._bulk(value if expires_at > now else None))
+            elif name == b"SET":
+                store[args[0]] = (args[1], now + int(args[3]) / 1000)
+                self.wfile.write(b"+OK\r\n")
+            elif name == b"DEL":
+                removed = sum(store.pop(key, None) is not None for key in args)
+                self.wfile.write(b":%d\r\n" % removed)
+            elif name == b"SCAN":
+                pattern = args[args.index(b"MATCH") + 1].decode()
+                keys = [key for key in store if fnmatch.fnmatchcase(key.decode(), pattern)]
+                self.wfile.write(b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys)
+                                 + b"".join(self._bulk(key) for key in keys))
+            else:
+                self.wfile.write(b"-ERR unknown command '%s'\r\n" % name)
+
+
+@pytest.fixture
+def resp_server():
+    """A local stand-in for a Redis server."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _RespHandler)
+    server.daemon_threads = True
+    server.store = {}
+    server.commands = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryCacheBackend()
+    elif request.param == "sqlite":
+        backend = SqliteCacheBackend(str(tmp_path / "cache.db"))
+    else:
+        server = request.getfixturevalue("resp_server")
+        backend = RedisCacheBackend(f"redis://127.0.0.1:{server.server_address[1]}/0")
+    yield backend
+    backend.close()
+
+
+def test_set_get_delete(backend):
+    assert backend.get("pikachu") is None
+    backend.set_many({"pikachu": b"\x00pika", "25": b"\x00pika"}, ttl=60)
+    assert backend.get("pikachu") == b"\x00pika"
+    assert backend.get("25") == b"\x00pika"
+
+    backend.delete(["pikachu", "missing"])
+    assert backend.get("pikachu") is None
+    assert backend.get("25") == b"\x00pika"
+
+
+def test_values_expire(backend):
+    backend.set_many({"pikachu": b"pika"}, ttl=0.05)
+    assert backend.get("pikachu") == b"pika"
+    time.sleep(0.1)
+    assert backend.get("pikachu") is None
+
+
+def test_clear(backend):
+    backend.set_many({"pikachu": b"pika", "charizard": b"char"}, ttl=60)
+    backend.clear()
+    assert backend.get("pikachu") is None
+    assert backend.get("charizard") is None
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SqliteCacheBackend(path).set_many({"pikachu": b"pika"}, ttl=60)
+    assert SqliteCacheBackend(path).get("pikachu") == b"pika"
+
+
+def test_redis_backend_pipelines_and_reuses_connections(resp_server):
+    backend = RedisCacheBackend(f"redis://127.0.0.1:{resp_server.server_address[1]}")
+    backend.set_many({"pikachu": b"pika", "25": b"pika"}, ttl=60)
+    backend.get("pikachu")
+    assert resp_server.commands == [b"SET", b"SET", b"GET"]
+    assert len(backend._idle) == 1
+    # Keys are namespaced, and clear only touches the namespace
+    resp_server.store[b"other"] = (b"x", time.time() + 60)
+    backend.clear()
+    assert list(resp_server.store) == [b"other"]
+
+
+def test_redis_backend_errors(resp_server):
+    backend = RedisCacheBackend(f"redis://127.0.0.1:{resp_server.server_address[1]}")
+    with pytest.raises(CacheBackendError, match="unknown command"):
+        backend._execute(("FLUSHALL",))
+    assert backend.get("pikachu") is None  # the connection is still usable
+
+    port = resp_server.server_address[1]
+    resp_server.shutdown()
+    resp_server.server_close()
+    with pytest.raises(CacheBackendError):
+        RedisCacheBackend(f"redis://127.0.0.1:{port}").get("pikachu")
+
+
+def test_create_cache_backend(tmp_path):
+    assert create_cache_backend("none") is None
+    assert isinstance(create_cache_backend("memory"), MemoryCacheBackend)
+    assert isinstance(create_cache_backend("sqlite", str(tmp_path / "cache.db")), SqliteCacheBackend)
+    redis = create_cache_backend("redis", "redis://cache:6380/2")
+    assert (redis.host, redis.port, redis.db) == ("cache", 6380, 2)
+    with pytest.raises(ValueError):
+        create_cache_backend("memcached")
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_ttl_cache_expiry_eviction_and_stats():
+    cache = TTLCache(ttl=0.05, max_entries=2)
+    cache.put("ash", 1)
+    cache.put("misty", 2)
+    assert cache.get("ash") == 1
+    cache.put("brock", 3)  # evicts misty, the least recently used
+    assert cache.get("misty") is None
+    cache.invalidate("brock")
+    assert cache.get("brock") is None
+    time.sleep(0.1)
+    assert cache.get("ash") is None
+    assert cache.get_stats() == {"size": 0, "ttl": 0.05, "hits": 1, "misses": 3, "invalidations": 1}
@@ -0,0 +1,26 @@
+from sqlalchemy import create_engine, text
+
+from pokemon.db import engine_options, tune_sqlite
+
+
+def test_engine_options():
+    options = engine_options("postgresql://pokemon@db/pokemon", pool_size=5, max_overflow=2,
+                             pool_recycle=60, pool_pre_ping=False)
+    assert options == {"pool_size": 5, "max_overflow": 2, "pool_recycle": 60, "pool_pre_ping": False}
+    assert engine_options("sqlite:///pokemon.db")["pool_size"] == 10
+    # In-memory SQLite shares one connection, so it gets no sized pool
+    assert engine_options("sqlite://") == {"pool_pre_ping": True}
+    assert engine_options("sqlite:///:memory:") == {"pool_pre_ping": True}
+
+
+def test_tune_sqlite_sets_pragmas(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pokemon.db'}",
+                           **engine_options(f"sqlite:///{tmp_path / 'pokemon.db'}"))
+    tune_sqlite(engine, busy_timeout=1234, mmap_size=4096)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert conn.execute(text("PRAGMA mmap_size")).scalar() == 4096
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    engine.dispose()
@@ -0,0 +1,144 @@
+import time
+import unittest
+
+from pokemon.api import PokemonAPI
+from pokemon.models.evolution_model import EvolutionChain, EvolutionModel
+
+def _species(id, name):
+    return {"name": name, "url": f"https://pokeapi.co/api/v2/pokemon-species/{id}/"}
+
+EEVEE_CHAIN = {
+    "id": 67,
+    "chain": {
+        "species": _species(133, "eevee"),
+        "evolution_details": [],
+        "evolves_to": [
+            {
+                "species": _species(134, "vaporeon"),
+                "evolution_details": [{"trigger": {"name": "use-item"}, "item": {"name": "water-stone"},
+                                       "min_level": None, "needs_overworld_rain": False}],
+                "evolves_to": []
+            },
+            {
+                "species": _species(196, "espeon"),
+                "evolution_details": [{"trigger": {"name": "level-up"}, "min_happiness": 160,
+                                       "time_of_day": "day", "item": None}],
+                "evolves_to": []
+            }
+        ]
+    }
+}
+
+PICHU_CHAIN = {
+    "id": 10,
+    "chain": {
+        "species": _species(172, "pichu"),
+        "evolution_details": [],
+        "evolves_to": [{
+            "species": _species(25, "pikachu"),
+            "evolution_details": [{"trigger": {"name": "level-up"}, "min_happiness": 220}],
+            "evolves_to": [{
+                "species": _species(26, "raichu"),
+                "evolution_details": [{"trigger": {"name": "use-item"}, "item": {"name": "thunder-stone"}}],
+                "evolves_to": []
+            }]
+        }]
+    }
+}
+
+class FakeAPI(PokemonAPI):
+    """PokemonAPI serving two evolution chains from memory."""
+    def __init__(self):
+        super().__init__()
+        self.requested = []
+
+    def _make_request(self, endpoint, revalidate=False):
+        self.requested.append(endpoint)
+        if endpoint.startswith("evolution-chain?"):
+            return {"results": [{"url": "https://pokeapi.co/api/v2/evolution-chain/10/"},
+                                {"url": "https://pokeapi.co/api/v2/evolution-chain/67/"}]}
+        if endpoint == "evolution-chain/10":
+            return PICHU_CHAIN
+        if endpoint == "evolution-chain/67":
+            return EEVEE_CHAIN
+        if endpoint == "pokemon/10100":  # an alternate form of raichu
+            return {"id": 10100, "species": _species(26, "raichu")}
+        if endpoint == "pokemon/25":
+            return {"id": 25, "species": _species(25, "pikachu")}
+        if endpoint == "pokemon-species/25":
+            return {"evolution_chain": {"url": "https://pokeapi.co/api/v2/evolution-chain/10/"}}
+        raise ValueError(f"unexpected endpoint {endpoint}")
+
+class TestEvolutionModel(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.api = FakeAPI()
+        self.model = EvolutionModel(self.api, workers=2)
+
+    def test_chain_from_api(self):
+        """Test building a chain graph with triggers and conditions."""
+        chain = EvolutionChain.from_api(EEVEE_CHAIN)
+        self.assertEqual(chain.root, 133)
+        self.assertEqual(chain.nodes, {133: "eevee", 134: "vaporeon", 196: "espeon"})
+        self.assertEqual(chain.edges, [
+            {"from": 133, "to": 134, "trigger": "use-item", "conditions": {"item": "water-stone"}},
+            {"from": 133, "to": 196, "trigger": "level-up",
+             "conditions": {"min_happiness": 160, "time_of_day": "day"}}
+        ])
+
+    def test_build_indexes_every_species(self):
+        """Test that a full build resolves every species without further requests."""
+        self.assertEqual(self.model.build(), 2)
+        self.api.requested.clear()
+        self.assertEqual(self.model.get_chain_for_pokemon(26).id, 10)
+        self.assertEqual(self.model.get_chain_for_pokemon(196).id, 67)
+        self.assertEqual(self.api.requested, [])
+        self.assertTrue(self.model.get_stats()["built"])
+
+    def test_unindexed_pokemon_resolved_through_species(self):
+        """Test that a Pokemon ID missing from the index is resolved and remembered."""
+        self.model._build_started = True  # keep the background build out of this test
+        chain = self.model.get_chain_for_pokemon(25)
+        self.assertEqual(chain.id, 10)
+        self.assertEqual(self.api.requested, ["pokemon/25", "pokemon-species/25", "evolution-chain/10"])
+
+        self.api.requested.clear()
+        self.assertIs(self.model.get_chain_for_pokemon(172), chain)
+        self.assertIs(self.model.get_chain_for_pokemon(25), chain)
+        self.assertEqual(self.api.requested, [])
+
+    def test_alternate_form_resolved_to_species_chain(self):
+        """Test that an alternate form ID maps onto its species' chain."""
+        self.model.build()
+        self.assertEqual(self.model.get_chain_for_pokemon(10100).id, 10)
+        self.api.requested.clear()
+        self.model.get_chain_for_pokemon(10100)
+        self.assertEqual(self.api.requested, [])
+
+    def test_lookup_starts_background_build(self):
+        """Test that the first unindexed lookup starts a full build."""
+        self.model.get_chain_for_pokemon(25)
+        deadline = time.monotonic() + 1
+        while not self.model.get_stats()["built"] and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(self.model.get_stats()["chains"], 2)
+
+    def test_failed_listing_allows_retry(self):
+        """Test that a build whose listing fails can be started again."""
+        def failing_listing(resource):
+            raise ConnectionError("upstream down")
+
+        list_resources = self.api.list_resources
+        self.api.list_resources = failing_listing
+        self.model.build_in_background()
+        deadline = time.monotonic() + 1
+        while self.model._build_started and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertFalse(self.model._build_started)
+
+        self.api.list_resources = list_resources
+        self.assertEqual(self.model.build(), 2)
+        self.assertTrue(self.model.get_stats()["built"])
+
+if __name__ == '__main__':
+    unittest.main()
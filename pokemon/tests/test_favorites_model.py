@@ -1,5 +1,7 @@
+import threading
 import unittest
 from pokemon.models.favorites_model import FavoritesModel
+from pokemon.models.pokemon_model import PokemonRecord
 
 class TestFavoritesModel(unittest.TestCase):
     def setUp(self):
@@ -20,6 +22,13 @@ class TestFavoritesModel(unittest.TestCase):
         self.assertEqual(len(favorites), 1)
         self.assertEqual(favorites[0]["name"], "pikachu")
     
+    def test_add_favorite_stores_record(self):
+        """Test that raw payloads are stored as serializable records."""
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        favorite = self.model.get_favorites(self.test_user_id)[0]
+        self.assertIsInstance(favorite, PokemonRecord)
+        self.assertEqual(favorite.to_dict()["types"], [{"name": "electric", "url": ""}])
+
     def test_remove_favorite(self):
         """Test removing a favorite Pokemon."""
         self.model.add_favorite(self.test_user_id, self.test_pokemon)
@@ -69,5 +78,149 @@ class TestFavoritesModel(unittest.TestCase):
         self.assertEqual(user1_favorites[0]["name"], "pikachu")
         self.assertEqual(user2_favorites[0]["name"], "bulbasaur")
 
+    def test_is_favorite(self):
+        """Test membership checks."""
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        self.assertTrue(self.model.is_favorite(self.test_user_id, 25))
+        self.assertFalse(self.model.is_favorite(self.test_user_id, 6))
+        self.assertFalse(self.model.is_favorite("someone_else", 25))
+
+    def test_order_kept_after_removal(self):
+        """Test that listing keeps insertion order across removals and re-adds."""
+        for pokemon_id in (1, 4, 7, 25):
+            self.model.add_favorite(self.test_user_id, {"name": f"p{pokemon_id}", "id": pokemon_id})
+        self.model.remove_favorite(self.test_user_id, 4)
+        self.model.add_favorite(self.test_user_id, {"name": "p4", "id": 4})
+        ids = [p.id for p in self.model.get_favorites(self.test_user_id)]
+        self.assertEqual(ids, [1, 7, 25, 4])
+
+    def test_records_shared_between_users(self):
+        """Test that a Pokemon favorited by several users is stored once."""
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        self.model.add_favorite("test_user_456", dict(self.test_pokemon))
+        first = self.model.get_favorites(self.test_user_id)[0]
+        self.assertIs(self.model.get_favorites("test_user_456")[0], first)
+
+        self.model.remove_favorite(self.test_user_id, 25)
+        self.assertIs(self.model.get_favorites("test_user_456")[0], first)
+        self.model.remove_favorite("test_user_456", 25)
+        self.assertEqual(self.model._pokemon, {})
+
+    def test_bulk_operations(self):
+        """Test thousands of adds and removes for one user."""
+        pokemon = [{"name": f"p{i}", "id": i} for i in range(5000)]
+        for p in pokemon:
+            self.model.add_favorite(self.test_user_id, p)
+        for i in range(0, 5000, 2):
+            self.assertTrue(self.model.remove_favorite(self.test_user_id, i))
+        self.assertEqual(len(self.model.get_favorites(self.test_user_id)), 2500)
+        self.assertTrue(self.model.is_favorite(self.test_user_id, 4999))
+
+    def test_get_favorites_page(self):
+        """Test cursor pagination in insertion order."""
+        for pokemon_id in (1, 4, 7, 25, 6):
+            self.model.add_favorite(self.test_user_id, {"name": f"p{pokemon_id}", "id": pokemon_id})
+        page, cursor = self.model.get_favorites_page(self.test_user_id, 2)
+        self.assertEqual([p.id for p in page], [1, 4])
+        page, cursor = self.model.get_favorites_page(self.test_user_id, 2, cursor)
+        self.assertEqual([p.id for p in page], [7, 25])
+        page, cursor = self.model.get_favorites_page(self.test_user_id, 2, cursor)
+        self.assertEqual([p.id for p in page], [6])
+        self.assertIsNone(cursor)
+
+    def test_version_changes_on_every_mutation(self):
+        """Test that the version changes on add and remove but not on no-ops."""
+        versions = [self.model.get_version(self.test_user_id)]
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        versions.append(self.model.get_version(self.test_user_id))
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        self.assertEqual(self.model.get_version(self.test_user_id), versions[-1])
+        self.model.remove_favorite(self.test_user_id, 25)
+        versions.append(self.model.get_version(self.test_user_id))
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        versions.append(self.model.get_version(self.test_user_id))
+        self.assertEqual(len(set(versions)), 4)
+
+    def test_apply_batch(self):
+        """Test applying removals then additions with per-item statuses."""
+        self.model.add_favorite(self.test_user_id, self.test_pokemon)
+        results = self.model.apply_batch(
+            self.test_user_id,
+            [PokemonRecord(6, "charizard"), PokemonRecord(6, "charizard"), PokemonRecord(25, "pikachu")],
+            [25, 999]
+        )
+        self.assertEqual([(r["pokemon_id"], r["action"], r["status"]) for r in results], [
+            (25, "remove", "removed"),
+            (999, "remove", "not_found"),
+            (6, "add", "added"),
+            (6, "add", "already_favorite"),
+            (25, "add", "added")
+        ])
+        self.assertEqual([p.id for p in self.model.get_favorites(self.test_user_id)], [6, 25])
+
+    def test_concurrent_updates_are_not_lost(self):
+        """Test many threads mutating overlapping users without losing updates."""
+        users = [f"user-{n}" for n in range(4)]
+        shared = [PokemonRecord(pokemon_id, f"shared-{pokemon_id}") for pokemon_id in range(1, 21)]
+        start = threading.Barrier(16)
+
+        def worker(thread_id):
+            start.wait()
+            for i in range(200):
+                username = users[i % len(users)]
+                own = PokemonRecord(1000 + thread_id * 1000 + i, "own")
+                self.model.add_favorite(username, own)
+                if i % 2:
+                    self.model.remove_favorite(username, own.id)
+                pokemon = shared[i % len(shared)]
+                self.model.add_favorite(username, pokemon)
+                self.model.get_favorites_page(username, 5)
+                self.model.remove_favorite(username, pokemon.id)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for n, username in enumerate(users):
+            expected = {1000 + t * 1000 + i for t in range(16) for i in range(n, 200, len(users)) if not i % 2}
+            self.assertEqual({p.id for p in self.model.get_favorites(username)}, expected)
+        # Every shared record was released exactly as often as it was taken
+        self.assertFalse(any(self.model.is_favorite(u, p.id) for u in users for p in shared))
+        self.assertEqual(len(self.model._pokemon), len(self.model._leaderboard))
+        self.assertTrue(all(pokemon_id >= 1000 for pokemon_id in self.model._pokemon))
+
+    def test_users_on_other_stripes_are_not_blocked(self):
+        """Test that a user holding its lock does not stall other users."""
+        busy = self.test_user_id
+        other = next(f"user-{n}" for n in range(1000)
+                     if self.model._user_lock(f"user-{n}") is not self.model._user_lock(busy))
+        finished = threading.Event()
+
+        def add_other():
+            self.model.add_favorite(other, self.test_pokemon)
+            finished.set()
+
+        with self.model._user_lock(busy):
+            threading.Thread(target=add_other).start()
+            self.assertTrue(finished.wait(timeout=2))
+        self.assertTrue(self.model.is_favorite(other, 25))
+
+    def test_get_top_favorites(self):
+        """Test ranking Pokemon by how many users favorited them."""
+        for username in ("ash", "misty", "brock"):
+            self.model.add_favorite(username, PokemonRecord(25, "pikachu"))
+        self.model.add_favorite("ash", PokemonRecord(6, "charizard"))
+        self.model.add_favorite("misty", PokemonRecord(121, "starmie"))
+        self.model.add_favorite("brock", PokemonRecord(121, "starmie"))
+        self.model.remove_favorite("brock", 25)
+
+        top = self.model.get_top_favorites(2)
+        self.assertEqual([(pokemon.name, count) for pokemon, count in top],
+                         [("pikachu", 2), ("starmie", 2)])
+        self.model.remove_favorite("ash", 6)
+        self.assertEqual(len(self.model.get_top_favorites(10)), 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,31 @@
+import pytest
+
+from pokemon.utils.leaderboard_utils import Leaderboard
+
+
+def test_top_orders_by_count_then_key():
+    board = Leaderboard()
+    for key, times in [(25, 3), (6, 1), (1, 3), (4, 2)]:
+        for _ in range(times):
+            board.increment(key)
+    assert board.top(3) == [(1, 3), (25, 3), (4, 2)]
+    assert board.top(10) == [(1, 3), (25, 3), (4, 2), (6, 1)]
+
+
+def test_decrement_moves_and_forgets_keys():
+    board = Leaderboard()
+    board.increment(25, 2)
+    board.increment(6)
+    assert board.decrement(25) == 1
+    assert board.top(2) == [(6, 1), (25, 1)]
+    assert board.decrement(6) == 0
+    assert board.count(6) == 0
+    assert len(board) == 1
+    assert board.top(5) == [(25, 1)]
+
+
+def test_decrement_below_zero_raises():
+    board = Leaderboard()
+    with pytest.raises(ValueError):
+        board.decrement(25)
+    assert board.top(1) == []
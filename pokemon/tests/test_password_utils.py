@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from pokemon.utils.password_utils import HasherBusyError, PasswordHasher
+
+
+@pytest.fixture
+def pooled():
+    hasher = PasswordHasher(iterations=200000, workers=2, max_pending=8)
+    yield hasher
+    hasher.close()
+
+
+def test_hash_and_verify_in_worker_processes(pooled):
+    stored = pooled.hash("pikachu123")
+    assert stored.startswith("pbkdf2_sha256$i=200000$")
+    assert pooled.verify("pikachu123", stored) is True
+    assert pooled.verify("raichu123", stored) is False
+    assert pooled.needs_rehash(stored) is False
+
+
+def test_hash_many_in_worker_processes(pooled):
+    hashes = pooled.hash_many(["pikachu123", "starmie123", "onix123"])
+    assert len(set(hashes)) == 3
+    assert [pooled.verify(password, stored) for password, stored in
+            zip(["pikachu123", "starmie123", "onix123"], hashes)] == [True, True, True]
+    assert pooled.hash_many([]) == []
+
+
+def test_bulk_hashing_leaves_room_for_logins():
+    hasher = PasswordHasher(iterations=50000, workers=1, max_pending=2, timeout=0.5)
+    stored = hasher.hash("pikachu123")  # start the worker process
+    bulk = threading.Thread(target=hasher.hash_many, args=(["starmie123"] * 40,))
+    logins = []
+    try:
+        bulk.start()
+        while bulk.is_alive() and len(logins) < 5:
+            logins.append(hasher.verify("pikachu123", stored))
+        bulk.join()
+    finally:
+        hasher.close()
+    assert logins == [True] * 5
+
+
+def test_scrypt():
+    hasher = PasswordHasher(algorithm="scrypt", scrypt_n=2 ** 10, workers=0)
+    stored = hasher.hash("pikachu123")
+    assert stored.startswith("scrypt$n=1024,r=8,p=1$")
+    assert hasher.verify("pikachu123", stored) is True
+    # Hashes made with other settings still verify, and are flagged for upgrade
+    other = PasswordHasher(iterations=1000, workers=0)
+    assert other.verify("pikachu123", stored) is True
+    assert other.needs_rehash(stored) is True
+
+
+def test_legacy_sha256_hashes():
+    import hashlib
+
+    hasher = PasswordHasher(workers=0)
+    legacy = hashlib.sha256(("pikachu123" + "ab" * 16).encode()).hexdigest()
+    assert hasher.verify("pikachu123", legacy, "ab" * 16) is True
+    assert hasher.verify("raichu123", legacy, "ab" * 16) is False
+    assert hasher.needs_rehash(legacy) is True
+
+
+def test_full_queue_fails_fast():
+    hasher = PasswordHasher(workers=1, max_pending=1, timeout=0.05)
+    hasher._slots.acquire()  # a login already waiting
+    try:
+        with pytest.raises(HasherBusyError):
+            hasher.hash("pikachu123")
+    finally:
+        hasher._slots.release()
+        hasher.close()
+
+
+def test_slow_hash_times_out_as_busy():
+    hasher = PasswordHasher(iterations=2000000, workers=1, timeout=0.05)
+    try:
+        with pytest.raises(HasherBusyError, match="timed out"):
+            hasher.hash("pikachu123")
+    finally:
+        hasher.close()
+
+
+def test_login_spike_waits_for_free_slots():
+    hasher = PasswordHasher(iterations=50000, workers=2, max_pending=2, timeout=30)
+    results = []
+    spike = [threading.Thread(target=lambda: results.append(hasher.verify("pikachu123", stored)))
+             for _ in range(8)]
+    stored = hasher.hash("pikachu123")
+    try:
+        for thread in spike:
+            thread.start()
+        for thread in spike:
+            thread.join()
+    finally:
+        hasher.close()
+    assert results == [True] * 8
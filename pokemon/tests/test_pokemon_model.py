@@ -1,6 +1,81 @@
+import sys
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta
-from pokemon.models.pokemon_model import PokemonModel, PokemonStats, PokemonType
+from pokemon.models.pokemon_model import PokemonModel, PokemonRecord, PokemonStats, PokemonType
+from pokemon.utils.cache_utils import CacheBackendError, MemoryCacheBackend
+
+def _deep_sizeof(obj, seen=None) -> int:
+    """Approximate the memory held by an object graph."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(_deep_sizeof(getattr(obj, slot), seen) for slot in obj.__slots__)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_sizeof(obj.__dict__, seen)
+    return size
+
+def _realistic_payload() -> dict:
+    """Build a payload shaped like PokeAPI's pokemon/25 response."""
+    def resource(kind, i):
+        return {"name": f"{kind}-{i}", "url": f"https://pokeapi.co/api/v2/{kind}/{i}/"}
+
+    return {
+        "id": 25,
+        "name": "pikachu",
+        "base_experience": 112,
+        "height": 4,
+        "weight": 60,
+        "is_default": True,
+        "order": 35,
+        "location_area_encounters": "https://pokeapi.co/api/v2/pokemon/25/encounters",
+        "species": resource("pokemon-species", 25),
+        "forms": [resource("pokemon-form", 25)],
+        "abilities": [
+            {"ability": resource("ability", 9), "is_hidden": False, "slot": 1},
+            {"ability": resource("ability", 31), "is_hidden": True, "slot": 3}
+        ],
+        "types": [{"slot": 1, "type": resource("type", 13)}],
+        "stats": [
+            {"base_stat": value, "effort": 0, "stat": {"name": name, "url": ""}}
+            for name, value in [("hp", 35), ("attack", 55), ("defense", 40),
+                                ("special-attack", 50), ("special-defense", 50), ("speed", 90)]
+        ],
+        "game_indices": [{"game_index": 84, "version": resource("version", i)} for i in range(20)],
+        "held_items": [
+            {"item": resource("item", i),
+             "version_details": [{"rarity": 5, "version": resource("version", v)} for v in range(10)]}
+            for i in range(2)
+        ],
+        "moves": [
+            {"move": resource("move", i),
+             "version_group_details": [
+                 {"level_learned_at": v, "move_learn_method": resource("move-learn-method", 1),
+                  "version_group": resource("version-group", v)}
+                 for v in range(8)
+             ]}
+            for i in range(100)
+        ],
+        "sprites": {
+            "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png",
+            "other": {
+                f"generation-{g}": {
+                    f"game-{v}": {"front_default": f"https://example.com/{g}/{v}/25.png",
+                                  "back_default": f"https://example.com/{g}/{v}/back/25.png"}
+                    for v in range(3)
+                }
+                for g in range(8)
+            }
+        }
+    }
 
 class TestPokemonModel(unittest.TestCase):
     def setUp(self):
@@ -19,14 +94,22 @@ class TestPokemonModel(unittest.TestCase):
                 {"base_stat": 50, "stat": {"name": "special-attack"}},
                 {"base_stat": 50, "stat": {"name": "special-defense"}},
                 {"base_stat": 90, "stat": {"name": "speed"}}
-            ]
+            ],
+            "abilities": [
+                {"ability": {"name": "static"}},
+                {"ability": {"name": "lightning-rod"}}
+            ],
+            "sprites": {"front_default": "https://example.com/25.png"},
+            "moves": [{"move": {"name": f"move-{i}"}} for i in range(100)]
         }
     
     def test_cache_pokemon(self):
         """Test caching Pokemon data."""
         self.model.cache_pokemon("pikachu", self.test_pokemon)
         cached = self.model.get_pokemon("pikachu")
-        self.assertEqual(cached, self.test_pokemon)
+        self.assertIsInstance(cached, PokemonRecord)
+        self.assertEqual(cached.name, "pikachu")
+        self.assertEqual(cached.id, 25)
     
     def test_cache_expiration(self):
         """Test cache expiration."""
@@ -65,5 +148,293 @@ class TestPokemonModel(unittest.TestCase):
         self.assertEqual(stats["size"], 0)
         self.assertEqual(stats["oldest_entry_age"], 0)
 
+    def test_name_and_id_share_entry(self):
+        """Test that a Pokemon's name and ID resolve to the same cache entry."""
+        self.model.cache_pokemon("pikachu", self.test_pokemon)
+        self.assertIs(self.model.get_pokemon("25"), self.model.get_pokemon("pikachu"))
+        self.assertIs(self.model.get_pokemon(25), self.model.get_pokemon("Pikachu"))
+        self.assertEqual(self.model.get_cache_stats()["size"], 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at capacity."""
+        model = PokemonModel(max_entries=2)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model.cache_pokemon("charizard", {"name": "charizard", "id": 6})
+        model.get_pokemon("pikachu")
+        model.cache_pokemon("bulbasaur", {"name": "bulbasaur", "id": 1})
+        self.assertIsNotNone(model.get_pokemon("pikachu"))
+        self.assertIsNone(model.get_pokemon("charizard"))
+        self.assertIsNone(model.get_pokemon("6"))
+        self.assertEqual(model.get_cache_stats()["evictions"], 1)
+
+    def test_fetch_pokemon_reads_through(self):
+        """Test that fetch_pokemon loads once on a miss and then serves from cache."""
+        calls = []
+
+        def loader(name_or_id):
+            calls.append(name_or_id)
+            return self.test_pokemon
+
+        model = PokemonModel(loader)
+        record = model.fetch_pokemon("25")
+        self.assertEqual(record.name, "pikachu")
+        self.assertIs(model.fetch_pokemon("pikachu"), record)
+        self.assertEqual(calls, ["25"])
+
+    def test_record_from_api(self):
+        """Test projecting a raw payload into a compact record."""
+        record = PokemonRecord.from_api(self.test_pokemon)
+        self.assertEqual(record.types, (PokemonType("electric", "https://pokeapi.co/api/v2/type/13/"),))
+        self.assertEqual(record.abilities, ("static", "lightning-rod"))
+        self.assertEqual(record.stats, PokemonStats(35, 55, 40, 50, 50, 90))
+        self.assertEqual(record.sprite, "https://example.com/25.png")
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(record["name"], "pikachu")
+        with self.assertRaises(KeyError):
+            record["moves"]
+
+    def test_record_to_dict(self):
+        """Test serializing a record."""
+        data = PokemonRecord.from_api(self.test_pokemon).to_dict()
+        self.assertEqual(data["id"], 25)
+        self.assertEqual(data["types"], [{"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"}])
+        self.assertEqual(data["stats"]["special_attack"], 50)
+        self.assertNotIn("moves", data)
+
+    def test_record_is_much_smaller_than_payload(self):
+        """Test that a record holds over 10x less memory than the raw payload."""
+        payload = _realistic_payload()
+        record = PokemonRecord.from_api(payload)
+        self.assertGreater(_deep_sizeof(payload), 10 * _deep_sizeof(record))
+
+    def test_record_shares_type_instances(self):
+        """Test that records share PokemonType instances."""
+        first = PokemonRecord.from_api(self.test_pokemon)
+        second = PokemonRecord.from_api(dict(self.test_pokemon, name="raichu", id=26))
+        self.assertIs(first.types[0], second.types[0])
+
+    def _counting_loader(self, release=None):
+        """Build a loader that records its calls, optionally blocking until released."""
+        calls = []
+
+        def loader(name_or_id):
+            if release is not None:
+                release.wait(timeout=5)
+            calls.append(name_or_id)
+            return dict(self.test_pokemon, sprites={"front_default": f"v{len(calls)}"})
+
+        return loader, calls
+
+    def _wait_for(self, condition):
+        """Poll until a condition holds or a second has passed."""
+        deadline = time.monotonic() + 1
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertTrue(condition())
+
+    def test_stale_entry_served_while_refreshing(self):
+        """Test that an entry past the soft TTL is served and refreshed in the background."""
+        release = threading.Event()
+        loader, calls = self._counting_loader(release)
+        model = PokemonModel(loader, soft_ttl=60, hard_ttl=600)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model._last_updated["pikachu"] = datetime.now() - timedelta(seconds=120)
+
+        stale = model.fetch_pokemon("pikachu")
+        self.assertEqual(stale.sprite, "https://example.com/25.png")
+        self.assertEqual(model.get_cache_stats()["stale_hits"], 1)
+
+        release.set()
+        self._wait_for(lambda: model.get_cache_stats()["refreshes"] == 1)
+        self.assertEqual(calls, ["pikachu"])
+        self.assertEqual(model.get_pokemon("25").sprite, "v1")
+
+    def test_hard_expired_entry_blocks_on_loader(self):
+        """Test that an entry past the hard TTL is reloaded synchronously."""
+        loader, calls = self._counting_loader()
+        model = PokemonModel(loader, soft_ttl=60, hard_ttl=600)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model._last_updated["pikachu"] = datetime.now() - timedelta(seconds=700)
+
+        self.assertEqual(model.fetch_pokemon("pikachu").sprite, "v1")
+        self.assertEqual(calls, ["pikachu"])
+        self.assertEqual(model.get_cache_stats()["stale_hits"], 0)
+
+    def test_popular_entry_refreshed_ahead_of_expiry(self):
+        """Test that a popular entry is refreshed before it reaches the soft TTL."""
+        loader, calls = self._counting_loader()
+        model = PokemonModel(loader, soft_ttl=100, hard_ttl=600, refresh_ahead=0.5, popular_hits=3)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model._last_updated["pikachu"] = datetime.now() - timedelta(seconds=60)
+
+        model.get_pokemon("pikachu")
+        model.get_pokemon("pikachu")
+        self.assertEqual(calls, [])
+        model.get_pokemon("pikachu")
+        self._wait_for(lambda: model.get_cache_stats()["refreshes"] == 1)
+        self.assertEqual(model.get_cache_stats()["stale_hits"], 0)
+
+    def test_refresh_uses_refresh_loader(self):
+        """Test that background refreshes go through the dedicated refresh loader."""
+        loader, calls = self._counting_loader()
+        refresh_loader, refresh_calls = self._counting_loader()
+        model = PokemonModel(loader, soft_ttl=60, hard_ttl=600, refresh_loader=refresh_loader)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model._last_updated["pikachu"] = datetime.now() - timedelta(seconds=120)
+
+        model.get_pokemon("pikachu")
+        self._wait_for(lambda: model.get_cache_stats()["refreshes"] == 1)
+        self.assertEqual(calls, [])
+        self.assertEqual(refresh_calls, ["pikachu"])
+
+    def test_refresh_does_not_resurrect_removed_entry(self):
+        """Test that a refresh finishing after a removal does not re-add the entry."""
+        release = threading.Event()
+        loader, calls = self._counting_loader(release)
+        model = PokemonModel(loader, soft_ttl=60, hard_ttl=600)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model._last_updated["pikachu"] = datetime.now() - timedelta(seconds=120)
+
+        model.get_pokemon("pikachu")
+        model.remove_from_cache("pikachu")
+        release.set()
+        self._wait_for(lambda: model.get_cache_stats()["refreshes_pending"] == 0)
+        self.assertEqual(calls, ["pikachu"])
+        self.assertEqual(model.get_cache_stats()["size"], 0)
+        self.assertEqual(model.get_cache_stats()["refreshes"], 0)
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        """Test that a failing background refresh leaves the stale entry in place."""
+        def loader(name_or_id):
+            raise ConnectionError("upstream down")
+
+        model = PokemonModel(loader, soft_ttl=60, hard_ttl=600)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model._last_updated["pikachu"] = datetime.now() - timedelta(seconds=120)
+
+        self.assertIsNotNone(model.get_pokemon("pikachu"))
+        self._wait_for(lambda: model.get_cache_stats()["refresh_failures"] == 1)
+        self.assertIsNotNone(model.get_pokemon("pikachu"))
+
+    def test_fetch_pokemon_without_loader(self):
+        """Test that a miss without a loader raises."""
+        with self.assertRaises(RuntimeError):
+            self.model.fetch_pokemon("pikachu")
+
+    def test_record_bytes_round_trip(self):
+        """Test the compact serialization used by shared backends."""
+        record = PokemonRecord.from_api(self.test_pokemon)
+        restored = PokemonRecord.from_bytes(record.to_bytes())
+        self.assertEqual(restored.to_dict(), record.to_dict())
+        self.assertIs(restored.types[0], record.types[0])
+        self.assertLess(len(record.to_bytes()), len(str(record.to_dict())))
+
+    def test_shared_backend_serves_other_models(self):
+        """Test that an entry loaded by one worker is a hit for another."""
+        backend = MemoryCacheBackend()
+        calls = []
+
+        def loader(name_or_id):
+            calls.append(name_or_id)
+            return self.test_pokemon
+
+        first = PokemonModel(loader, backend=backend)
+        second = PokemonModel(loader, backend=backend)
+        first.fetch_pokemon("pikachu")
+
+        record = second.fetch_pokemon(25)
+        self.assertEqual(record.name, "pikachu")
+        self.assertEqual(calls, ["pikachu"])
+        stats = second.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["shared_hits"], stats["misses"]), (1, 1, 0))
+        self.assertEqual(stats["backend"], "MemoryCacheBackend")
+        # The entry is now local as well, with the original load time
+        self.assertEqual(second._last_updated["pikachu"].replace(microsecond=0),
+                         first._last_updated["pikachu"].replace(microsecond=0))
+
+    def test_shared_backend_respects_ttl(self):
+        """Test that expired shared entries are misses."""
+        backend = MemoryCacheBackend()
+        PokemonModel(lambda name_or_id: self.test_pokemon, backend=backend, soft_ttl=60,
+                     hard_ttl=600).fetch_pokemon("pikachu")
+        value = backend.get("pikachu")
+        old = PokemonModel(soft_ttl=60, backend=backend)
+        self.assertIsNotNone(old.get_pokemon("pikachu"))
+
+        old.clear_cache()
+        self.assertIsNone(backend.get("pikachu"))
+        backend.set_many({"pikachu": b"\x00" * 8 + value[8:]}, ttl=600)  # loaded in 1970
+        self.assertIsNone(old.get_pokemon("pikachu"))
+
+    def test_remove_from_cache_removes_shared_aliases(self):
+        """Test that removal is visible to other workers under every alias."""
+        backend = MemoryCacheBackend()
+        first = PokemonModel(backend=backend)
+        first.cache_pokemon("pikachu", self.test_pokemon)
+
+        PokemonModel(backend=backend).remove_from_cache(25)
+        for alias in ("pikachu", "25"):
+            self.assertIsNone(backend.get(alias))
+
+    def test_backend_failures_are_misses(self):
+        """Test that an unavailable backend degrades to the local cache."""
+        class BrokenBackend(MemoryCacheBackend):
+            def get(self, key):
+                raise CacheBackendError("down")
+
+            def set_many(self, items, ttl):
+                raise CacheBackendError("down")
+
+        model = PokemonModel(lambda name_or_id: self.test_pokemon, backend=BrokenBackend())
+        self.assertEqual(model.fetch_pokemon("pikachu").name, "pikachu")
+        self.assertEqual(model.fetch_pokemon("pikachu").name, "pikachu")
+        self.assertEqual(model.get_cache_stats()["backend_errors"], 2)
+
+    def test_record_memory_size(self):
+        """Test that the measured size tracks the actual object graph."""
+        record = PokemonRecord.from_api(self.test_pokemon)
+        # Types and stat field names are shared by every record
+        shared = (sum(_deep_sizeof(t) for t in record.types)
+                  + sum(sys.getsizeof(name) for name in vars(record.stats)))
+        expected = _deep_sizeof(record) - shared
+        self.assertGreater(record.memory_size(), expected * 0.75)
+        self.assertLess(record.memory_size(), expected * 1.25)
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test that total measured size stays under the byte budget."""
+        size = PokemonRecord.from_api(dict(self.test_pokemon, name="pokemon-0")).memory_size()
+        model = PokemonModel(max_entries=100, max_bytes=int(size * 2.5))
+        for i in range(1, 4):
+            model.cache_pokemon(f"pokemon-{i}", dict(self.test_pokemon, name=f"pokemon-{i}", id=i))
+            model.get_pokemon("pokemon-1")  # keep the first entry recently used
+
+        stats = model.get_cache_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertIsNone(model.get_pokemon("pokemon-2"))
+        self.assertIsNotNone(model.get_pokemon("pokemon-1"))
+        self.assertLessEqual(stats["bytes_used"], stats["max_bytes"])
+        self.assertEqual(stats["bytes_used"], sum(model._entry_sizes.values()))
+        self.assertAlmostEqual(stats["bytes_evicted"], size, delta=size * 0.05)
+
+    def test_byte_accounting_on_replace_and_remove(self):
+        """Test that replaced and removed entries release their bytes."""
+        model = PokemonModel(max_bytes=10 ** 6)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        self.assertEqual(model.get_cache_stats()["bytes_used"], model._entry_sizes["pikachu"])
+        model.cache_pokemon(25, self.test_pokemon)
+        self.assertEqual(model.get_cache_stats()["bytes_used"], model._entry_sizes["pikachu"])
+        model.remove_from_cache("pikachu")
+        self.assertEqual(model.get_cache_stats()["bytes_used"], 0)
+        model.cache_pokemon("pikachu", self.test_pokemon)
+        model.clear_cache()
+        self.assertEqual(model.get_cache_stats()["bytes_used"], 0)
+
+    def test_entry_larger_than_budget_is_not_kept(self):
+        """Test that an entry over the whole budget is returned but not cached."""
+        model = PokemonModel(max_bytes=10)
+        self.assertEqual(model.cache_pokemon("pikachu", self.test_pokemon).name, "pikachu")
+        self.assertIsNone(model.get_pokemon("pikachu"))
+        self.assertEqual(model.get_cache_stats()["bytes_used"], 0)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,273 @@
+import hashlib
+import sqlite3
+
+import pytest
+
+from config import Config
+from pokemon import routes
+from pokemon.app import create_app
+from pokemon.db import db
+from pokemon.models.pokemon_model import PokemonRecord
+from pokemon.models.user_model import identity_cache
+
+
+@pytest.fixture
+def logged_in(client, monkeypatch):
+    """A client logged in as a fresh user, with Pokemon lookups stubbed out."""
+    monkeypatch.setattr(
+        routes.pokemon_model, "fetch_pokemon",
+        lambda name_or_id: PokemonRecord(int(name_or_id), f"pokemon-{name_or_id}")
+    )
+    client.put("/api/create-user", json={"username": "ash", "password": "pikachu123"})
+    client.post("/api/login", json={"username": "ash", "password": "pikachu123"})
+    return client
+
+
+##########################################################
+# Bearer tokens
+##########################################################
+
+class TokenConfig(Config):
+    AUTH_TOKENS = True
+
+
+@pytest.fixture
+def token_client():
+    """A client of an app in token mode, with no app context held across requests."""
+    app = create_app(TokenConfig)
+    yield app.test_client()
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+    identity_cache.clear()
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_login_returns_token_instead_of_session(token_client):
+    token_client.put("/api/create-user", json={"username": "ash", "password": "pikachu123"})
+    response = token_client.post("/api/login", json={"username": "ash", "password": "pikachu123"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["expires_in"] == 3600
+
+    assert token_client.get("/api/favorites").status_code == 401  # no session cookie
+    assert token_client.get("/api/favorites", headers=_bearer(body["token"])).status_code == 200
+    assert token_client.get("/api/favorites", headers=_bearer("forged")).status_code == 401
+    assert token_client.get("/api/favorites", headers={"Authorization": "Basic abc"}).status_code == 401
+
+
+def test_valid_token_needs_no_user_query(token_client):
+    token_client.put("/api/create-user", json={"username": "ash", "password": "pikachu123"})
+    token = token_client.post("/api/login", json={"username": "ash", "password": "pikachu123"}).get_json()["token"]
+    token_client.get("/api/favorites", headers=_bearer(token))
+
+    before = identity_cache.get_stats()
+    for _ in range(3):
+        assert token_client.get("/api/favorites", headers=_bearer(token)).status_code == 200
+    after = identity_cache.get_stats()
+    assert after["hits"] - before["hits"] == 3
+    assert after["misses"] == before["misses"]
+
+
+def test_password_change_revokes_tokens(token_client):
+    token_client.put("/api/create-user", json={"username": "ash", "password": "pikachu123"})
+    old = token_client.post("/api/login", json={"username": "ash", "password": "pikachu123"}).get_json()["token"]
+
+    response = token_client.post("/api/change-password", json={"new_password": "raichu123"}, headers=_bearer(old))
+    assert response.status_code == 200
+    new = response.get_json()["token"]
+
+    assert token_client.get("/api/favorites", headers=_bearer(old)).status_code == 401
+    assert token_client.get("/api/favorites", headers=_bearer(new)).status_code == 200
+
+
+##########################################################
+# Schema upgrade
+##########################################################
+
+def test_app_upgrades_schema_without_password_version(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(80) UNIQUE NOT NULL,"
+                 " salt VARCHAR(32) NOT NULL, password VARCHAR(64) NOT NULL)")
+    salt = "ab" * 16
+    conn.execute("INSERT INTO users (username, salt, password) VALUES (?, ?, ?)",
+                 ("ash", salt, hashlib.sha256(("pikachu123" + salt).encode()).hexdigest()))
+    conn.commit()
+    conn.close()
+
+    class OldDatabaseConfig(TokenConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+
+    app = create_app(OldDatabaseConfig)
+    client = app.test_client()
+    try:
+        response = client.post("/api/login", json={"username": "ash", "password": "pikachu123"})
+        assert response.status_code == 200
+        assert client.get("/api/favorites", headers=_bearer(response.get_json()["token"])).status_code == 200
+        assert client.put("/api/create-user", json={"username": "misty", "password": "starmie123"}).status_code == 201
+        assert client.post("/api/login", json={"username": "misty", "password": "starmie123"}).status_code == 200
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        identity_cache.clear()
+
+
+##########################################################
+# Favorites pagination
+##########################################################
+
+def test_get_favorites_paginates(logged_in):
+    for pokemon_id in (1, 4, 7):
+        logged_in.post("/api/favorites", json={"pokemon_id": pokemon_id})
+
+    first = logged_in.get("/api/favorites?limit=2").get_json()
+    assert [p["id"] for p in first["favorites"]] == [1, 4]
+    second = logged_in.get(f"/api/favorites?limit=2&after={first['next_cursor']}").get_json()
+    assert [p["id"] for p in second["favorites"]] == [7]
+    assert second["next_cursor"] is None
+
+
+def test_get_favorites_etag_and_304(logged_in):
+    logged_in.post("/api/favorites", json={"pokemon_id": 25})
+    response = logged_in.get("/api/favorites")
+    etag = response.headers["ETag"]
+    assert not etag.startswith("W/")
+
+    cached = logged_in.get("/api/favorites", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    logged_in.post("/api/favorites", json={"pokemon_id": 6})
+    changed = logged_in.get("/api/favorites", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_get_favorites_etag_depends_on_page(logged_in):
+    logged_in.post("/api/favorites", json={"pokemon_id": 25})
+    full = logged_in.get("/api/favorites").headers["ETag"]
+    page = logged_in.get("/api/favorites?limit=1").headers["ETag"]
+    assert full != page
+
+
+##########################################################
+# Batch favorites
+##########################################################
+
+def test_batch_favorites(logged_in, monkeypatch):
+    def fetch(name_or_id):
+        if name_or_id == "missingno":
+            raise ValueError("not found")
+        return PokemonRecord(int(name_or_id), f"pokemon-{name_or_id}")
+
+    monkeypatch.setattr(routes.pokemon_model, "fetch_pokemon", fetch)
+    logged_in.post("/api/favorites", json={"pokemon_id": 25})
+
+    response = logged_in.post("/api/favorites/batch", json={
+        "add": [1, "missingno", 4, 25],
+        "remove": [25, 150]
+    })
+    assert response.status_code == 200
+    statuses = [(r["pokemon_id"], r["action"], r["status"]) for r in response.get_json()["results"]]
+    assert statuses == [
+        (25, "remove", "removed"),
+        (150, "remove", "not_found"),
+        (1, "add", "added"),
+        ("missingno", "add", "error"),
+        (4, "add", "added"),
+        (25, "add", "added"),
+    ]
+    favorites = logged_in.get("/api/favorites").get_json()["favorites"]
+    assert [p["id"] for p in favorites] == [1, 4, 25]
+
+
+def test_batch_favorites_validation(logged_in):
+    assert logged_in.post("/api/favorites/batch", json={"add": 5}).status_code == 400
+    assert logged_in.post("/api/favorites/batch", json={"remove": ["pikachu"]}).status_code == 400
+    too_many = {"add": list(range(routes.MAX_BATCH_SIZE + 1))}
+    assert logged_in.post("/api/favorites/batch", json=too_many).status_code == 400
+
+
+##########################################################
+# Top favorites
+##########################################################
+
+def test_top_favorites(logged_in):
+    for pokemon_id in (25, 6):
+        logged_in.post("/api/favorites", json={"pokemon_id": pokemon_id})
+    logged_in.put("/api/create-user", json={"username": "misty", "password": "starmie123"})
+    logged_in.post("/api/login", json={"username": "misty", "password": "starmie123"})
+    logged_in.post("/api/favorites", json={"pokemon_id": 25})
+    logged_in.post("/api/logout")
+
+    response = logged_in.get("/api/favorites/top?k=5")
+    assert response.status_code == 200
+    top = response.get_json()["top"]
+    assert [(entry["pokemon"]["id"], entry["count"]) for entry in top] == [(25, 2), (6, 1)]
+    assert len(logged_in.get("/api/favorites/top?k=1").get_json()["top"]) == 1
+
+
+##########################################################
+# Team analytics
+##########################################################
+
+def test_favorites_team(logged_in):
+    for pokemon_id in (25, 6):
+        logged_in.post("/api/favorites", json={"pokemon_id": pokemon_id})
+    team = logged_in.get("/api/favorites/team").get_json()["team"]
+    assert team["size"] == 2
+    assert team["stats"] is None  # stubbed records carry no stats
+
+
+def test_compare_teams(logged_in):
+    response = logged_in.post("/api/teams/compare", json={"teams": [[25, 6], [6], [25, 6, 1]]})
+    assert response.status_code == 200
+    assert [team["size"] for team in response.get_json()["teams"]] == [2, 1, 3]
+
+
+def test_compare_teams_validation(logged_in):
+    assert logged_in.post("/api/teams/compare", json={"teams": []}).status_code == 400
+    assert logged_in.post("/api/teams/compare", json={"teams": [25]}).status_code == 400
+    assert logged_in.post("/api/teams/compare", json={"teams": [["missingno"]]}).status_code == 404
+
+
+def test_favorites_matchups(logged_in):
+    assert logged_in.post("/api/favorites/matchups", json={"opponents": [6]}).status_code == 400
+    logged_in.post("/api/favorites", json={"pokemon_id": 25})
+
+    response = logged_in.post("/api/favorites/matchups", json={"opponents": [6, 130]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [entry["best_counter"] for entry in body["opponents"]] == ["pokemon-25", "pokemon-25"]
+    assert body["score"] == 0.0  # stubbed records have no types
+    assert logged_in.post("/api/favorites/matchups", json={"opponents": ["missingno"]}).status_code == 404
+
+
+
+##########################################################
+# Identity cache
+##########################################################
+
+def test_load_user_returns_cached_identity(app, logged_in):
+    from pokemon.models.user_model import UserIdentity, identity_cache
+
+    load_user = app.login_manager._user_callback
+    identity = load_user("ash")
+    hits = identity_cache.get_stats()["hits"]
+    assert isinstance(identity, UserIdentity)
+    assert load_user("ash") is identity
+    assert identity_cache.get_stats()["hits"] == hits + 1
+
+
+def test_reset_users_clears_identity_cache(app, logged_in):
+    from pokemon.models.user_model import identity_cache
+
+    app.login_manager._user_callback("ash")
+    assert identity_cache.get_stats()["size"] == 1
+    logged_in.delete("/api/reset-users")
+    assert identity_cache.get_stats()["size"] == 0
+    assert app.login_manager._user_callback("ash") is None
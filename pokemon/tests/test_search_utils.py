@@ -0,0 +1,48 @@
+import pytest
+
+from pokemon.utils.search_utils import NameIndex
+
+
+def _entry(name, id):
+    return {"name": name, "url": f"https://pokeapi.co/api/v2/pokemon/{id}/"}
+
+
+@pytest.fixture
+def index():
+    return NameIndex([
+        _entry("pikachu", 25),
+        _entry("pichu", 172),
+        _entry("raichu", 26),
+        _entry("charmander", 4),
+        _entry("charmeleon", 5),
+        _entry("charizard", 6),
+        _entry("bulbasaur", 1),
+    ])
+
+
+def test_prefix_search_is_alphabetical(index):
+    results = index.prefix_search("char")
+    assert [r["name"] for r in results] == ["charizard", "charmander", "charmeleon"]
+    assert results[0]["id"] == 6
+
+
+def test_prefix_search_respects_limit(index):
+    assert len(index.prefix_search("char", limit=2)) == 2
+
+
+def test_prefix_search_no_match(index):
+    assert index.prefix_search("zz") == []
+
+
+def test_fuzzy_search_tolerates_typos(index):
+    results = index.fuzzy_search("pikachoo")
+    assert results[0]["name"] == "pikachu"
+
+
+def test_search_prefers_prefix_matches(index):
+    results = index.search("pi", limit=5)
+    assert [r["name"] for r in results[:2]] == ["pichu", "pikachu"]
+
+
+def test_search_is_case_insensitive(index):
+    assert index.search("BULBA")[0]["name"] == "bulbasaur"
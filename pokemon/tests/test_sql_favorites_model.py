@@ -0,0 +1,153 @@
+import pytest
+
+from pokemon.db import db
+from pokemon.models.favorites_model import Favorites, SqlFavoritesModel
+from pokemon.models.pokemon_model import PokemonRecord
+from pokemon.models.user_model import Users
+
+
+@pytest.fixture
+def model(session):
+    Users.create_user("ash", "pikachu123")
+    Users.create_user("misty", "starmie123")
+    return SqlFavoritesModel()
+
+
+@pytest.fixture
+def pikachu():
+    return {
+        "name": "pikachu",
+        "id": 25,
+        "types": [{"type": {"name": "electric", "url": "https://pokeapi.co/api/v2/type/13/"}}]
+    }
+
+
+def test_add_and_get_favorites(model, pikachu):
+    assert model.add_favorite("ash", pikachu) is True
+    assert model.add_favorite("ash", {"name": "charizard", "id": 6}) is True
+    favorites = model.get_favorites("ash")
+    assert [p.name for p in favorites] == ["pikachu", "charizard"]
+    assert isinstance(favorites[0], PokemonRecord)
+    assert favorites[0].types[0].name == "electric"
+
+
+def test_add_duplicate_favorite(model, pikachu):
+    assert model.add_favorite("ash", pikachu) is True
+    assert model.add_favorite("ash", pikachu) is False
+    assert len(model.get_favorites("ash")) == 1
+
+
+def test_add_favorite_unknown_user(model, pikachu):
+    assert model.add_favorite("gary", pikachu) is False
+    assert db.session.query(Favorites).count() == 0
+
+
+def test_remove_favorite(model, pikachu):
+    model.add_favorite("ash", pikachu)
+    assert model.remove_favorite("ash", 25) is True
+    assert model.remove_favorite("ash", 25) is False
+    assert model.get_favorites("ash") == []
+
+
+def test_is_favorite(model, pikachu):
+    model.add_favorite("ash", pikachu)
+    assert model.is_favorite("ash", 25) is True
+    assert model.is_favorite("ash", 6) is False
+    assert model.is_favorite("misty", 25) is False
+
+
+def test_users_are_isolated(model, pikachu):
+    model.add_favorite("ash", pikachu)
+    model.add_favorite("misty", pikachu)
+    model.remove_favorite("misty", 25)
+    assert [p.id for p in model.get_favorites("ash")] == [25]
+    assert model.get_favorites("misty") == []
+
+
+def test_favorites_table_has_unique_user_pokemon_index():
+    indexes = {index.name: index for index in Favorites.__table__.indexes}
+    index = indexes["ix_favorites_user_pokemon"]
+    assert index.unique
+    assert [column.name for column in index.columns] == ["user_id", "pokemon_id"]
+    assert [fk.target_fullname for fk in Favorites.__table__.c.user_id.foreign_keys] == ["users.id"]
+
+
+def test_get_favorites_page(model):
+    for pokemon_id in (1, 4, 7, 25, 6):
+        model.add_favorite("ash", {"name": f"p{pokemon_id}", "id": pokemon_id})
+    model.add_favorite("misty", {"name": "p120", "id": 120})
+
+    page, cursor = model.get_favorites_page("ash", 3)
+    assert [p.id for p in page] == [1, 4, 7]
+    page, cursor = model.get_favorites_page("ash", 3, cursor)
+    assert [p.id for p in page] == [25, 6]
+    assert cursor is None
+
+
+def test_version_changes_on_every_mutation(model, pikachu):
+    versions = [model.get_version("ash")]
+    model.add_favorite("ash", pikachu)
+    versions.append(model.get_version("ash"))
+    model.add_favorite("ash", pikachu)
+    assert model.get_version("ash") == versions[-1]
+    model.remove_favorite("ash", 25)
+    versions.append(model.get_version("ash"))
+    model.add_favorite("ash", pikachu)
+    versions.append(model.get_version("ash"))
+    assert versions[1] != versions[0]
+    assert versions[2] != versions[1]
+    assert versions[3] not in versions[:3]
+    assert versions[2] == versions[0]  # both empty, the representation is identical
+
+
+def test_apply_batch(model, pikachu):
+    model.add_favorite("ash", pikachu)
+    results = model.apply_batch(
+        "ash",
+        [PokemonRecord(6, "charizard"), PokemonRecord(6, "charizard"), PokemonRecord(25, "pikachu")],
+        [25, 999]
+    )
+    assert [(r["pokemon_id"], r["action"], r["status"]) for r in results] == [
+        (25, "remove", "removed"),
+        (999, "remove", "not_found"),
+        (6, "add", "added"),
+        (6, "add", "already_favorite"),
+        (25, "add", "added"),
+    ]
+    assert [p.id for p in model.get_favorites("ash")] == [6, 25]
+
+
+def test_apply_batch_unknown_user(model):
+    with pytest.raises(ValueError, match="User gary not found"):
+        model.apply_batch("gary", [PokemonRecord(6, "charizard")], [])
+
+
+def test_get_top_favorites(model, pikachu):
+    Users.create_user("brock", "onix12345")
+    for username in ("ash", "misty", "brock"):
+        model.add_favorite(username, pikachu)
+    model.add_favorite("ash", {"name": "charizard", "id": 6})
+    model.apply_batch("misty", [PokemonRecord(121, "starmie")], [25])
+    model.apply_batch("brock", [PokemonRecord(121, "starmie"), PokemonRecord(6, "charizard")], [])
+    model.remove_favorite("ash", 6)
+    model.add_favorite("gary", pikachu)  # unknown user, not counted
+
+    top = model.get_top_favorites(10)
+    assert [(pokemon.name, count) for pokemon, count in top] == [
+        ("pikachu", 2), ("starmie", 2), ("charizard", 1)
+    ]
+    assert len(model.get_top_favorites(1)) == 1
+
+
+def test_deleting_user_releases_counts(model, pikachu):
+    model.add_favorite("ash", pikachu)
+    model.add_favorite("misty", pikachu)
+    model.add_favorite("misty", {"name": "starmie", "id": 121})
+
+    Users.delete_user("ash")
+    assert [(pokemon.name, count) for pokemon, count in model.get_top_favorites(10)] == [
+        ("pikachu", 1), ("starmie", 1)
+    ]
+    Users.delete_user("misty")
+    assert model.get_top_favorites(10) == []
+    assert db.session.execute(db.select(Favorites)).first() is None
@@ -0,0 +1,54 @@
+import unittest
+
+from pokemon.models.pokemon_model import PokemonRecord, PokemonStats, PokemonType
+from pokemon.models.team_model import analyze_team, compare_teams
+
+ELECTRIC = PokemonType("electric", "")
+FIRE = PokemonType("fire", "")
+FLYING = PokemonType("flying", "")
+
+
+class TestTeamModel(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.pikachu = PokemonRecord(25, "pikachu", (ELECTRIC,), stats=PokemonStats(35, 55, 40, 50, 50, 90))
+        self.charizard = PokemonRecord(6, "charizard", (FIRE, FLYING), stats=PokemonStats(78, 84, 78, 109, 85, 100))
+        self.zapdos = PokemonRecord(145, "zapdos", (ELECTRIC, FLYING), stats=PokemonStats(90, 90, 85, 125, 90, 100))
+
+    def test_analyze_team(self):
+        """Test stat aggregates and type distribution of one team."""
+        result = analyze_team([self.pikachu, self.charizard])
+        self.assertEqual(result["size"], 2)
+        self.assertEqual(result["stats"]["hp"], {"total": 113.0, "mean": 56.5, "min": 35.0, "max": 78.0})
+        self.assertEqual(result["stats"]["speed"]["max"], 100.0)
+        self.assertEqual(result["base_stat_total"], (320 + 534) / 2)
+        self.assertEqual(result["types"], {"electric": 1, "fire": 1, "flying": 1})
+
+    def test_members_without_stats(self):
+        """Test that members without stats only count towards size and types."""
+        result = analyze_team([self.pikachu, PokemonRecord(6, "charizard", (FIRE,))])
+        self.assertEqual(result["size"], 2)
+        self.assertEqual(result["stats"]["attack"]["mean"], 55.0)
+        self.assertEqual(result["types"], {"electric": 1, "fire": 1})
+
+        empty = analyze_team([PokemonRecord(1, "bulbasaur")])
+        self.assertIsNone(empty["stats"])
+        self.assertIsNone(empty["base_stat_total"])
+
+    def test_compare_teams_matches_individual_analysis(self):
+        """Test that the batched comparison equals analyzing teams one by one."""
+        teams = [
+            [self.pikachu, self.charizard],
+            [self.charizard, self.zapdos, self.pikachu],
+            [self.zapdos],
+            []
+        ]
+        results = compare_teams(teams)
+        self.assertEqual(results, [analyze_team(team) for team in teams])
+        self.assertEqual(results[1]["types"], {"electric": 2, "fire": 1, "flying": 2})
+        self.assertEqual(results[3], {"size": 0, "stats": None, "base_stat_total": None, "types": {}})
+        self.assertEqual(compare_teams([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import time
+
+from pokemon.utils.token_utils import TokenSigner
+
+
+def test_issue_and_verify():
+    signer = TokenSigner("secret")
+    token = signer.issue("ash", 3)
+    assert signer.verify(token) == ("ash", 3)
+
+
+def test_rejects_forged_and_malformed_tokens():
+    signer = TokenSigner("secret")
+    token = signer.issue("ash", 1)
+    assert TokenSigner("other-secret").verify(token) is None
+    assert TokenSigner("secret", salt="other-purpose").verify(token) is None
+    assert signer.verify(token[:-2] + ("AA" if not token.endswith("AA") else "BB")) is None
+    assert signer.verify("not-a-token") is None
+
+
+def test_rejects_expired_tokens():
+    token = TokenSigner("secret").issue("ash", 1)
+    time.sleep(1.1)
+    assert TokenSigner("secret", ttl=0.5).verify(token) is None
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from pokemon.models.pokemon_model import PokemonRecord, PokemonType
+from pokemon.models.type_model import TYPE_NAMES, TypeChart
+
+
+def _pokemon(id, name, *types):
+    return PokemonRecord(id, name, tuple(PokemonType(t, "") for t in types))
+
+
+class TestTypeChart(unittest.TestCase):
+    def setUp(self):
+        """Set up test cases."""
+        self.chart = TypeChart()
+        self.pikachu = _pokemon(25, "pikachu", "electric")
+        self.charizard = _pokemon(6, "charizard", "fire", "flying")
+        self.gyarados = _pokemon(130, "gyarados", "water", "flying")
+        self.golem = _pokemon(76, "golem", "rock", "ground")
+
+    def test_matrix(self):
+        """Test the shape and a few entries of the multiplier matrix."""
+        matrix = self.chart.multipliers
+        self.assertEqual(matrix.shape, (18, 18))
+        index = {name: i for i, name in enumerate(TYPE_NAMES)}
+        self.assertEqual(matrix[index["water"], index["fire"]], 2.0)
+        self.assertEqual(matrix[index["fire"], index["water"]], 0.5)
+        self.assertEqual(matrix[index["ghost"], index["normal"]], 0.0)
+        self.assertEqual(matrix[index["normal"], index["normal"]], 1.0)
+
+    def test_dual_types_multiply(self):
+        """Test that dual types combine by elementwise product."""
+        self.assertEqual(self.chart.effectiveness("rock", self.charizard), 4.0)
+        self.assertEqual(self.chart.effectiveness("electric", self.gyarados), 4.0)
+        self.assertEqual(self.chart.effectiveness("water", self.golem), 4.0)
+        self.assertEqual(self.chart.effectiveness("electric", self.golem), 0.0)
+        self.assertEqual(self.chart.effectiveness("ground", self.charizard), 0.0)
+        self.assertEqual(self.chart.effectiveness("fire", self.pikachu), 1.0)
+
+    def test_score_matchups(self):
+        """Test scoring a team against several opponents at once."""
+        result = self.chart.score_matchups([self.pikachu, self.golem], [self.gyarados, self.charizard])
+        gyarados, charizard = result["opponents"]
+        # Pikachu hits Gyarados 4x and takes 1x; Gyarados hits Golem 4x with water
+        self.assertEqual(gyarados["best_counter"], "pikachu")
+        self.assertEqual(gyarados["score"], np.log2(4) - np.log2(1))
+        self.assertEqual(gyarados["threatened"], ["golem"])
+        # Golem hits Charizard 4x with rock and resists both its types
+        self.assertEqual(charizard["best_counter"], "golem")
+        self.assertEqual(charizard["score"], np.log2(4) - np.log2(0.5))
+        self.assertEqual(charizard["threatened"], [])
+        self.assertAlmostEqual(result["score"], (gyarados["score"] + charizard["score"]) / 2)
+
+    def test_score_matchups_batched_equals_single(self):
+        """Test that scoring many opponents equals scoring them one by one."""
+        team = [self.pikachu, self.charizard, _pokemon(0, "missingno")]
+        opponents = [self.gyarados, self.golem, self.pikachu, _pokemon(1, "unknown", "shadow")]
+        batched = self.chart.score_matchups(team, opponents)["opponents"]
+        single = [self.chart.score_matchups(team, [opponent])["opponents"][0] for opponent in opponents]
+        self.assertEqual(batched, single)
+
+    def test_score_matchups_requires_team_and_opponents(self):
+        """Test that empty inputs are rejected."""
+        with self.assertRaises(ValueError):
+            self.chart.score_matchups([], [self.pikachu])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import pytest
 
-from pokemon.models.user_model import Users
+import hashlib
+
+from pokemon.models.user_model import UserIdentity, Users, identity_cache, password_hasher
 
 
 @pytest.fixture
@@ -26,7 +28,10 @@ def test_create_user(session, sample_user):
     assert user is not None, "User should be created in the database."
     assert user.username == sample_user["username"], "Username should match the input."
     assert len(user.salt) == 32, "Salt should be 32 characters (hex)."
-    assert len(user.password) == 64, "Password should be a 64-character SHA-256 hash."
+    algorithm, params, salt, key = user.password.split("$")
+    assert (algorithm, params) == ("pbkdf2_sha256", "i=1000"), "Hash should carry its algorithm and cost."
+    assert salt == user.salt, "Hash should embed the salt."
+    assert len(key) == 64, "Derived key should be 32 bytes (hex)."
 
 def test_create_duplicate_user(session, sample_user):
     """Test attempting to create a user with a duplicate username."""
@@ -38,6 +43,32 @@ def test_create_duplicate_user(session, sample_user):
 # User Authentication
 ##########################################################
 
+def test_create_users(session, sample_user):
+    """Test bulk creation skipping repeated and existing usernames."""
+    Users.create_user(**sample_user)
+    created, skipped = Users.create_users([
+        ("ash", "pikachu123"),
+        (sample_user["username"], "otherpassword"),
+        ("misty", "starmie123"),
+        ("ash", "raichu123"),
+    ])
+
+    assert created == ["ash", "misty"]
+    assert sorted(skipped) == ["ash", sample_user["username"]]
+    assert Users.check_password("ash", "pikachu123") is True
+    assert Users.check_password("misty", "starmie123") is True
+    assert Users.check_password(sample_user["username"], sample_user["password"]) is True
+    assert Users.create_users([("ash", "pikachu123")]) == ([], ["ash"])
+
+
+def test_authenticate(session, sample_user):
+    """Test that authenticate returns the user only for the right password."""
+    Users.create_user(**sample_user)
+    user = Users.authenticate(**sample_user)
+    assert user is not None and user.username == sample_user["username"]
+    assert Users.authenticate(sample_user["username"], "wrongpassword") is None
+
+
 def test_check_password_correct(session, sample_user):
     """Test checking the correct password."""
     Users.create_user(**sample_user)
@@ -53,6 +84,32 @@ def test_check_password_user_not_found(session):
     with pytest.raises(ValueError, match="User nonexistentuser not found"):
         Users.check_password("nonexistentuser", "password")
 
+def test_legacy_hash_rehashed_on_login(session, sample_user):
+    """Test that a legacy SHA-256 hash is upgraded after a successful login."""
+    salt = "00" * 16
+    legacy = hashlib.sha256((sample_user["password"] + salt).encode()).hexdigest()
+    session.add(Users(username=sample_user["username"], salt=salt, password=legacy))
+    session.commit()
+
+    assert Users.check_password(sample_user["username"], "wrongpassword") is False
+    assert Users.query.filter_by(username=sample_user["username"]).first().password == legacy
+
+    assert Users.check_password(sample_user["username"], sample_user["password"]) is True
+    user = Users.query.filter_by(username=sample_user["username"]).first()
+    assert user.password.startswith("pbkdf2_sha256$i=1000$")
+    assert Users.check_password(sample_user["username"], sample_user["password"]) is True
+
+def test_hash_rehashed_when_cost_changes(session, sample_user):
+    """Test that raising the cost upgrades hashes on the next login."""
+    Users.create_user(**sample_user)
+    password_hasher.configure(iterations=2000, workers=0)
+    try:
+        assert Users.check_password(sample_user["username"], sample_user["password"]) is True
+        user = Users.query.filter_by(username=sample_user["username"]).first()
+        assert user.password.startswith("pbkdf2_sha256$i=2000$")
+    finally:
+        password_hasher.configure(iterations=1000, workers=0)
+
 ##########################################################
 # Update Password
 ##########################################################
@@ -64,6 +121,14 @@ def test_update_password(session, sample_user):
     Users.update_password(sample_user["username"], new_password)
     assert Users.check_password(sample_user["username"], new_password) is True, "Password should be updated successfully."
 
+def test_update_password_bumps_version(session, sample_user):
+    """Test that a password change bumps the version carried by bearer tokens."""
+    Users.create_user(**sample_user)
+    assert Users.load_identity(sample_user["username"]).password_version == 1
+    Users.update_password(sample_user["username"], "newpassword456")
+    assert Users.load_identity(sample_user["username"]).password_version == 2
+
+
 def test_update_password_user_not_found(session):
     """Test updating the password for a non-existent user."""
     with pytest.raises(ValueError, match="User nonexistentuser not found"):
@@ -112,3 +177,40 @@ def test_get_id_by_username_user_not_found(session):
     """
     with pytest.raises(ValueError, match="User nonexistentuser not found"):
         Users.get_id_by_username("nonexistentuser")
+
+
+##########################################################
+# Identity Cache
+##########################################################
+
+def test_load_identity_is_cached(session, sample_user):
+    """Test that repeated loads are served without querying the user again."""
+    Users.create_user(**sample_user)
+    before = identity_cache.get_stats()
+    first = Users.load_identity(sample_user["username"])
+    second = Users.load_identity(sample_user["username"])
+    after = identity_cache.get_stats()
+
+    assert isinstance(first, UserIdentity)
+    assert first.get_id() == sample_user["username"]
+    assert first.id == Users.get_id_by_username(sample_user["username"])
+    assert second is first
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+
+
+def test_load_identity_user_not_found(session):
+    """Test that unknown users are not cached."""
+    assert Users.load_identity("nonexistentuser") is None
+    assert identity_cache.get_stats()["size"] == 0
+
+
+def test_identity_invalidated_by_password_update_and_delete(session, sample_user):
+    """Test that changing or deleting a user drops the cached identity."""
+    Users.create_user(**sample_user)
+    first = Users.load_identity(sample_user["username"])
+    Users.update_password(sample_user["username"], "newpassword456")
+    assert Users.load_identity(sample_user["username"]) is not first
+
+    Users.delete_user(sample_user["username"])
+    assert Users.load_identity(sample_user["username"]) is None
@@ -0,0 +1,106 @@
+from pokemon.api import PokemonAPI
+from pokemon.models.pokemon_model import PokemonModel
+from pokemon.utils.sql_utils import ResponseCache
+from pokemon.warmup import main, warm_up
+
+
+class FakeAPI(PokemonAPI):
+    """PokemonAPI serving a tiny Pokedex from memory."""
+    def __init__(self, failing=()):
+        super().__init__()
+        self.failing = set(failing)
+        self.requested = []
+
+    def _make_request(self, endpoint, revalidate=False):
+        if endpoint.startswith("pokemon?"):
+            return {"results": [
+                {"name": name, "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+                for i, name in enumerate(["bulbasaur", "ivysaur", "venusaur"], start=1)
+            ]}
+        if endpoint.startswith("evolution-chain?"):
+            return {"results": [{"url": "https://pokeapi.co/api/v2/evolution-chain/1/"}]}
+        self.requested.append(endpoint)
+        if endpoint in self.failing:
+            raise ConnectionError("upstream down")
+        name = endpoint.split("/", 1)[1]
+        return {"name": name, "id": len(self.requested)}
+
+
+def test_warm_up_fetches_everything():
+    api = FakeAPI()
+    model = PokemonModel()
+    report = warm_up(api, model, workers=4)
+
+    assert report.total == 4
+    assert report.fetched == 4
+    assert report.failures == []
+    assert sorted(api.requested) == [
+        "evolution-chain/1", "pokemon/bulbasaur", "pokemon/ivysaur", "pokemon/venusaur"
+    ]
+    assert model.get_pokemon("ivysaur") is not None
+    assert model.get_cache_stats()["size"] == 3
+
+
+def test_warm_up_serves_lookups_by_id(monkeypatch, tmp_path):
+    names = ["bulbasaur", "ivysaur", "venusaur"]
+    requested = []
+
+    class Response:
+        status_code = 200
+        headers = {}
+
+        def __init__(self, data):
+            self.data = data
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.data
+
+    def get(url, **kwargs):
+        endpoint = url.split("/api/v2/", 1)[1]
+        requested.append(endpoint)
+        if endpoint.startswith("pokemon?"):
+            return Response({"results": [
+                {"name": name, "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+                for i, name in enumerate(names, start=1)
+            ]})
+        name = endpoint.split("/", 1)[1]
+        return Response({"name": name, "id": names.index(name) + 1})
+
+    cache = ResponseCache(str(tmp_path / "responses.db"))
+    api = PokemonAPI(cache=cache)
+    monkeypatch.setattr(api.session, "get", get)
+    warm_up(api, include_evolutions=False, workers=2)
+    requested.clear()
+
+    assert api.get_pokemon(2) == {"name": "ivysaur", "id": 2}
+    assert api.get_pokemon("venusaur")["id"] == 3
+    assert requested == []
+    cache.close()
+
+
+def test_warm_up_reports_failures_and_progress():
+    api = FakeAPI(failing={"pokemon/ivysaur"})
+    updates = []
+    report = warm_up(api, include_evolutions=False, progress=updates.append, progress_every=1)
+
+    assert report.fetched == 2
+    assert report.failures == [("pokemon/ivysaur", "upstream down")]
+    assert len(updates) == 4  # once per fetch and once at the end
+    assert report.throughput > 0
+
+
+def test_warm_up_respects_limit_and_rate():
+    api = FakeAPI()
+    report = warm_up(api, limit=2, rate=20, workers=4)
+    assert report.total == 3
+    # Three fetches at 20/s are spread over at least two intervals
+    assert report.elapsed >= 0.09
+
+
+def test_main_exit_code(monkeypatch):
+    monkeypatch.setattr("pokemon.warmup.PokemonAPI", lambda **kwargs: FakeAPI(failing={"evolution-chain/1"}))
+    assert main(["--workers", "2", "--no-evolutions"]) == 0
+    assert main(["--workers", "2"]) == 1